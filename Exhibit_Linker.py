@@ -1,8 +1,14 @@
 import os
 import re
+import logging
+import bisect
+import threading
+import queue
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
 import win32com.client
 import tkinter as tk
-from tkinter import filedialog, messagebox, ttk as tk_ttk
+from tkinter import filedialog, messagebox, font as tkfont, ttk as tk_ttk
 import ttkbootstrap as ttk
 from ttkbootstrap.constants import *
 import difflib
@@ -13,6 +19,144 @@ import shutil
 from pypdf import PdfReader, PdfWriter
 from pypdf.generic import DictionaryObject, ArrayObject, TextStringObject
 
+logger = logging.getLogger(__name__)
+
+# file:/// URLs (optionally followed by #page=N) inside exported PDF bytes
+_FILE_URL_RE = re.compile(rb'file:///([^\s\)>#]+)(#page=\d+)?')
+
+@lru_cache(maxsize=4096)
+def _to_file_url(path):
+    """file:/// URL for a local path - memoized since the same exhibits get linked many times"""
+    # Replace backslashes with forward slashes but DON'T encode colons for file://
+    return 'file:///' + os.path.abspath(path).replace('\\', '/')
+
+# Separator between the words of an expected PDF name when Word encoded its spaces (%20, %2520, + or _)
+_SPACE_ENCODING_RE = r'(?:\s|%20|%2520|\+|_)+'
+
+# Buffer for whole-file output copies - at least 256 KiB (Windows' shutil default is already 1 MiB)
+_COPY_BUFSIZE = max(256 * 1024, getattr(shutil, 'COPY_BUFSIZE', 0))
+
+# CopyFileW / CreateDirectoryW for _copy_output_file and _fast_makedirs - the kernel32 handle
+# and prototypes are set up once at import
+if os.name == 'nt':
+    import ctypes
+    from ctypes import wintypes
+    _kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+    _kernel32.CopyFileW.argtypes = (wintypes.LPCWSTR, wintypes.LPCWSTR, wintypes.BOOL)
+    _kernel32.CopyFileW.restype = wintypes.BOOL
+    _kernel32.CreateDirectoryW.argtypes = (wintypes.LPCWSTR, wintypes.LPVOID)
+    _kernel32.CreateDirectoryW.restype = wintypes.BOOL
+else:
+    _kernel32 = None
+
+def _copy_output_file(src, dst):
+    """Copy a finished output file (contents + metadata, like shutil.copy2) without bouncing it through Python"""
+    if _kernel32 is not None:
+        # CopyFileW copies kernel-side and keeps attributes/timestamps
+        if _kernel32.CopyFileW(str(src), str(dst), False):
+            return
+        # CopyFileW failed - fall back to a buffered copy
+        with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+            shutil.copyfileobj(fsrc, fdst, length=_COPY_BUFSIZE)
+    else:
+        # copyfile uses sendfile/fcopyfile zero-copy fast paths where the OS has them
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+def _move_output_file(src, dst):
+    """Move a temp output file into place - a rename when both are on one volume, else copy + delete"""
+    try:
+        if os.stat(src).st_dev == os.stat(os.path.dirname(os.path.abspath(dst))).st_dev:
+            os.replace(src, dst)
+            return
+    except OSError as e:
+        # e.g. Excel still has the temp workbook open - fall back to copying it
+        logger.warning("Rename into place failed (%s), copying instead", e)
+    
+    _copy_output_file(src, dst)
+    try:
+        os.remove(src)
+    except OSError:
+        logger.debug("Could not clean up temp file (not critical)")
+
+def _remove_with_retry(path):
+    """Delete a working copy, retrying with a short backoff while Word/Excel releases its handle.
+    Returns None once the file is gone, else the last error - usually the first attempt succeeds."""
+    last_error = None
+    for delay in (0, 0.02, 0.05, 0.1, 0.25, 0.5):
+        if delay:
+            time.sleep(delay)
+        try:
+            os.remove(path)
+            return None
+        except PermissionError as e:
+            last_error = e  # still locked - try again
+        except Exception as e:
+            return e
+    return last_error
+
+def _fast_makedirs(path):
+    """os.makedirs(path, exist_ok=True) - on Windows a single CreateDirectoryW call in the common cases"""
+    if not path:
+        return
+    if _kernel32 is not None:
+        if _kernel32.CreateDirectoryW(str(path), None):
+            return
+        # ERROR_ALREADY_EXISTS (183) is also returned for an existing *file* - only a directory counts
+        if ctypes.get_last_error() == 183 and os.path.isdir(path):
+            return
+        # Missing parents, a file in the way or a real error - let os.makedirs create the chain / raise properly
+    os.makedirs(path, exist_ok=True)
+
+@lru_cache(maxsize=32)
+def _folder_counts(folder_path, prefix, mtime_ns):
+    """(file_count, bates_count, exhibit_count) for a folder in one scandir pass.
+    mtime_ns is only part of the cache key - a changed folder gets a new key and is rescanned."""
+    file_count = bates_count = exhibit_count = 0
+    # DirEntry.is_file() comes from the directory listing - no extra stat per file like os.path.isfile
+    with os.scandir(folder_path) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            file_count += 1
+            name = entry.name
+            if prefix and name.startswith(prefix) and name.endswith('.pdf'):
+                bates_count += 1
+            if name.startswith('Ex.'):
+                exhibit_count += 1
+    return file_count, bates_count, exhibit_count
+
+# Page-reference shapes tried (in order) by build_page_pattern; {n} is the escaped page number
+_PAGE_PATTERN_TEMPLATES = (
+    r'\bat\s+p\.?\s*{n}\b',      # "at p. 25", "at p 25"
+    r'\bat\s+pp\.?\s*{n}\b',     # "at pp. 25", "at pp 25"
+    r'\bat\s+{n}\b',             # "at 25"
+    r'\bp\.?\s*{n}\b',           # "p. 25", "p 25"
+    r'\bpp\.?\s*{n}\b',          # "pp. 25", "pp 25"
+    r'\bpage\s+{n}\b',           # "page 25"
+    r'\bpages?\s+{n}\b',         # "pages 25"
+    r'\b{n}\b',                  # just "25" (fallback)
+)
+
+# Bare exhibit identifier in an Excel cell: a number (155), a single letter (A) or a short alphanumeric (1A, 2B)
+_BARE_REF_RE = re.compile(r'\d+|[A-Za-z0-9]{1,5}|[^\W\d_]')
+
+# Excel cell text (lowercased) that counts as empty or an error value rather than data
+_EMPTY_SENTINELS = frozenset({'', 'none', 'null', '#n/a', '#value!', '#ref!'})
+
+# Excel cell values that are column headers / labels rather than exhibit references
+_SKIP_REFS = frozenset({'exhibit', 'exhibits', 'ex', 'number', 'ref', 'reference', 'document', 'file'})
+
+# Exhibit filename prefixes, in the order find_matching_exhibit_files prefers them (prefix -> rank)
+_EXHIBIT_FILE_PREFIXES = {prefix: rank for rank, prefix in enumerate(("Ex. ", "Ex.", "Ex ", "Ex_", "Exhibit ", "Exhibit_"))}
+# Prefix + identifier of an exhibit filename; the identifier runs up to the first separator or the end
+_EXHIBIT_FILE_RE = re.compile(r'^(Ex\. ?|Ex[ _]|Exhibit[ _])([^_\-. ]+)')
+
+# FileRenamer.normalize_filename patterns
+_IS_EXHIBIT = re.compile(r'^(?:ex[._\s]|exhibit)', re.IGNORECASE).match
+# Every whitespace character (same set as regex \s; the highest one is U+3000) -> underscore
+_WS_TO_US = str.maketrans({c: '_' for c in map(chr, range(0x3001)) if c.isspace()})
+
 class WordAutoLinkerCOM:
     def __init__(self):
         self.word_app = None
@@ -33,9 +177,13 @@ class WordAutoLinkerCOM:
         self.exemplary_citation = ""
         self.exemplary_page_number = None
         self.page_pattern_regex = None
+        self._page_pattern_compiled = None
         self.exhibit_group_index = None
         self.page_group_index = None
         
+        # Number of #page= links inserted in the current run (PDF export skips the %23 fix when zero)
+        self._page_link_count = 0
+        
         
         # Original exhibit patterns
         self.exhibit_patterns = [
@@ -51,6 +199,15 @@ class WordAutoLinkerCOM:
             r'Ex_(\d+[A-Z]?)',            # Ex_1, Ex_2A (underscore)
             r'Ex_([A-Z])',                # Ex_A, Ex_B (underscore)
         ]
+        self._compiled_exhibit_patterns = [re.compile(p, re.IGNORECASE) for p in self.exhibit_patterns]
+        # Same patterns as one alternation (one capture group each) - a single search for "which exhibit is this?"
+        self._combined_exhibit_re = re.compile('|'.join(f'(?:{p})' for p in self.exhibit_patterns), re.IGNORECASE)
+        self._compiled_bates_patterns = []
+        self._sorted_bates_starts = []
+        
+        # identifier -> (prefix rank, exhibit path) in target_folder, built once per folder/run
+        self._exhibit_index = {}
+        self._exhibit_index_folder = None
         
         # Track hyperlinks we create for PDF processing
         self.created_hyperlinks = []
@@ -67,6 +224,7 @@ class WordAutoLinkerCOM:
         """Set Bates mode on/off with prefix"""
         self.bates_mode = enabled
         self.bates_prefix = prefix.strip()
+        self._compiled_bates_patterns = [re.compile(p, re.IGNORECASE) for p in self.get_bates_patterns()]
         if self.bates_mode:
             print(f"Bates mode enabled with prefix: '{self.bates_prefix}'")
             # Build the PDF mapping when Bates mode is enabled
@@ -88,6 +246,7 @@ class WordAutoLinkerCOM:
             print(f"  Generated pattern: {self.page_pattern_regex}")
         else:
             self.page_pattern_regex = None
+            self._page_pattern_compiled = None
             self.exhibit_group_index = None
             self.page_group_index = None
             print("Page automation disabled")
@@ -101,33 +260,20 @@ class WordAutoLinkerCOM:
             print(f"Building flexible pattern from: '{citation}' with page {page_num}")
             
             # Step 1: Find exhibit identifier using existing patterns
-            exhibit_id = None
-            for pattern in self.exhibit_patterns:
-                match = re.search(pattern, citation, re.IGNORECASE)
-                if match:
-                    exhibit_id = match.group(1)
-                    print(f"  Found exhibit ID: '{exhibit_id}'")
-                    break
+            exhibit_id = self.extract_exhibit_id(citation)
+            if exhibit_id:
+                print(f"  Found exhibit ID: '{exhibit_id}'")
             
             if not exhibit_id:
                 print("  ERROR: Could not find exhibit identifier in exemplary citation")
                 return False
             
             # Step 2: Find page number with common legal citation patterns
-            page_patterns = [
-                rf'\bat\s+p\.?\s*{re.escape(page_num)}\b',      # "at p. 25", "at p 25"
-                rf'\bat\s+pp\.?\s*{re.escape(page_num)}\b',     # "at pp. 25", "at pp 25" 
-                rf'\bat\s+{re.escape(page_num)}\b',             # "at 25"
-                rf'\bp\.?\s*{re.escape(page_num)}\b',           # "p. 25", "p 25"
-                rf'\bpp\.?\s*{re.escape(page_num)}\b',          # "pp. 25", "pp 25"
-                rf'\bpage\s+{re.escape(page_num)}\b',           # "page 25"
-                rf'\bpages?\s+{re.escape(page_num)}\b',         # "pages 25"
-                rf'\b{re.escape(page_num)}\b'                   # just "25" (fallback)
-            ]
+            escaped_page = re.escape(page_num)
             
             page_match_info = None
-            for i, pattern in enumerate(page_patterns):
-                matches = list(re.finditer(pattern, citation, re.IGNORECASE))
+            for i, template in enumerate(_PAGE_PATTERN_TEMPLATES):
+                matches = list(re.compile(template.format(n=escaped_page), re.IGNORECASE).finditer(citation))
                 if matches:
                     # Use the last match (most likely the page reference)
                     page_match_info = {
@@ -195,6 +341,7 @@ class WordAutoLinkerCOM:
                 if (found_exhibit.upper() == exhibit_id.upper() and 
                     found_page == page_num):
                     self.page_pattern_regex = full_pattern
+                    self._page_pattern_compiled = re.compile(full_pattern, re.IGNORECASE)
                     self.exhibit_group_index = 1
                     self.page_group_index = 2
                     print("  ✓ Flexible pattern validation successful!")
@@ -216,35 +363,21 @@ class WordAutoLinkerCOM:
 
     def find_page_number_in_text(self, text):
         """Extract exhibit ID and page number using the pattern - ENHANCED VERSION"""
-        if not self.page_automation_enabled or not self.page_pattern_regex:
-            print(f"    Page automation disabled or no pattern (enabled={self.page_automation_enabled}, pattern={self.page_pattern_regex is not None})")
-            return None, None
+        if not self.page_automation_enabled or not self._page_pattern_compiled:
+            return []
         
         try:
-            print(f"    Testing pattern '{self.page_pattern_regex}' against text: '{text}'")
-            
-            # Find ALL pattern matches, not just the first one
-            matches = list(re.finditer(self.page_pattern_regex, text, re.IGNORECASE))
-            
-            if matches:
-                print(f"    Found {len(matches)} pattern matches:")
-                for i, match in enumerate(matches):
-                    exhibit_id = match.group(self.exhibit_group_index)
-                    page_number = int(match.group(self.page_group_index))
-                    match_text = match.group(0)
-                    print(f"      Match {i+1}: '{match_text}' -> Exhibit '{exhibit_id}' Page {page_number}")
-                
-                # Return all matches for the caller to decide which one to use
-                results = []
-                for match in matches:
-                    exhibit_id = match.group(self.exhibit_group_index)
-                    page_number = int(match.group(self.page_group_index))
-                    results.append((exhibit_id, page_number, match))
-                
-                return results
-            else:
-                print(f"    ✗ Pattern did not match text")
-                return []
+            ex_i, pg_i = self.exhibit_group_index, self.page_group_index
+            
+            # Return ALL pattern matches (not just the first one) for the caller to decide which one to use
+            results = [(m.group(ex_i), int(m.group(pg_i)), m) for m in self._page_pattern_compiled.finditer(text)]
+            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("    Found %d page pattern matches in: '%s'", len(results), text)
+                for exhibit_id, page_number, match in results:
+                    logger.debug("      '%s' -> Exhibit '%s' Page %d", match.group(0), exhibit_id, page_number)
+            
+            return results
                 
         except Exception as e:
             print(f"    ✗ Error in page number extraction: {e}")
@@ -256,23 +389,27 @@ class WordAutoLinkerCOM:
     def build_bates_pdf_map(self):
         """Build mapping of Bates PDFs to their starting page numbers"""
         self.bates_pdf_map = {}
+        self._sorted_bates_starts = []
         
         if not self.target_folder or not self.bates_prefix:
             return
         
         try:
-            files_in_folder = os.listdir(self.target_folder)
             bates_files = []
             
-            # Find all PDF files matching the Bates prefix pattern
-            bates_pattern = rf'^{re.escape(self.bates_prefix)}(\d+)\.pdf$'
+            # Find all PDF files named <prefix><digits>.pdf (case-insensitive) - plain string
+            # checks instead of a regex since this runs for every file in the folder
+            prefix_lower = self.bates_prefix.lower()
+            prefix_len = len(prefix_lower)
             
-            for filename in files_in_folder:
-                match = re.match(bates_pattern, filename, re.IGNORECASE)
-                if match:
-                    bates_number = int(match.group(1))
-                    full_path = os.path.join(self.target_folder, filename)
-                    bates_files.append((bates_number, filename, full_path))
+            with os.scandir(self.target_folder) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.lower().endswith('.pdf') or name[:prefix_len].lower() != prefix_lower:
+                        continue
+                    digits = name[prefix_len:-4]
+                    if digits.isdecimal():
+                        bates_files.append((int(digits), name, entry.path))
             
             # Sort by Bates number
             bates_files.sort(key=lambda x: x[0])
@@ -285,6 +422,9 @@ class WordAutoLinkerCOM:
                     'start_page': bates_number
                 }
             
+            # Ascending start pages for bisect lookups in find_bates_pdf_and_page
+            self._sorted_bates_starts = sorted(self.bates_pdf_map)
+            
             print(f"Built Bates PDF map for {len(bates_files)} files:")
             for bates_num, info in self.bates_pdf_map.items():
                 print(f"  {info['filename']} starts at page {bates_num}")
@@ -297,21 +437,19 @@ class WordAutoLinkerCOM:
         if not self.bates_pdf_map:
             return None, None
         
-        # Sort PDF starting numbers in descending order
-        sorted_starts = sorted(self.bates_pdf_map.keys(), reverse=True)
+        # Find the PDF that contains this Bates number: the largest start page <= bates_number
+        idx = bisect.bisect_right(self._sorted_bates_starts, bates_number) - 1
+        if idx < 0:
+            print(f"No PDF found for Bates number {bates_number}")
+            return None, None
         
-        # Find the PDF that contains this Bates number
-        for start_page in sorted_starts:
-            if bates_number >= start_page:
-                pdf_info = self.bates_pdf_map[start_page]
-                # Calculate the page within this PDF (1-based)
-                page_in_pdf = bates_number - start_page + 1
-                
-                print(f"Bates {bates_number} -> {pdf_info['filename']} page {page_in_pdf}")
-                return pdf_info['path'], page_in_pdf
+        start_page = self._sorted_bates_starts[idx]
+        pdf_info = self.bates_pdf_map[start_page]
+        # Calculate the page within this PDF (1-based)
+        page_in_pdf = bates_number - start_page + 1
         
-        print(f"No PDF found for Bates number {bates_number}")
-        return None, None
+        print(f"Bates {bates_number} -> {pdf_info['filename']} page {page_in_pdf}")
+        return pdf_info['path'], page_in_pdf
     
     def get_bates_patterns(self):
         """Get regex patterns for Bates numbering"""
@@ -624,62 +762,61 @@ class WordAutoLinkerCOM:
         else:
             return self.find_matching_exhibit_files(reference_text)
 
-    def find_matching_exhibit_files(self, reference_text):
-        """Find files in the target folder that match the exhibit reference - ENHANCED VERSION"""
-        matching_files = []
+    def _rebuild_exhibit_index(self):
+        """Scan target_folder once and index exhibit files by identifier, keeping the best-ranked prefix"""
+        # Only the first file per identifier is kept - callers link to matching_files[0]
+        self._exhibit_index = {}
+        self._exhibit_index_folder = self.target_folder
+        
+        if not self.target_folder:
+            return
+        
         try:
-            files_in_folder = os.listdir(self.target_folder)
+            with os.scandir(self.target_folder) as entries:
+                for entry in entries:
+                    # Name check first - is_file() comes from the scandir entry and only runs for candidates
+                    match = _EXHIBIT_FILE_RE.match(entry.name)
+                    if not match or not entry.is_file():
+                        continue
+                    prefix, identifier = match.groups()
+                    rank = _EXHIBIT_FILE_PREFIXES[prefix]
+                    current = self._exhibit_index.get(identifier)
+                    if current is None or rank < current[0]:
+                        self._exhibit_index[identifier] = (rank, entry.path)
+            
+            print(f"Indexed {len(self._exhibit_index)} exhibit identifiers in {self.target_folder}")
         except Exception as e:
             print(f"Error reading folder {self.target_folder}: {e}")
-            return []
+
+    def _lookup_exhibit_files(self, identifier):
+        """[path] of the exhibit for an identifier (first file under the best-ranked prefix), or []"""
+        entry = self._exhibit_index.get(identifier)
+        return [entry[1]] if entry else []
+
+    def extract_exhibit_id(self, text):
+        """Exhibit identifier of the first exhibit reference in text (None if there is none)"""
+        match = self._combined_exhibit_re.search(text)
+        return match.group(match.lastindex) if match else None
+
+    def find_matching_exhibit_files(self, reference_text):
+        """Find the file in the target folder that matches the exhibit reference - ENHANCED VERSION
         
-        for pattern in self.exhibit_patterns:
-            match = re.search(pattern, reference_text, re.IGNORECASE)
-            if match:
-                identifier = match.group(1)
-                
-                print(f"REFERENCE: '{reference_text}' -> EXTRACTED: '{identifier}'")
-                
-                # ENHANCED: Try multiple filename patterns for each identifier
-                possible_prefixes = [
-                    f"Ex. {identifier}",     # Ex. 1, Ex. A
-                    f"Ex.{identifier}",      # Ex.1, Ex.A
-                    f"Ex {identifier}",      # Ex 1, Ex A
-                    f"Ex_{identifier}",      # Ex_1, Ex_A
-                    f"Exhibit {identifier}", # Exhibit 1, Exhibit A
-                    f"Exhibit_{identifier}", # Exhibit_1, Exhibit_A
-                ]
-                
-                for target_prefix in possible_prefixes:
-                    print(f"  Trying prefix: '{target_prefix}'")
-                    
-                    for filename in files_in_folder:
-                        # Check if filename starts with our target prefix
-                        if filename.startswith(target_prefix):
-                            prefix_len = len(target_prefix)
-                            
-                            if prefix_len >= len(filename):
-                                # Exact match - filename is exactly our target
-                                full_path = os.path.join(self.target_folder, filename)
-                                matching_files.append(full_path)
-                                print(f"    ✓ EXACT MATCH: '{reference_text}' -> '{filename}'")
-                            else:
-                                # Check what comes after our prefix
-                                next_char = filename[prefix_len]
-                                # Allow common separators and extensions
-                                if next_char in ['_', '-', '.', ' ']:
-                                    full_path = os.path.join(self.target_folder, filename)
-                                    matching_files.append(full_path)
-                                    print(f"    ✓ PARTIAL MATCH: '{reference_text}' -> '{filename}'")
-                    
-                    # If we found matches with this prefix pattern, stop trying other patterns
-                    if matching_files:
-                        print(f"  Found {len(matching_files)} matches with prefix '{target_prefix}'")
-                        break
-                
-                # If we found matches with this regex pattern, stop trying other patterns
-                if matching_files:
-                    break
+        Returns a one-element list with the first matching file (or []); when several files
+        share the identifier only the first one is returned.
+        """
+        # Folder changed since the last scan (or never scanned) - re-index it
+        if self._exhibit_index_folder != self.target_folder:
+            self._rebuild_exhibit_index()
+        
+        matching_files = []
+        identifier = self.extract_exhibit_id(reference_text)
+        if identifier:
+            print(f"REFERENCE: '{reference_text}' -> EXTRACTED: '{identifier}'")
+            
+            # ENHANCED: "Ex. 1", "Ex.1", "Ex 1", "Ex_1", "Exhibit 1", "Exhibit_1" filenames via the folder index
+            matching_files = self._lookup_exhibit_files(identifier)
+            for full_path in matching_files:
+                print(f"    ✓ MATCH: '{reference_text}' -> '{os.path.basename(full_path)}'")
         
         if not matching_files:
             print(f"✗ NO MATCH: '{reference_text}'")
@@ -690,9 +827,8 @@ class WordAutoLinkerCOM:
         """Find Bates PDF and page number for the reference"""
         matching_files = []
         
-        bates_patterns = self.get_bates_patterns()
-        for pattern in bates_patterns:
-            match = re.search(pattern, reference_text, re.IGNORECASE)
+        for pattern in self._compiled_bates_patterns:
+            match = pattern.search(reference_text)
             if match:
                 bates_number = int(match.group(1))
                 print(f"BATES REFERENCE: '{reference_text}' -> EXTRACTED: {bates_number}")
@@ -714,8 +850,10 @@ class WordAutoLinkerCOM:
         
         return matching_files
 
-    def set_word_hyperlink_base_for_relative_links(self):
-        """Set Word document properties to force relative hyperlinks"""
+    def set_word_hyperlink_base_for_relative_links(self, doc=None):
+        """Set Word document properties to force relative hyperlinks (on doc, default self.doc)"""
+        if doc is None:
+            doc = self.doc
         try:
             print("Setting Word document to use relative hyperlinks...")
             
@@ -728,7 +866,7 @@ class WordAutoLinkerCOM:
             print(f"Setting Hyperlink Base to: {base_path}")
             
             # Access built-in document properties and set Hyperlink Base
-            builtin_props = self.doc.BuiltInDocumentProperties
+            builtin_props = doc.BuiltInDocumentProperties
             hyperlink_base_prop = builtin_props("Hyperlink base")
             hyperlink_base_prop.Value = base_path
             
@@ -794,27 +932,27 @@ class WordAutoLinkerCOM:
         try:
             range_text = range_obj.Text
         except Exception as e:
-            print(f"Error reading range text for {range_name}: {e}")
+            logger.error("Error reading range text for %s: %s", range_name, e)
             return 0
         
         # Check for relevant patterns based on mode
         if self.bates_mode:
             if not self.bates_prefix or self.bates_prefix not in range_text:
                 return 0
-            patterns = self.get_bates_patterns()
+            patterns = self._compiled_bates_patterns
         else:
             if not range_text or not ('Ex.' in range_text or 'Exhibit' in range_text):
                 return 0
-            patterns = self.exhibit_patterns
+            patterns = self._compiled_exhibit_patterns
         
-        print(f"\nProcessing {range_name}: '{range_text[:100]}...'")
+        logger.debug("Processing %s: '%s...'", range_name, range_text[:100])
         
         # Find all references in this range
         references = []
         matched_positions = set()
         
         for pattern in patterns:
-            for match in re.finditer(pattern, range_text, re.IGNORECASE):
+            for match in pattern.finditer(range_text):
                 start_pos = match.start()
                 end_pos = match.end()
                 reference = match.group(0)
@@ -832,7 +970,7 @@ class WordAutoLinkerCOM:
                         'file_info': matching_files[0]
                     })
                     matched_positions.add((start_pos, end_pos))
-                    print(f"  Found reference: '{reference}' at positions {start_pos}-{end_pos}")
+                    logger.debug("  Found reference: '%s' at positions %s-%s", reference, start_pos, end_pos)
         
         if not references:
             return 0
@@ -852,11 +990,11 @@ class WordAutoLinkerCOM:
                 expected_text = ref['reference']
                 actual_text_at_pos = current_range_text[ref['start_pos']:ref['end_pos']]
                 
-                print(f"  Expected: '{expected_text}' vs Actual: '{actual_text_at_pos}'")
+                logger.debug("  Expected: '%s' vs Actual: '%s'", expected_text, actual_text_at_pos)
                 
                 # If the text doesn't match exactly, try to find it nearby
                 if actual_text_at_pos != expected_text:
-                    print(f"  Position mismatch detected, searching for correct position...")
+                    logger.debug("  Position mismatch detected, searching for correct position...")
                     
                     # Search for the exact text in a small window around the expected position
                     search_window_start = max(0, ref['start_pos'] - 5)
@@ -869,15 +1007,15 @@ class WordAutoLinkerCOM:
                         # Adjust positions based on the local match
                         corrected_start = search_window_start + local_match.start()
                         corrected_end = search_window_start + local_match.end()
-                        print(f"  Corrected position: {corrected_start}-{corrected_end}")
+                        logger.debug("  Corrected position: %s-%s", corrected_start, corrected_end)
                         ref['start_pos'] = corrected_start
                         ref['end_pos'] = corrected_end
                     else:
-                        print(f"  Could not find exact match, skipping this reference")
+                        logger.debug("  Could not find exact match, skipping this reference")
                         continue
                 
                 try:
-                    print("  Trying precise offset method...")
+                    logger.debug("  Trying precise offset method...")
                     ref_range = range_obj.Duplicate
                     ref_range.Start = range_obj.Start + ref['start_pos']
                     ref_range.End = range_obj.Start + ref['end_pos']
@@ -887,12 +1025,12 @@ class WordAutoLinkerCOM:
                     if ref_range.Text.strip().lower() != expected_text.strip().lower():
                         raise ValueError("Text mismatch, likely due to a complex object.")
                     
-                    print("  ✓ Precise offset method succeeded.")
+                    logger.debug("  ✓ Precise offset method succeeded.")
 
                 # If the precise method fails (usually due to an image/chart messing up
                 # character counts), fall back to the slower but more robust Find.Execute method.
                 except Exception as e:
-                    print(f"  ⚠️ Offset method failed: {e}. Falling back to robust Find.Execute method...")
+                    logger.warning("  ⚠️ Offset method failed: %s. Falling back to robust Find.Execute method...", e)
                     ref_range = range_obj.Duplicate
                     
                     # Use Word's built-in Find to locate the text, which is better at
@@ -907,17 +1045,17 @@ class WordAutoLinkerCOM:
                     )
 
                     if not find_success:
-                        print(f"  ✗ Fallback Find.Execute also failed for '{expected_text}'. Skipping.")
+                        logger.warning("  ✗ Fallback Find.Execute also failed for '%s'. Skipping.", expected_text)
                         continue # Move to the next reference
                 # --- HYBRID METHOD END ---
                 
                 # Double-check the range text before creating hyperlink
                 final_range_text = ref_range.Text
-                print(f"  Final range text: '{final_range_text}' (expected: '{expected_text}')")
+                logger.debug("  Final range text: '%s' (expected: '%s')", final_range_text, expected_text)
                 
                 # Only proceed if we have the right text
                 if final_range_text.strip().lower() != expected_text.strip().lower():
-                    print(f"  Final text verification failed, skipping hyperlink creation")
+                    logger.warning("  Final text verification failed, skipping hyperlink creation")
                     continue
                 
                 # Handle different file info types
@@ -941,16 +1079,11 @@ class WordAutoLinkerCOM:
                         context_end = min(len(range_text), ref['end_pos'] + 150)  # Look 150 chars after
                         context_text = range_text[context_start:context_end]
 
-                        print(f"  Checking page automation for exhibit: '{expected_text}'")
-                        print(f"  Using context: '{context_text}'")
+                        logger.debug("  Checking page automation for exhibit: '%s'", expected_text)
+                        logger.debug("  Using context: '%s'", context_text)
                         
                         # Get the current exhibit ID for comparison
-                        current_exhibit_id = None
-                        for pattern in self.exhibit_patterns:
-                            match = re.search(pattern, expected_text, re.IGNORECASE)
-                            if match:
-                                current_exhibit_id = match.group(1)
-                                break
+                        current_exhibit_id = self.extract_exhibit_id(expected_text)
                         
                         # Get all possible matches
                         all_matches = self.find_page_number_in_text(context_text)
@@ -960,40 +1093,43 @@ class WordAutoLinkerCOM:
                             for match_exhibit_id, match_page_number, match_obj in all_matches:
                                 if match_exhibit_id.upper() == current_exhibit_id.upper():
                                     exhibit_id, page_number = match_exhibit_id, match_page_number
-                                    print(f"  ✓ Found matching exhibit ID: '{exhibit_id}' -> Page {page_number}")
+                                    logger.debug("  ✓ Found matching exhibit ID: '%s' -> Page %s", exhibit_id, page_number)
                                     break
                             
                             if not exhibit_id:
-                                print(f"  ✗ No matching exhibit ID found for '{current_exhibit_id}' in context")
+                                logger.debug("  ✗ No matching exhibit ID found for '%s' in context", current_exhibit_id)
                     
-                    print(f"  Page automation result: exhibit_id='{exhibit_id}', page_number={page_number}")
+                    logger.debug("  Page automation result: exhibit_id='%s', page_number=%s", exhibit_id, page_number)
                     
                     # Set up paths and targets
                     file_path = file_info  # Set this first, used in all cases
+                    file_basename = os.path.basename(file_path)
                     relative_path = self.get_relative_path_from_original_doc(file_path)
                     
                     if exhibit_id and page_number:
                         # Page automation mode - link to specific page
                         link_target = f"{relative_path}#page={page_number}"
-                        screen_tip = f"Link to {os.path.basename(file_path)} page {page_number}"
-                        print(f"  Using page automation: '{expected_text}' -> {link_target}")
+                        screen_tip = f"Link to {file_basename} page {page_number}"
+                        logger.debug("  Using page automation: '%s' -> %s", expected_text, link_target)
                     else:
                         # Regular exhibit mode - link to file
                         link_target = relative_path
-                        screen_tip = f"Link to {os.path.basename(file_path)}"
+                        screen_tip = f"Link to {file_basename}"
 
 
-                print(f"  Creating hyperlink: '{link_target}' for text '{final_range_text}'")
+                logger.debug("  Creating hyperlink: '%s' for text '%s'", link_target, final_range_text)
 
                 try:
                     # ENHANCED SOLUTION: Better Word hyperlink handling for page fragments
                     if '#page=' in link_target:
+                        self._page_link_count += 1
+                        
                         # Split the URL into address and fragment
                         parts = link_target.split('#page=')
                         base_address = parts[0]  # File path without fragment
                         page_num = parts[1]      # Page number
                         
-                        print(f"  Splitting URL: Address='{base_address}', Page='{page_num}'")
+                        logger.debug("  Splitting URL: Address='%s', Page='%s'", base_address, page_num)
                         
                         try:
                             # Method 1: Use SubAddress parameter (Word's preferred method)
@@ -1004,10 +1140,10 @@ class WordAutoLinkerCOM:
                                 TextToDisplay=expected_text,
                                 ScreenTip=screen_tip
                             )
-                            print(f"  ✓ Created hyperlink with SubAddress: page={page_num}")
+                            logger.debug("  ✓ Created hyperlink with SubAddress: page=%s", page_num)
                             
                         except Exception as subaddress_error:
-                            print(f"  SubAddress failed: {subaddress_error}, trying alternative...")
+                            logger.warning("  SubAddress failed: %s, trying alternative...", subaddress_error)
                             
                             try:
                                 # Method 2: Create with original target and fix encoding immediately
@@ -1031,12 +1167,12 @@ class WordAutoLinkerCOM:
                                         TextToDisplay=expected_text,
                                         ScreenTip=f"Link to {os.path.basename(base_address)} page {page_num}"
                                     )
-                                    print(f"  ✓ Created hyperlink without page fragment to preserve color")
+                                    logger.debug("  ✓ Created hyperlink without page fragment to preserve color")
                                 else:
-                                    print(f"  ✓ Created hyperlink with correct fragment")
+                                    logger.debug("  ✓ Created hyperlink with correct fragment")
                                 
                             except Exception as alternative_error:
-                                print(f"  Alternative method failed: {alternative_error}")
+                                logger.warning("  Alternative method failed: %s", alternative_error)
                                 # Fallback - create without fragment
                                 hyperlink = range_obj.Hyperlinks.Add(
                                     Anchor=ref_range,
@@ -1044,7 +1180,7 @@ class WordAutoLinkerCOM:
                                     TextToDisplay=expected_text,
                                     ScreenTip=screen_tip
                                 )
-                                print(f"  ✓ Created hyperlink without page fragment (fallback)")
+                                logger.debug("  ✓ Created hyperlink without page fragment (fallback)")
                     
                     else:
                         # No page fragment - simple hyperlink
@@ -1054,7 +1190,7 @@ class WordAutoLinkerCOM:
                             TextToDisplay=expected_text,
                             ScreenTip=screen_tip
                         )
-                        print(f"  ✓ Created simple hyperlink (no page fragment)")
+                        logger.debug("  ✓ Created simple hyperlink (no page fragment)")
 
                     # Ensure hyperlink has proper unvisited appearance
                     try:
@@ -1062,28 +1198,33 @@ class WordAutoLinkerCOM:
                         hyperlink_range = hyperlink.Range
                         hyperlink_range.Font.Color = 16711680  # Bright blue (BGR format)
                         hyperlink_range.Font.Underline = True
-                        print(f"    ✓ Applied fresh hyperlink formatting")
+                        logger.debug("    ✓ Applied fresh hyperlink formatting")
                     except Exception as format_error:
-                        print(f"    Could not apply fresh formatting: {format_error}")
+                        logger.warning("    Could not apply fresh formatting: %s", format_error)
 
                 except Exception as e:
-                    print(f"  Error creating hyperlink: {e}")
+                    logger.error("  Error creating hyperlink: %s", e)
                     continue
                 
-                print(f"  ✓ Added hyperlink for '{expected_text}'")
+                logger.debug("  ✓ Added hyperlink for '%s'", expected_text)
                 links_added += 1
                 
             except Exception as e:
-                print(f"  ✗ Error adding hyperlink for '{ref['reference']}': {e}")
+                logger.error("  ✗ Error adding hyperlink for '%s': %s", ref['reference'], e)
         
         return links_added
 
-    def process_document(self, progress_callback=None):
-        """Process the document for exhibit hyperlinks using COM with progress updates"""
-        if not self.doc or not self.target_folder:
+    def process_document(self, progress_callback=None, doc=None):
+        """Process the document for exhibit hyperlinks using COM with progress updates
+
+        doc defaults to self.doc - a worker thread passes in its own marshalled proxy of it.
+        """
+        if doc is None:
+            doc = self.doc
+        if not doc or not self.target_folder:
             return 0
         
-        self.set_word_hyperlink_base_for_relative_links()
+        self.set_word_hyperlink_base_for_relative_links(doc)
 
         mode_text = "BATES" if self.bates_mode else "EXHIBIT"
         print(f"=== PROCESSING DOCUMENT IN {mode_text} MODE ===")
@@ -1094,31 +1235,33 @@ class WordAutoLinkerCOM:
             print(f"Bates PDF map: {len(self.bates_pdf_map)} PDFs")
         
         try:
-            para_count = self.doc.Paragraphs.Count
+            para_count = doc.Paragraphs.Count
             print(f"Document has {para_count} paragraphs")
         except Exception as e:
             print(f"Error accessing document: {e}")
             return 0
         
-        # List available files
-        try:
-            files_in_folder = os.listdir(self.target_folder)
-            if self.bates_mode:
-                relevant_files = [f for f in files_in_folder if f.startswith(self.bates_prefix) and f.endswith('.pdf')]
-                print(f"Available Bates PDF files: {relevant_files}")
-            else:
-                relevant_files = [f for f in files_in_folder if f.startswith('Ex.')]
-                print(f"Available exhibit files: {relevant_files}")
-        except Exception as e:
-            print(f"Error reading folder: {e}")
+        # List available files - from the Bates map / exhibit index rather than another folder listing
+        if not os.path.isdir(self.target_folder):
+            print(f"Error reading folder: {self.target_folder} is not a folder")
             return 0
         
+        if self.bates_mode:
+            relevant_files = [info['filename'] for info in self.bates_pdf_map.values()]
+            print(f"Available Bates PDF files: {relevant_files}")
+        else:
+            # Scan the exhibit folder once for this run (files may have been renamed since the last one)
+            self._rebuild_exhibit_index()
+            relevant_files = [os.path.basename(path) for _, path in self._exhibit_index.values()]
+            print(f"Available exhibit files: {relevant_files}")
+        
         total_links_added = 0
+        self._page_link_count = 0
         
         # Calculate total work for progress tracking
         try:
-            footnote_count = self.doc.Footnotes.Count
-            endnote_count = self.doc.Endnotes.Count
+            footnote_count = doc.Footnotes.Count
+            endnote_count = doc.Endnotes.Count
         except:
             footnote_count = 0
             endnote_count = 0
@@ -1138,7 +1281,7 @@ class WordAutoLinkerCOM:
         
         for i in range(1, para_count + 1):
             try:
-                paragraph = self.doc.Paragraphs(i)
+                paragraph = doc.Paragraphs(i)
                 paragraph_range = paragraph.Range
                 
                 links_in_para = self.process_range_for_hyperlinks(
@@ -1165,7 +1308,7 @@ class WordAutoLinkerCOM:
         update_progress(processed_items, total_items, f"Processing {footnote_count} footnotes...")
         
         try:
-            footnotes = self.doc.Footnotes
+            footnotes = doc.Footnotes
             footnote_count = footnotes.Count
             print(f"Found {footnote_count} footnotes")
             
@@ -1200,7 +1343,7 @@ class WordAutoLinkerCOM:
         update_progress(processed_items, total_items, f"Processing {endnote_count} endnotes...")
         
         try:
-            endnotes = self.doc.Endnotes
+            endnotes = doc.Endnotes
             endnote_count = endnotes.Count
             print(f"Found {endnote_count} endnotes")
             
@@ -1241,7 +1384,7 @@ class WordAutoLinkerCOM:
             try:
                 update_progress(100, 100, "Saving document with hyperlinks...")
                 print("Saving working copy with hyperlinks...")
-                self.doc.Save()
+                doc.Save()
                 print("Working copy saved successfully with hyperlinks")
             except Exception as e:
                 print(f"Could not save working copy: {e}")
@@ -1265,10 +1408,8 @@ class WordAutoLinkerCOM:
             print(f"Normalized path: {normalized_path}")
             print(f"Target directory: {target_dir}")
             
-            # Ensure target directory exists
-            if not os.path.exists(target_dir):
-                print(f"Creating directory: {target_dir}")
-                os.makedirs(target_dir, exist_ok=True)
+            # Ensure target directory exists (exist_ok makes a pre-check unnecessary)
+            _fast_makedirs(target_dir)
             
             # Method 1: Try direct export with minimal parameters (most compatible)
             try:
@@ -1289,45 +1430,38 @@ class WordAutoLinkerCOM:
                 
                 # Method 2: Export to temp directory first, then copy
                 try:
-                    import tempfile
-                    import shutil
-                    
-                    # Create temp file in system temp directory
-                    temp_dir = tempfile.gettempdir()
-                    temp_filename = f"word_export_{int(time.time())}.pdf"
-                    temp_path = os.path.join(temp_dir, temp_filename)
-                    
-                    print(f"Temporary export path: {temp_path}")
-                    
-                    # Export to temp location with minimal parameters
-                    self.doc.ExportAsFixedFormat(
-                        OutputFileName=temp_path,
-                        ExportFormat=17  # wdExportFormatPDF
-                    )
+                    # Create a unique temp file in system temp directory (mkstemp is atomic, no name collisions)
+                    temp_fd, temp_path = tempfile.mkstemp(suffix='.pdf', prefix='word_export_')
+                    os.close(temp_fd)  # Word needs to open the path itself
                     
-                    print("✅ Temporary PDF export succeeded")
+                    try:
+                        print(f"Temporary export path: {temp_path}")
                     
-                    # Verify temp file exists
-                    if not os.path.exists(temp_path):
-                        raise Exception("Temporary PDF file was not created")
+                        # Export to temp location with minimal parameters
+                        self.doc.ExportAsFixedFormat(
+                            OutputFileName=temp_path,
+                            ExportFormat=17  # wdExportFormatPDF
+                        )
                     
-                    # Copy to final location
-                    print(f"Copying from temp to final location...")
-                    shutil.copy2(temp_path, normalized_path)
+                        print("✅ Temporary PDF export succeeded")
                     
-                    # Verify final file exists
-                    if not os.path.exists(normalized_path):
-                        raise Exception("Final PDF file was not created")
+                        # Verify Word actually wrote the temp file (mkstemp created it empty)
+                        if not os.path.getsize(temp_path):
+                            raise Exception("Temporary PDF file was not created")
                     
-                    print("✅ PDF copied to final location")
-                    actual_pdf_path = normalized_path
+                        # Move to final location (a rename when temp is on the same volume)
+                        print(f"Moving from temp to final location...")
+                        _move_output_file(temp_path, normalized_path)
                     
-                    # Clean up temp file
-                    try:
-                        os.remove(temp_path)
-                        print("✅ Temporary file cleaned up")
-                    except:
-                        print("Warning: Could not clean up temporary file")
+                        print("✅ PDF moved to final location")
+                        actual_pdf_path = normalized_path
+                    finally:
+                        # A failed export or move must not leave the mkstemp file behind in %TEMP%
+                        if os.path.exists(temp_path):
+                            try:
+                                os.unlink(temp_path)
+                            except OSError:
+                                pass
                     
                 except Exception as temp_error:
                     print(f"Temporary directory method failed: {temp_error}")
@@ -1367,46 +1501,49 @@ class WordAutoLinkerCOM:
                 
                 # Look for files in the directory that might be our PDF with encoded spaces
                 if not os.path.exists(normalized_path):
-                    print("Expected PDF not found, checking for URL-encoded version...")
+                    print("Expected PDF not found, checking for space-encoded versions...")
                     
-                    import urllib.parse
-                    encoded_filename = urllib.parse.quote(expected_filename, safe='.')
-                    encoded_path = os.path.join(directory, encoded_filename)
+                    # Spaces may come out as %20, %2520, + or _ - only those encodings match, so a
+                    # different file that merely shares the same words is never picked up
+                    encoded_re = re.compile(
+                        _SPACE_ENCODING_RE.join(map(re.escape, re.split(r'\s+', expected_filename))),
+                        re.IGNORECASE
+                    )
                     
-                    print(f"Checking for encoded version: {encoded_path}")
+                    # One directory scan - only PDFs created within the last 30 seconds are probably ours
+                    cutoff = time.time() - 30
+                    encoded_pdfs = []
+                    recent_pdfs = []
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if not entry.name.lower().endswith('.pdf') or not entry.is_file():
+                                continue
+                            created = entry.stat().st_ctime
+                            if created < cutoff:
+                                continue
+                            recent_pdfs.append((created, entry.path))
+                            if encoded_re.fullmatch(entry.name):
+                                encoded_pdfs.append((created, entry.path))
                     
-                    if os.path.exists(encoded_path):
-                        print(f"Found URL-encoded PDF, renaming to correct filename...")
-                        shutil.move(encoded_path, normalized_path)
-                        print(f"✅ Renamed {encoded_filename} to {expected_filename}")
-                        actual_pdf_path = normalized_path
+                    if encoded_pdfs:
+                        print(f"Found space-encoded PDF: {max(encoded_pdfs)[1]}")
+                        candidates = encoded_pdfs
                     else:
-                        # Look for any PDF files created around this time
+                        # No encoded match - fall back to any PDF created around this time
                         print("Searching for any recently created PDF files...")
-                        import glob
-                        pdf_pattern = os.path.join(directory, "*.pdf")
-                        pdf_files = glob.glob(pdf_pattern)
-                        
-                        # Find the most recently created PDF
-                        if pdf_files:
-                            newest_pdf = max(pdf_files, key=os.path.getctime)
-                            creation_time = os.path.getctime(newest_pdf)
-                            current_time = time.time()
-                            
-                            # If it was created within the last 30 seconds, it's probably ours
-                            if current_time - creation_time < 30:
-                                print(f"Found recently created PDF: {newest_pdf}")
-                                if newest_pdf != normalized_path:
-                                    print(f"Renaming to correct filename...")
-                                    shutil.move(newest_pdf, normalized_path)
-                                    print(f"✅ Renamed to {expected_filename}")
-                                actual_pdf_path = normalized_path
-                            else:
-                                print("No recent PDF files found")
-                                return False
-                        else:
-                            print("No PDF files found in directory")
-                            return False
+                        candidates = recent_pdfs
+                    
+                    if candidates:
+                        newest_pdf = max(candidates)[1]
+                        print(f"Found recently created PDF: {newest_pdf}")
+                        if newest_pdf != normalized_path:
+                            print(f"Renaming to correct filename...")
+                            shutil.move(newest_pdf, normalized_path)
+                            print(f"✅ Renamed to {expected_filename}")
+                        actual_pdf_path = normalized_path
+                    else:
+                        print("No recent PDF files found")
+                        return False
                 else:
                     print("✅ PDF found at expected location")
                     actual_pdf_path = normalized_path
@@ -1416,17 +1553,23 @@ class WordAutoLinkerCOM:
                 # Continue anyway, maybe the file is there
                 actual_pdf_path = normalized_path
             
+            # Only #page= links can come out of Word as %23page= - nothing to analyze or fix without them
+            if self._page_link_count == 0:
+                print("No page-specific links in document - skipping PDF link analysis")
+                return True
+            
             # Now try to fix the hyperlink encoding if pypdf is available
             try:
                 print("\n=== ANALYZING WORD'S OUTPUT ===")
                 
                 from pypdf import PdfReader
                 
-                if not os.path.exists(actual_pdf_path):
+                try:
+                    reader = PdfReader(actual_pdf_path)
+                except FileNotFoundError:
                     print(f"PDF file not found at: {actual_pdf_path}")
                     return False
-                
-                reader = PdfReader(actual_pdf_path)
+
                 print(f"PDF has {len(reader.pages)} pages")
                 
                 total_links = 0
@@ -1439,16 +1582,16 @@ class WordAutoLinkerCOM:
                         for annot in annots:
                             if "/A" in annot and "/URI" in annot["/A"]:
                                 uri = str(annot["/A"]["/URI"])
-                                print(f"  📎 Page {page_num + 1} link: {uri}")
+                                logger.debug("  📎 Page %d link: %s", page_num + 1, uri)
                                 total_links += 1
                                 
                                 if "%23page=" in uri:
-                                    print("    ⚠️  Contains %23page= (needs fix)")
+                                    logger.debug("    ⚠️  Contains %23page= (needs fix)")
                                     needs_fix = True
                                 elif "#page=" in uri:
-                                    print("    ✅ Contains #page= (already good)")
+                                    logger.debug("    ✅ Contains #page= (already good)")
                 
-                print(f"\n📊 Found {total_links} links")
+                logger.info("📊 Found %d links", total_links)
                 
                 if needs_fix:
                     print("\n🔧 APPLYING MANUAL FIX...")
@@ -1485,14 +1628,11 @@ class WordAutoLinkerCOM:
             with open(pdf_path, 'rb') as f:
                 pdf_bytes = f.read()
             
-            # Convert to string for replacement
-            pdf_text = pdf_bytes.decode('latin-1', errors='replace')
-            
             # Step 1: Fix %23page= encoding
-            before_encoding_count = pdf_text.count('%23page=')
+            before_encoding_count = pdf_bytes.count(b'%23page=')
             print(f"Found {before_encoding_count} instances of '%23page=' to fix")
             
-            fixed_text = pdf_text.replace('%23page=', '#page=')
+            fixed_bytes = pdf_bytes.replace(b'%23page=', b'#page=')
             
             # Step 2: Convert absolute file:// paths back to relative paths
             print("Converting absolute paths to relative paths...")
@@ -1501,89 +1641,63 @@ class WordAutoLinkerCOM:
             pdf_dir = os.path.dirname(os.path.abspath(pdf_path))
             print(f"PDF directory: {pdf_dir}")
             
-            # Pattern to match file:// URLs
-            import re
-            
-            # Find all file:// URLs in the PDF
-            # Look for file:/// followed by path, optionally followed by #page=number
-            file_url_pattern = r'file:///([^\s\)>#]+)(#page=\d+)?'
-            
-            def convert_to_relative(match):
-                full_path = match.group(1)  # The path part after file:///
-                page_fragment = match.group(2) if match.group(2) else ""  # The #page=X part
-                
-                print(f"  Raw path captured: '{full_path}'")
-                print(f"  Page fragment: '{page_fragment}'")
-                
-                if not full_path:
-                    print(f"  ERROR: Empty path captured")
-                    return match.group(0)  # Return original if empty
-                
-                # Convert back to Windows path format
-                windows_path = full_path.replace('/', '\\')
-                print(f"  Windows path: '{windows_path}'")
-                
+            # Resolve each unique target once - many links point to the same file
+            relative_paths = {}
+            pdf_dir_prefix = pdf_dir.rstrip('\\/').lower() + os.sep
+            for raw_path, _page in _FILE_URL_RE.findall(fixed_bytes):
+                if not raw_path or raw_path in relative_paths:
+                    continue
+                full_path = raw_path.decode('latin-1')
                 try:
-                    # Calculate relative path from PDF location
-                    relative_path = os.path.relpath(windows_path, pdf_dir)
+                    # Convert back to Windows path format and calculate relative path from PDF location
+                    windows_path = full_path.replace('/', '\\')
+                    if windows_path.lower().startswith(pdf_dir_prefix):
+                        # Fast path: target lives under the PDF's folder, just strip the prefix
+                        relative_path = windows_path[len(pdf_dir_prefix):]
+                    else:
+                        relative_path = os.path.relpath(windows_path, pdf_dir)
                     # Convert back to forward slashes for consistency
-                    relative_path = relative_path.replace('\\', '/')
-                    
-                    print(f"  Converting: file:///{full_path}{page_fragment}")
-                    print(f"         To: {relative_path}{page_fragment}")
-                    
-                    return relative_path + page_fragment
-                    
+                    relative_paths[raw_path] = relative_path.replace('\\', '/').encode('latin-1', errors='replace')
+                    logger.debug("  Converting: file:///%s -> %s", full_path, relative_path)
                 except Exception as e:
-                    print(f"  Could not convert {full_path}: {e}")
-                    # Return original if conversion fails
-                    return f"file:///{full_path}{page_fragment}"
+                    logger.debug("  Could not convert %s: %s", full_path, e)
             
-            # Apply the conversion
-            fixed_text = re.sub(file_url_pattern, convert_to_relative, fixed_text)
+            # Apply the conversion (unconvertible paths keep their original file:/// URL)
+            fixed_bytes = _FILE_URL_RE.sub(
+                lambda m: relative_paths[m.group(1)] + (m.group(2) or b"") if m.group(1) in relative_paths else m.group(0),
+                fixed_bytes
+            )
             
             # Count changes made
-            after_encoding_count = fixed_text.count('%23page=')
+            after_encoding_count = fixed_bytes.count(b'%23page=')
             encoding_fixes = before_encoding_count - after_encoding_count
             
             # Check for remaining file:// URLs
-            remaining_file_urls = len(re.findall(r'file:///', fixed_text))
+            remaining_file_urls = fixed_bytes.count(b'file:///')
             
             print(f"Encoding fixes made: {encoding_fixes}")
             print(f"Remaining absolute file:// URLs: {remaining_file_urls}")
             
             if encoding_fixes > 0 or remaining_file_urls == 0:
-                # Create temporary backup
-                backup_path = pdf_path + '.backup'
-                backup_created = False
+                # Write fixed version to a temp file and swap it in atomically -
+                # a failed write can never leave a half-written PDF behind
+                temp_pdf_path = pdf_path + '.tmp'
                 try:
-                    with open(backup_path, 'wb') as f:
-                        f.write(pdf_bytes)
-                    backup_created = True
-                    print(f"Temporary backup created")
-                except:
-                    print("Could not create backup (continuing anyway)")
-                
-                # Write fixed version
-                fixed_bytes = fixed_text.encode('latin-1', errors='replace')
-                with open(pdf_path, 'wb') as f:
-                    f.write(fixed_bytes)
-                
-                # Verify fix worked
-                with open(pdf_path, 'rb') as f:
-                    verify_bytes = f.read()
-                verify_text = verify_bytes.decode('latin-1', errors='replace')
-                
-                final_encoding_count = verify_text.count('%23page=')
-                final_file_urls = len(re.findall(r'file:///', verify_text))
-                
-                # Clean up backup file
-                if backup_created:
+                    with open(temp_pdf_path, 'wb') as f:
+                        f.write(fixed_bytes)
+                        f.flush()
+                        os.fsync(f.fileno())
+                    os.replace(temp_pdf_path, pdf_path)
+                except Exception:
                     try:
-                        os.remove(backup_path)
-                        print("✅ Temporary backup cleaned up")
-                    except:
-                        print("Could not remove backup file")
+                        os.remove(temp_pdf_path)
+                    except OSError:
+                        pass
+                    raise
+                
+                # Verify fix worked - fixed_bytes is exactly what was written, no need to re-read the file
+                final_encoding_count = after_encoding_count
+                final_file_urls = remaining_file_urls
                 
                 print(f"\n✅ FINAL RESULTS:")
                 print(f"  %23page= instances: {final_encoding_count} (should be 0)")
@@ -1732,23 +1846,19 @@ class WordAutoLinkerCOM:
             if progress_dialog:
                 progress_dialog.update_progress(100, "Saving Word document...")
             
-            # Save Word document
-            self.doc.SaveAs2(word_output)
-            print("Word document saved successfully")
-            
-            # CRITICAL FIX: Clear hyperlink base AFTER saving to ensure relative links
+            # CRITICAL FIX: Clear hyperlink base to ensure relative links - linking is done, so it is
+            # cleared right BEFORE the SaveAs and the document is written once instead of saved twice
             try:
                 print("Clearing hyperlink base to ensure relative links...")
-                builtin_props = self.doc.BuiltInDocumentProperties
-                hyperlink_base_prop = builtin_props("Hyperlink base")
-                hyperlink_base_prop.Value = ""  # Clear the hyperlink base
-                
-                # Save again to persist the cleared hyperlink base
-                self.doc.Save()
-                print("✓ Hyperlink base cleared and document re-saved")
+                self.doc.BuiltInDocumentProperties("Hyperlink base").Value = ""
+                print("✓ Hyperlink base cleared")
             except Exception as e:
                 print(f"Warning: Could not clear hyperlink base: {e}")
             
+            # Save Word document
+            self.doc.SaveAs2(word_output)
+            print("Word document saved successfully")
+            
             word_saved = True
             
             # Update progress for PDF export
@@ -1834,20 +1944,17 @@ class WordAutoLinkerCOM:
             # Force close any remaining documents that might be hanging around
             if self.word_app:
                 try:
-                    # Get count of open documents
-                    doc_count = self.word_app.Documents.Count
-                    print(f"Word has {doc_count} documents still open")
+                    # Snapshot the open documents once instead of re-querying Count/Documents(1) per close
+                    open_docs = list(self.word_app.Documents)
+                    print(f"Word has {len(open_docs)} documents still open")
                     
                     # Close all documents (be more aggressive)
-                    while self.word_app.Documents.Count > 0:
+                    for doc in open_docs:
                         try:
-                            doc = self.word_app.Documents(1)  # Get first document
-                            doc_name = doc.Name
-                            print(f"Force closing document: {doc_name}")
+                            print(f"Force closing document: {doc.Name}")
                             doc.Close(SaveChanges=False)
                         except Exception as e:
                             print(f"Error force closing document: {e}")
-                            break  # Avoid infinite loop
                     
                     # Now quit Word application
                     print("Quitting Word application...")
@@ -1859,10 +1966,8 @@ class WordAutoLinkerCOM:
                 finally:
                     self.word_app = None
             
-            # Force COM cleanup
-            import gc
-            gc.collect()
-            
+            # COM proxies are released by refcount as soon as the references above are dropped -
+            # no full gc.collect() sweep of the whole process is needed
             print("Cleanup completed")
             
             # Always try to uninitialize COM
@@ -1874,20 +1979,14 @@ class WordAutoLinkerCOM:
             
             # CRITICAL FIX: Delete the working copy file after Word is closed (like Excel does)
             if working_copy_to_delete and os.path.exists(working_copy_to_delete):
-                try:
-                    print(f"Deleting working copy file: {working_copy_to_delete}")
-                    
-                    # Wait a moment for Word to fully release the file
-                    import time
-                    time.sleep(1)
-                    
-                    # Try to delete the file
-                    os.remove(working_copy_to_delete)
-                    print("✓ Working copy file deleted successfully")
-                    
-                except Exception as e:
-                    print(f"✗ Could not delete working copy file: {e}")
+                print(f"Deleting working copy file: {working_copy_to_delete}")
+                
+                last_error = _remove_with_retry(working_copy_to_delete)
+                if last_error:
+                    print(f"✗ Could not delete working copy file: {last_error}")
                     print("You may need to delete it manually")
+                else:
+                    print("✓ Working copy file deleted successfully")
             
         except Exception as e:
             print(f"Error during cleanup: {e}")
@@ -1900,67 +1999,77 @@ class FileRenamer:
     """Utility class to rename files for better Chrome PDF compatibility"""
     
     @staticmethod
-    def normalize_filename(filename):
+    def normalize_filename(filename, verbose=False):
         """
         Convert filenames to Chrome-friendly format:
         - Ex. A Letter.pdf -> Ex._A_Letter.pdf
         - Ex. 55 Email.docx -> Ex._55_Email.docx
         - Exhibit 12 Memo.pdf -> Exhibit_12_Memo.pdf
+        
+        Per-file log lines are only emitted when verbose is True.
         """
         # Split filename and extension
         name, ext = os.path.splitext(filename)
         
         # Skip files that don't look like exhibits
-        if not (name.lower().startswith(('ex.', 'ex ', 'exhibit')) or 
-                re.match(r'^ex[._\s]', name.lower())):
+        if not _IS_EXHIBIT(name):
             return filename
         
-        print(f"Processing: '{filename}'")
-        
         # Step 1: Handle common exhibit patterns
         # Ex. A Letter -> Ex_A_Letter
         # Ex.106 -> Ex_106
         # Ex. 55 Email -> Ex_55_Email  
+        # Ex 7 Memo -> Ex_7_Memo
         # Exhibit 12 Memo -> Exhibit_12_Memo
+        lower = name[:8].lower()
+        if lower.startswith('exhibit'):
+            # Replace "Exhibit " with "Exhibit_"
+            if len(name) > 7 and name[7].isspace():
+                normalized = name[:7] + '_' + name[7:].lstrip()
+            else:
+                normalized = name
+        elif lower.startswith('ex.'):
+            # Replace "Ex." followed by optional spaces with "Ex_" (period + any spaces = one underscore)
+            normalized = name[:2] + '_' + name[3:].lstrip()
+        elif name[2].isspace():
+            # Replace "Ex " (space without period) with "Ex_"
+            normalized = name[:2] + '_' + name[2:].lstrip()
+        else:
+            # Already "Ex_..."
+            normalized = name
         
-        normalized = name
-        
-        # Replace "Ex." followed by optional spaces with "Ex_" (period + any spaces = one underscore)
-        normalized = re.sub(r'^(Ex)\.(\s*)', r'\1_', normalized, flags=re.IGNORECASE)
-        
-        # Replace "Ex " (space without period) with "Ex_"
-        normalized = re.sub(r'^(Ex)\s+', r'\1_', normalized, flags=re.IGNORECASE)
-        
-        # Replace "Exhibit " with "Exhibit_"
-        normalized = re.sub(r'^(Exhibit)\s+', r'\1_', normalized, flags=re.IGNORECASE)
+        if verbose:
+            logger.debug("Processing: '%s'", filename)
         
         # Step 2: Replace remaining spaces with underscores
-        # But be smart about it - don't create double underscores
-        normalized = re.sub(r'\s+', '_', normalized)
+        normalized = normalized.translate(_WS_TO_US)
         
         # Step 3: Clean up any double underscores
-        normalized = re.sub(r'_{2,}', '_', normalized)
+        while '__' in normalized:
+            normalized = normalized.replace('__', '_')
         
         # Step 4: Remove trailing underscores
         normalized = normalized.rstrip('_')
         
         new_filename = normalized + ext
         
-        if new_filename != filename:
-            print(f"  Will rename: '{filename}' -> '{new_filename}'")
-        else:
-            print(f"  No change needed: '{filename}'")
+        if verbose:
+            if new_filename != filename:
+                logger.debug("  Will rename: '%s' -> '%s'", filename, new_filename)
+            else:
+                logger.debug("  No change needed: '%s'", filename)
         
         return new_filename
     
     @staticmethod
-    def rename_files_in_folder(folder_path, dry_run=True):
+    def rename_files_in_folder(folder_path, dry_run=True, verbose=False):
         """
         Rename files in folder for Chrome compatibility
         
         Args:
             folder_path: Path to folder containing files
             dry_run: If True, only show what would be renamed without actually renaming
+            verbose: If True, log a line per file (otherwise only the summary is logged)
             
         Returns:
             tuple: (successful_renames, failed_renames, unchanged_files)
@@ -1969,58 +2078,100 @@ class FileRenamer:
             raise Exception(f"Folder does not exist: {folder_path}")
         
         try:
-            files = os.listdir(folder_path)
+            with os.scandir(folder_path) as it:
+                entries = list(it)
         except Exception as e:
             raise Exception(f"Cannot read folder: {e}")
         
+        # Names already in the folder (lowercased - Windows names are case-insensitive),
+        # so conflict checks are a set lookup instead of a stat per file
+        existing_names = {entry.name.lower() for entry in entries}
+        
+        # Folder path with exactly one trailing separator - targets are built with a plain
+        # concatenation (sources come ready-made from DirEntry.path)
+        target_dir = os.path.join(folder_path, '')
+        
         successful_renames = []
         failed_renames = []
         unchanged_files = []
+        planned_renames = []
         
-        print(f"\n{'DRY RUN - ' if dry_run else ''}Processing files in: {folder_path}")
-        print(f"Found {len(files)} files")
-        
-        for filename in files:
-            # Skip directories
-            full_path = os.path.join(folder_path, filename)
-            if os.path.isdir(full_path):
+        for entry in entries:
+            # Only rename files (directories and anything else are skipped) - the type comes
+            # from the directory listing itself, no extra stat per entry
+            if not entry.is_file():
                 continue
+            filename = entry.name
             
-            new_filename = FileRenamer.normalize_filename(filename)
+            new_filename = FileRenamer.normalize_filename(filename, verbose)
             
             if new_filename == filename:
                 unchanged_files.append(filename)
                 continue
             
-            new_full_path = os.path.join(folder_path, new_filename)
-            
-            # Check if target filename already exists
-            if os.path.exists(new_full_path):
+            # Check if target filename already exists (or is already claimed by an earlier planned rename)
+            if new_filename.lower() in existing_names:
                 error_msg = f"Target file already exists: {new_filename}"
                 failed_renames.append((filename, new_filename, error_msg))
-                print(f"  ✗ CONFLICT: {error_msg}")
+                if verbose:
+                    logger.debug("  ✗ CONFLICT: %s", error_msg)
                 continue
             
-            if not dry_run:
-                try:
-                    os.rename(full_path, new_full_path)
-                    successful_renames.append((filename, new_filename))
-                    print(f"  ✓ RENAMED: '{filename}' -> '{new_filename}'")
-                except Exception as e:
-                    failed_renames.append((filename, new_filename, str(e)))
-                    print(f"  ✗ FAILED: '{filename}' -> '{new_filename}' ({e})")
-            else:
-                successful_renames.append((filename, new_filename))
-                print(f"  ✓ WOULD RENAME: '{filename}' -> '{new_filename}'")
+            existing_names.add(new_filename.lower())
+            planned_renames.append((filename, new_filename, entry.path, f"{target_dir}{new_filename}"))
         
-        print(f"\nSummary:")
-        print(f"  Files that would be renamed: {len(successful_renames)}")
-        print(f"  Files that would fail: {len(failed_renames)}")
-        print(f"  Files unchanged: {len(unchanged_files)}")
+        if dry_run:
+            for filename, new_filename, _, _ in planned_renames:
+                successful_renames.append((filename, new_filename))
+                if verbose:
+                    logger.debug("  ✓ WOULD RENAME: '%s' -> '%s'", filename, new_filename)
+        elif planned_renames:
+            # Targets are unique and conflict-free, so the renames are independent -
+            # overlap the filesystem round-trips (noticeable on network/OneDrive folders)
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                futures = [
+                    (filename, new_filename, pool.submit(os.replace, full_path, new_full_path))
+                    for filename, new_filename, full_path, new_full_path in planned_renames
+                ]
+                # Collect in plan order so results stay in folder order
+                for filename, new_filename, future in futures:
+                    try:
+                        future.result()
+                        successful_renames.append((filename, new_filename))
+                        if verbose:
+                            logger.debug("  ✓ RENAMED: '%s' -> '%s'", filename, new_filename)
+                    except Exception as e:
+                        failed_renames.append((filename, new_filename, str(e)))
+                        if verbose:
+                            logger.debug("  ✗ FAILED: '%s' -> '%s' (%s)", filename, new_filename, e)
+        
+        logger.info(
+            "%sRenamed files in %s (%d entries): %d %s, %d failed, %d unchanged",
+            'DRY RUN - ' if dry_run else '', folder_path, len(entries),
+            len(successful_renames), 'would be renamed' if dry_run else 'renamed',
+            len(failed_renames), len(unchanged_files)
+        )
         
         return successful_renames, failed_renames, unchanged_files
 
 
+def _excel_quote(value):
+    """Text for an Excel formula string literal (double any quotes - rare, so check before rewriting)"""
+    text = str(value)
+    return text.replace('"', '""') if '"' in text else text
+
+def _column_letter(col_index):
+    """Convert column index to letter (1=A, 2=B, etc.)"""
+    result = ""
+    while col_index > 0:
+        col_index -= 1
+        result = chr(col_index % 26 + ord('A')) + result
+        col_index //= 26
+    return result
+
+# Letters for columns A..ZZ, so header lookups are a tuple index
+_COLUMN_LETTERS = tuple(_column_letter(i) for i in range(1, 703))
+
 class ExcelAutoLinker:
     def __init__(self):
         self.excel_app = None
@@ -2033,11 +2184,13 @@ class ExcelAutoLinker:
         self.mode = "exhibit"  # "exhibit" or "bates"
         self.bates_prefix = ""
         self.bates_pdf_map = {}
+        self._sorted_bates_starts = []
         self.use_black_hyperlinks = False
         self.page_automation_enabled = False
         self.exemplary_citation = ""
         self.exemplary_page_number = None
         self.page_pattern_regex = None
+        self._page_pattern_compiled = None
         self.exhibit_group_index = None
         self.page_group_index = None
 
@@ -2058,6 +2211,23 @@ class ExcelAutoLinker:
             r'\bEx_(\d+[A-Z]?)\b',            # Ex_1, Ex_2A (underscore)
             r'\bEx_([A-Z])\b',                # Ex_A, Ex_B (underscore)
         ]
+        # All of the above fused into one alternation - one scan of the text finds any reference
+        self._fused_exhibit_re = re.compile(r'\b(?:Ex\.\s*|Exhibit\s*|Ex\s+|Ex_)(\d+[A-Z]?|[A-Z])\b', re.IGNORECASE)
+        self._bates_ref_re = None
+        self._bates_prefix_lower = ""
+        
+        # identifier -> (prefix rank, exhibit path) in target_folder, built once per folder/run
+        self._exhibit_index = {}
+        self._exhibit_index_folder = None
+        # (mode, folder, cell text) -> find_matching_files result; cleared whenever the index/map is rebuilt
+        self._match_cache = {}
+        
+        # Hyperlink base directory (and its normpath), computed once per process_excel_column run
+        self._cached_excel_dir = None
+        self._cached_excel_dir_norm = None
+        
+        # Excel's calculation mode before suspend_calculation (None = not suspended)
+        self.original_calculation = None
 
         
         # Track created hyperlinks
@@ -2094,6 +2264,9 @@ class ExcelAutoLinker:
             except:
                 pass  # Some versions might not support this
             
+            # Stop Excel recalculating after every cell we write
+            self.suspend_calculation()
+            
             workbook_count = self.excel_app.Workbooks.Count
             print(f"Excel initialized successfully (hidden). Current workbooks: {workbook_count}")
             
@@ -2103,6 +2276,35 @@ class ExcelAutoLinker:
             print(f"Error initializing Excel: {e}")
             raise Exception(f"Could not initialize Microsoft Excel: {str(e)}")
 
+    def suspend_calculation(self):
+        """Switch Excel to manual calculation while we write links (restored in cleanup)"""
+        try:
+            if self.original_calculation is None:
+                self.original_calculation = self.excel_app.Calculation
+            self.excel_app.Calculation = -4135  # xlCalculationManual
+            self.excel_app.CalculateBeforeSave = False
+        except:
+            pass  # Excel refuses to change calculation mode while no workbook is open
+        
+        if self.worksheet:
+            try:
+                self.worksheet.EnableFormatConditionsCalculation = False
+            except:
+                pass  # Not available in older Excel versions
+
+    def restore_calculation(self):
+        """Restore the calculation mode Excel had before we suspended it"""
+        if self.original_calculation is None:
+            return
+        try:
+            self.excel_app.Calculation = self.original_calculation
+            self.excel_app.CalculateBeforeSave = True
+            print("Excel calculation mode restored")
+        except Exception as e:
+            print(f"Could not restore Excel calculation mode: {e}")
+        finally:
+            self.original_calculation = None
+
     def select_excel_file(self):
         """Select Excel file to process - FIXED to create working copy"""
         if not self.initialize_excel():
@@ -2165,6 +2367,9 @@ class ExcelAutoLinker:
             self.workbook = self.excel_app.Workbooks.Open(working_copy_path)
             self.worksheet = self.workbook.ActiveSheet
             
+            # Now that a workbook is open Excel accepts the manual calculation switch
+            self.suspend_calculation()
+            
             # Store paths - IMPORTANT: Keep track of both original and working copy
             self.excel_file_path = working_copy_path  # Point to working copy for processing
             self.working_copy_path = working_copy_path
@@ -2182,12 +2387,9 @@ class ExcelAutoLinker:
 
     def get_column_letter(self, col_index):
         """Convert column index to letter (1=A, 2=B, etc.)"""
-        result = ""
-        while col_index > 0:
-            col_index -= 1
-            result = chr(col_index % 26 + ord('A')) + result
-            col_index //= 26
-        return result
+        if 1 <= col_index <= len(_COLUMN_LETTERS):
+            return _COLUMN_LETTERS[col_index - 1]
+        return _column_letter(col_index)
 
     def get_available_columns(self):
         """Get list of available columns with their headers"""
@@ -2202,22 +2404,25 @@ class ExcelAutoLinker:
             columns = []
             first_row = used_range.Rows(1)
             
-            for i in range(1, first_row.Columns.Count + 1):
-                try:
-                    cell_value = first_row.Cells(1, i).Value
-                    if cell_value is None:
-                        cell_value = f"(Empty)"
-                    
-                    column_letter = self.get_column_letter(i)
-                    columns.append({
-                        'index': i,
-                        'letter': column_letter,
-                        'header': str(cell_value),
-                        'display': f"Column {column_letter}: {cell_value}"
-                    })
-                except Exception as e:
-                    print(f"Error reading column {i}: {e}")
-                    continue
+            # Read the whole header row in one COM call instead of one call per cell
+            # (a single cell comes back as a scalar, a row as a 1-tuple of values)
+            header_values = first_row.Value
+            if first_row.Columns.Count == 1:
+                header_values = (header_values,)
+            else:
+                header_values = header_values[0]
+            
+            for i, cell_value in enumerate(header_values, start=1):
+                if cell_value is None:
+                    cell_value = f"(Empty)"
+                
+                column_letter = self.get_column_letter(i)
+                columns.append({
+                    'index': i,
+                    'letter': column_letter,
+                    'header': str(cell_value),
+                    'display': f"Column {column_letter}: {cell_value}"
+                })
             
             return columns
             
@@ -2229,28 +2434,35 @@ class ExcelAutoLinker:
         """Set processing mode"""
         self.mode = mode
         self.bates_prefix = bates_prefix.strip()
+        self._bates_ref_re = re.compile(rf'{re.escape(self.bates_prefix)}(\d+)', re.IGNORECASE) if self.bates_prefix else None
+        self._bates_prefix_lower = self.bates_prefix.lower()
+        self._match_cache = {}
         if mode == "bates" and self.target_folder:
             self.build_bates_pdf_map()
 
     def build_bates_pdf_map(self):
         """Build mapping of Bates PDFs - reuse logic from Word class"""
         self.bates_pdf_map = {}
+        self._sorted_bates_starts = []
+        self._match_cache = {}
         
         if not self.target_folder or not self.bates_prefix:
             return
         
         try:
-            files_in_folder = os.listdir(self.target_folder)
             bates_files = []
             
-            bates_pattern = rf'^{re.escape(self.bates_prefix)}(\d+)\.pdf$'
+            prefix_lower = self.bates_prefix.lower()
+            prefix_len = len(prefix_lower)
             
-            for filename in files_in_folder:
-                match = re.match(bates_pattern, filename, re.IGNORECASE)
-                if match:
-                    bates_number = int(match.group(1))
-                    full_path = os.path.join(self.target_folder, filename)
-                    bates_files.append((bates_number, filename, full_path))
+            with os.scandir(self.target_folder) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if not name.lower().endswith('.pdf') or name[:prefix_len].lower() != prefix_lower:
+                        continue
+                    digits = name[prefix_len:-4]
+                    if digits.isdecimal():
+                        bates_files.append((int(digits), name, entry.path))
             
             bates_files.sort(key=lambda x: x[0])
             
@@ -2261,6 +2473,8 @@ class ExcelAutoLinker:
                     'start_page': bates_number
                 }
             
+            self._sorted_bates_starts = sorted(self.bates_pdf_map)
+            
             print(f"Built Bates PDF map for {len(bates_files)} files")
                 
         except Exception as e:
@@ -2276,6 +2490,7 @@ class ExcelAutoLinker:
             self.build_page_pattern()
         else:
             self.page_pattern_regex = None
+            self._page_pattern_compiled = None
             self.exhibit_group_index = None
             self.page_group_index = None
 
@@ -2289,32 +2504,21 @@ class ExcelAutoLinker:
             
             # Step 1: Find exhibit identifier using existing patterns
             exhibit_id = None
-            for pattern in self.exhibit_patterns:
-                match = re.search(pattern, citation, re.IGNORECASE)
-                if match:
-                    exhibit_id = match.group(1)
-                    print(f"  Found exhibit ID: '{exhibit_id}'")
-                    break
+            match = self._fused_exhibit_re.search(citation)
+            if match:
+                exhibit_id = match.group(1)
+                print(f"  Found exhibit ID: '{exhibit_id}'")
             
             if not exhibit_id:
                 print("  ERROR: Could not find exhibit identifier in exemplary citation")
                 return False
             
             # Step 2: Find page number with common legal citation patterns
-            page_patterns = [
-                rf'\bat\s+p\.?\s*{re.escape(page_num)}\b',      # "at p. 25", "at p 25"
-                rf'\bat\s+pp\.?\s*{re.escape(page_num)}\b',     # "at pp. 25", "at pp 25" 
-                rf'\bat\s+{re.escape(page_num)}\b',             # "at 25"
-                rf'\bp\.?\s*{re.escape(page_num)}\b',           # "p. 25", "p 25"
-                rf'\bpp\.?\s*{re.escape(page_num)}\b',          # "pp. 25", "pp 25"
-                rf'\bpage\s+{re.escape(page_num)}\b',           # "page 25"
-                rf'\bpages?\s+{re.escape(page_num)}\b',         # "pages 25"
-                rf'\b{re.escape(page_num)}\b'                   # just "25" (fallback)
-            ]
+            escaped_page = re.escape(page_num)
             
             page_match_info = None
-            for i, pattern in enumerate(page_patterns):
-                matches = list(re.finditer(pattern, citation, re.IGNORECASE))
+            for i, template in enumerate(_PAGE_PATTERN_TEMPLATES):
+                matches = list(re.compile(template.format(n=escaped_page), re.IGNORECASE).finditer(citation))
                 if matches:
                     # Use the last match (most likely the page reference)
                     page_match_info = {
@@ -2382,6 +2586,7 @@ class ExcelAutoLinker:
                 if (found_exhibit.upper() == exhibit_id.upper() and 
                     found_page == page_num):
                     self.page_pattern_regex = full_pattern
+                    self._page_pattern_compiled = re.compile(full_pattern, re.IGNORECASE)
                     self.exhibit_group_index = 1
                     self.page_group_index = 2
                     print("  ✓ Flexible pattern validation successful!")
@@ -2402,295 +2607,201 @@ class ExcelAutoLinker:
             return False
 
     def find_page_number_in_text(self, text):
-            """Extract exhibit ID and page number using the pattern - ENHANCED VERSION"""
-            if not self.page_automation_enabled or not self.page_pattern_regex:
-                print(f"    Page automation disabled or no pattern (enabled={self.page_automation_enabled}, pattern={self.page_pattern_regex is not None})")
-                return None, None
+        """Extract exhibit ID and page number using the pattern - ENHANCED VERSION"""
+        if not self.page_automation_enabled or not self._page_pattern_compiled:
+            return []
+        
+        try:
+            ex_i, pg_i = self.exhibit_group_index, self.page_group_index
             
-            try:
-                print(f"    Testing pattern '{self.page_pattern_regex}' against text: '{text}'")
-                
-                # Find ALL pattern matches, not just the first one
-                matches = list(re.finditer(self.page_pattern_regex, text, re.IGNORECASE))
-                
-                if matches:
-                    print(f"    Found {len(matches)} pattern matches:")
-                    for i, match in enumerate(matches):
-                        exhibit_id = match.group(self.exhibit_group_index)
-                        page_number = int(match.group(self.page_group_index))
-                        match_text = match.group(0)
-                        print(f"      Match {i+1}: '{match_text}' -> Exhibit '{exhibit_id}' Page {page_number}")
-                    
-                    # Return all matches for the caller to decide which one to use
-                    results = []
-                    for match in matches:
-                        exhibit_id = match.group(self.exhibit_group_index)
-                        page_number = int(match.group(self.page_group_index))
-                        results.append((exhibit_id, page_number, match))
-                    
-                    return results
-                else:
-                    print(f"    ✗ Pattern did not match text")
-                    return []
-                    
-            except Exception as e:
-                print(f"    ✗ Error in page number extraction: {e}")
-                import traceback
-                traceback.print_exc()
+            # Return ALL pattern matches (not just the first one) for the caller to decide which one to use
+            results = [(m.group(ex_i), int(m.group(pg_i)), m) for m in self._page_pattern_compiled.finditer(text)]
             
-            return []
-
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("    Found %d page pattern matches in: '%s'", len(results), text)
+                for exhibit_id, page_number, match in results:
+                    logger.debug("      '%s' -> Exhibit '%s' Page %d", match.group(0), exhibit_id, page_number)
+            
+            return results
+                
+        except Exception as e:
+            print(f"    ✗ Error in page number extraction: {e}")
+            import traceback
+            traceback.print_exc()
+        
+        return []
 
     def find_bates_pdf_and_page(self, bates_number):
         """Find PDF and page for Bates number - reuse from Word class"""
         if not self.bates_pdf_map:
             return None, None
         
-        sorted_starts = sorted(self.bates_pdf_map.keys(), reverse=True)
-        
-        for start_page in sorted_starts:
-            if bates_number >= start_page:
-                pdf_info = self.bates_pdf_map[start_page]
-                page_in_pdf = bates_number - start_page + 1
-                return pdf_info['path'], page_in_pdf
+        idx = bisect.bisect_right(self._sorted_bates_starts, bates_number) - 1
+        if idx < 0:
+            return None, None
         
-        return None, None
+        start_page = self._sorted_bates_starts[idx]
+        return self.bates_pdf_map[start_page]['path'], bates_number - start_page + 1
 
     def get_relative_path(self, file_path):
         """Convert to file URL for Excel hyperlinks - FIXED for local files"""
         if not self.excel_file_path:
             return file_path
         
-        try:
-            print(f"\n=== PATH CONVERSION DEBUG ===")
-            print(f"Input file_path: {file_path}")
-            
-            # Check if it's already a web URL
-            if file_path.startswith(('http://', 'https://')):
-                print("Web URL detected - returning as-is")
-                return file_path
-            
-            # For local files, ALWAYS use file:// protocol for Excel compatibility
-            # Convert to absolute path first to ensure it works
-            abs_file_path = os.path.abspath(file_path)
-            print(f"Absolute file path: {abs_file_path}")
-            
-            # Create proper file:// URL - FIXED VERSION
-            # Replace backslashes with forward slashes but DON'T encode colons for file://
-            file_url = f"file:///{abs_file_path.replace('\\', '/')}"
-            print(f"Created file URL: {file_url}")
-            
-            return file_url
-            
-        except Exception as e:
-            print(f"Error creating file URL: {e}")
-            # Fallback - still try to create a file URL without encoding
-            try:
-                fallback_url = f"file:///{file_path.replace('\\', '/')}"
-                print(f"Using fallback file URL: {fallback_url}")
-                return fallback_url
-            except:
-                return file_path
-
-        """Convert to file URL for Excel hyperlinks - FIXED for local files"""
-        if not self.excel_file_path:
+        # Check if it's already a web URL
+        if file_path.startswith(('http://', 'https://')):
             return file_path
         
         try:
-            print(f"\n=== PATH CONVERSION DEBUG ===")
-            print(f"Input file_path: {file_path}")
-            
-            # Check if it's already a web URL
-            if file_path.startswith(('http://', 'https://')):
-                print("Web URL detected - returning as-is")
-                return file_path
-            
             # For local files, ALWAYS use file:// protocol for Excel compatibility
-            # Convert to absolute path first to ensure it works
-            abs_file_path = os.path.abspath(file_path)
-            print(f"Absolute file path: {abs_file_path}")
-            
-            # Create proper file:// URL
-            # Replace backslashes with forward slashes and encode colons
-            file_url = f"file:///{abs_file_path.replace('\\', '/').replace(':', '%3A')}"
-            print(f"Created file URL: {file_url}")
-            
-            return file_url
+            return _to_file_url(file_path)
             
         except Exception as e:
             print(f"Error creating file URL: {e}")
-            # Fallback - still try to create a file URL
+            # Fallback - still try to create a file URL without encoding
             try:
-                fallback_url = f"file:///{file_path.replace('\\', '/').replace(':', '%3A')}"
+                fallback_url = f"file:///{file_path.replace('\\', '/')}"
                 print(f"Using fallback file URL: {fallback_url}")
                 return fallback_url
             except:
                 return file_path
 
     def find_matching_files(self, reference_text):
-        """Find matching files based on mode"""
+        """Find matching files based on mode (memoized - the same reference often repeats down a column)"""
         if not self.target_folder:
             return []
         
+        cache_key = (self.mode, self.target_folder, reference_text)
+        cached = self._match_cache.get(cache_key)
+        if cached is not None:
+            return list(cached)
+        
         if self.mode == "bates":
-            return self.find_matching_bates_files(reference_text)
+            matching_files = self.find_matching_bates_files(reference_text)
         else:
-            return self.find_matching_exhibit_files(reference_text)
+            matching_files = self.find_matching_exhibit_files(reference_text)
+        
+        self._match_cache[cache_key] = list(matching_files)
+        return matching_files
 
-    def find_matching_exhibit_files(self, reference_text):
-        """Find exhibit files - ENHANCED VERSION with flexible naming patterns"""
-        matching_files = []
-        try:
-            files_in_folder = os.listdir(self.target_folder)
-            print(f"DEBUG: Files in folder: {files_in_folder}")
-        except Exception as e:
-            print(f"Error reading folder: {e}")
-            return []
+    def _rebuild_exhibit_index(self):
+        """Scan target_folder once and index exhibit files by identifier, keeping the best-ranked prefix"""
+        # Only the first file per identifier is kept - callers link to matching_files[0]
+        self._exhibit_index = {}
+        self._exhibit_index_folder = self.target_folder
+        self._match_cache = {}
         
-        print(f"EXCEL PROCESSING: '{reference_text}' (type: {type(reference_text)})")
+        if not self.target_folder:
+            return
         
-        # Clean up the reference text and handle Excel number conversion
-        cleaned_ref = str(reference_text).strip()
+        try:
+            with os.scandir(self.target_folder) as entries:
+                for entry in entries:
+                    # Name check first - is_file() comes from the scandir entry and only runs for candidates
+                    match = _EXHIBIT_FILE_RE.match(entry.name)
+                    if not match or not entry.is_file():
+                        continue
+                    prefix, identifier = match.groups()
+                    rank = _EXHIBIT_FILE_PREFIXES[prefix]
+                    current = self._exhibit_index.get(identifier)
+                    if current is None or rank < current[0]:
+                        self._exhibit_index[identifier] = (rank, entry.path)
+            
+            logger.debug("Indexed %s exhibit identifiers in %s", len(self._exhibit_index), self.target_folder)
+        except Exception as e:
+            logger.error("Error reading folder: %s", e)
+
+    def _lookup_exhibit_files(self, identifier):
+        """[path] of the exhibit for an identifier (first file under the best-ranked prefix), or []"""
+        entry = self._exhibit_index.get(identifier)
+        return [entry[1]] if entry else []
+
+    def find_matching_exhibit_files(self, reference_text):
+        """Find exhibit files - ENHANCED VERSION with flexible naming patterns
+        
+        Returns a one-element list with the first matching file (or []); when several files
+        share the identifier only the first one is returned.
+        """
+        # Folder changed since the last scan (or never scanned) - re-index it
+        if self._exhibit_index_folder != self.target_folder:
+            self._rebuild_exhibit_index()
         
-        # Handle Excel's float conversion (10.0 -> 10, 155.0 -> 155)
-        if cleaned_ref.endswith('.0'):
-            potential_number = cleaned_ref.replace('.0', '')
-            if potential_number.replace('-', '').isdigit():
-                cleaned_ref = potential_number
-                print(f"FLOAT CONVERSION: '{reference_text}' -> '{cleaned_ref}'")
+        logger.debug("EXCEL PROCESSING: '%s' (type: %s)", reference_text, type(reference_text))
         
-        # Handle cases where Excel gives us a pure number
-        try:
-            if isinstance(reference_text, (int, float)):
+        # Clean up the reference text and handle Excel number conversion in one typed dispatch
+        if isinstance(reference_text, (int, float)):
+            # Excel gives us a pure number (usually a float: 10.0 -> 10, 155.0 -> 155)
+            try:
                 cleaned_ref = str(int(reference_text))
-                print(f"DIRECT NUMBER CONVERSION: {reference_text} -> '{cleaned_ref}'")
-            elif cleaned_ref.replace('-', '').replace('.', '').isdigit():
-                num_val = float(cleaned_ref)
-                if num_val == int(num_val):
-                    cleaned_ref = str(int(num_val))
-                    print(f"STRING NUMBER CONVERSION: '{reference_text}' -> '{cleaned_ref}'")
-        except (ValueError, OverflowError):
-            pass
+            except (ValueError, OverflowError):
+                cleaned_ref = str(reference_text).strip()
+        else:
+            cleaned_ref = str(reference_text).strip()
+            if cleaned_ref.endswith('.0') and cleaned_ref[:-2].lstrip('-').isdigit():
+                # Numeric text with a trailing .0 (155.0 -> 155)
+                cleaned_ref = cleaned_ref[:-2]
+            elif '.' in cleaned_ref and cleaned_ref.replace('-', '').replace('.', '').isdigit():
+                # Other whole-number text such as 12.00
+                try:
+                    num_val = float(cleaned_ref)
+                    if num_val == int(num_val):
+                        cleaned_ref = str(int(num_val))
+                except (ValueError, OverflowError):
+                    pass
         
-        print(f"CLEANED: '{cleaned_ref}'")
+        logger.debug("CLEANED: '%s'", cleaned_ref)
         
         # Skip processing if this looks like a header or non-exhibit text
-        skip_words = ['exhibit', 'exhibits', 'ex', 'number', 'ref', 'reference', 'document', 'file']
-        if cleaned_ref.lower() in skip_words:
-            print(f"SKIPPING HEADER/NON-EXHIBIT: '{cleaned_ref}'")
+        if cleaned_ref.casefold() in _SKIP_REFS:
+            logger.debug("SKIPPING HEADER/NON-EXHIBIT: '%s'", cleaned_ref)
             return []
         
         # Also skip if it's too long to be a reasonable exhibit reference
         if len(cleaned_ref) > 125:
-            print(f"SKIPPING TOO LONG: '{cleaned_ref}'")
+            logger.debug("SKIPPING TOO LONG: '%s'", cleaned_ref)
             return []
         
+        matching_files = []
+        
         # First, try the ENHANCED patterns with word boundaries
-        for pattern in self.exhibit_patterns:
-            # Use the full original text for pattern matching to get proper context
-            match = re.search(pattern, str(reference_text), re.IGNORECASE)
-            if match:
-                identifier = match.group(1)
-                print(f"PATTERN MATCHED: '{reference_text}' -> identifier: '{identifier}'")
-                
-                # ENHANCED: Try multiple filename patterns
-                possible_prefixes = [
-                    f"Ex. {identifier}",     # Ex. 1, Ex. A
-                    f"Ex.{identifier}",      # Ex.1, Ex.A
-                    f"Ex {identifier}",      # Ex 1, Ex A
-                    f"Ex_{identifier}",      # Ex_1, Ex_A
-                    f"Exhibit {identifier}", # Exhibit 1, Exhibit A
-                    f"Exhibit_{identifier}", # Exhibit_1, Exhibit_A
-                ]
-                
-                for target_prefix in possible_prefixes:
-                    print(f"  Trying prefix: '{target_prefix}'")
-                    
-                    for filename in files_in_folder:
-                        if filename.startswith(target_prefix):
-                            prefix_len = len(target_prefix)
-                            
-                            if prefix_len >= len(filename):
-                                # Exact match
-                                full_path = os.path.join(self.target_folder, filename)
-                                matching_files.append(full_path)
-                                print(f"    ✓ EXACT MATCH: '{reference_text}' -> '{filename}'")
-                            else:
-                                next_char = filename[prefix_len]
-                                # Allow common separators and extensions
-                                if next_char in ['_', '-', '.', ' ']:
-                                    full_path = os.path.join(self.target_folder, filename)
-                                    matching_files.append(full_path)
-                                    print(f"    ✓ PARTIAL MATCH: '{reference_text}' -> '{filename}'")
-                    
-                    # Stop if we found matches with this prefix
-                    if matching_files:
-                        break
-                
-                # Stop if we found matches with this pattern
-                if matching_files:
-                    break
+        # Use the full original text for pattern matching to get proper context
+        for match in self._fused_exhibit_re.finditer(str(reference_text)):
+            identifier = match.group(1)
+            logger.debug("PATTERN MATCHED: '%s' -> identifier: '%s'", reference_text, identifier)
+            
+            # ENHANCED: "Ex. 1", "Ex.1", "Ex 1", "Ex_1", "Exhibit 1", "Exhibit_1" filenames via the folder index
+            matching_files = self._lookup_exhibit_files(identifier)
+            
+            # Stop if we found matches with this reference
+            if matching_files:
+                for full_path in matching_files:
+                    logger.debug("    ✓ MATCH: '%s' -> '%s'", reference_text, os.path.basename(full_path))
+                break
         
         # If no matches found with standard patterns, try bare number/letter matching
         if not matching_files:
-            print(f"No standard pattern match, trying bare reference...")
+            logger.debug("No standard pattern match, trying bare reference...")
             
             if cleaned_ref:
-                identifier = None
-                
-                # Handle pure numbers (155 -> Ex. 155)
-                if cleaned_ref.isdigit():
-                    identifier = cleaned_ref
-                # Handle pure letters (A, B, C) - but only single letters
-                elif cleaned_ref.isalpha() and len(cleaned_ref) == 1:
-                    identifier = cleaned_ref.upper()
-                # Handle alphanumeric combinations (1A, 2B) - reasonable length limit
-                elif re.match(r'^[A-Za-z0-9]+$', cleaned_ref) and 1 <= len(cleaned_ref) <= 5:
-                    identifier = cleaned_ref.upper()
+                # Pure numbers (155 -> Ex. 155), single letters (A, B, C) and short alphanumerics (1A, 2B)
+                identifier = cleaned_ref.upper() if _BARE_REF_RE.fullmatch(cleaned_ref) else None
                 
                 if identifier:
-                    print(f"BARE REFERENCE DETECTED: '{cleaned_ref}' -> identifier: '{identifier}'")
+                    logger.debug("BARE REFERENCE DETECTED: '%s' -> identifier: '%s'", cleaned_ref, identifier)
                     
                     # Try the same multiple filename patterns
-                    possible_prefixes = [
-                        f"Ex. {identifier}",
-                        f"Ex.{identifier}",
-                        f"Ex {identifier}",
-                        f"Ex_{identifier}",
-                        f"Exhibit {identifier}",
-                        f"Exhibit_{identifier}",
-                    ]
-                    
-                    for target_prefix in possible_prefixes:
-                        print(f"  Trying bare prefix: '{target_prefix}'")
-                        
-                        for filename in files_in_folder:
-                            if filename.startswith(target_prefix):
-                                prefix_len = len(target_prefix)
-                                
-                                if prefix_len >= len(filename):
-                                    full_path = os.path.join(self.target_folder, filename)
-                                    matching_files.append(full_path)
-                                    print(f"    ✓ BARE EXACT MATCH: '{cleaned_ref}' -> '{filename}'")
-                                else:
-                                    next_char = filename[prefix_len]
-                                    if next_char in ['_', '-', '.', ' ']:
-                                        full_path = os.path.join(self.target_folder, filename)
-                                        matching_files.append(full_path)
-                                        print(f"    ✓ BARE PARTIAL MATCH: '{cleaned_ref}' -> '{filename}'")
-                        
-                        # Stop if we found matches
-                        if matching_files:
-                            break
+                    matching_files = self._lookup_exhibit_files(identifier)
+                    for full_path in matching_files:
+                        logger.debug("    ✓ BARE MATCH: '%s' -> '%s'", cleaned_ref, os.path.basename(full_path))
                 else:
-                    print(f"BARE REFERENCE REJECTED: '{cleaned_ref}' doesn't match simple patterns")
+                    logger.debug("BARE REFERENCE REJECTED: '%s' doesn't match simple patterns", cleaned_ref)
         
         if not matching_files:
-            print(f"✗ NO MATCH FOUND for: '{cleaned_ref}'")
+            logger.debug("✗ NO MATCH FOUND for: '%s'", cleaned_ref)
         else:
-            print(f"✓ FINAL RESULT: Found {len(matching_files)} matches for '{cleaned_ref}'")
+            logger.debug("✓ FINAL RESULT: Found %s matches for '%s'", len(matching_files), cleaned_ref)
             for match in matching_files:
-                print(f"  Matched file: {match}")
+                logger.debug("  Matched file: %s", match)
         
         return matching_files
 
@@ -2698,13 +2809,14 @@ class ExcelAutoLinker:
         """Find Bates files - reuse logic from Word class"""
         matching_files = []
         
-        if not self.bates_prefix:
+        if not self._bates_ref_re:
             return []
         
-        escaped_prefix = re.escape(self.bates_prefix)
-        bates_pattern = rf'{escaped_prefix}(\d+)'
+        # Cheap substring test first - most cells don't mention the prefix at all
+        if self._bates_prefix_lower not in reference_text.lower():
+            return []
         
-        match = re.search(bates_pattern, reference_text, re.IGNORECASE)
+        match = self._bates_ref_re.search(reference_text)
         if match:
             bates_number = int(match.group(1))
             pdf_path, page_number = self.find_bates_pdf_and_page(bates_number)
@@ -2718,166 +2830,218 @@ class ExcelAutoLinker:
         
         return matching_files
 
+    def _cache_excel_dir(self):
+        """Compute the directory hyperlinks are made relative to, once per run"""
+        # CRITICAL: Use the original Excel file location for path calculation
+        # because that's where the user will likely keep the final files
+        if hasattr(self, 'original_excel_path') and self.original_excel_path:
+            excel_reference_path = self.original_excel_path
+            logger.debug("Using original file location as reference: %s", excel_reference_path)
+        else:
+            excel_reference_path = self.excel_file_path
+            logger.debug("Using working copy location as reference: %s", excel_reference_path)
+        
+        self._cached_excel_dir = os.path.dirname(os.path.abspath(excel_reference_path))
+        self._cached_excel_dir_norm = os.path.normpath(self._cached_excel_dir)
+
     def get_relative_path_for_excel(self, file_path):
         """Convert to relative path for Excel hyperlinks - FIXED VERSION"""
         if not self.excel_file_path:
             return file_path
         
         try:
-            print(f"\n=== EXCEL HYPERLINK PATH DEBUG ===")
-            print(f"Target file: {file_path}")
-            print(f"Excel working copy: {self.excel_file_path}")
-            print(f"Original Excel file: {getattr(self, 'original_excel_path', 'Not set')}")
-            
-            # CRITICAL: Use the original Excel file location for path calculation
-            # because that's where the user will likely keep the final files
-            if hasattr(self, 'original_excel_path') and self.original_excel_path:
-                excel_reference_path = self.original_excel_path
-                print(f"Using original file location as reference: {excel_reference_path}")
-            else:
-                excel_reference_path = self.excel_file_path
-                print(f"Using working copy location as reference: {excel_reference_path}")
-            
-            # Get the directory containing the Excel file
-            excel_dir = os.path.dirname(os.path.abspath(excel_reference_path))
-            target_dir = os.path.dirname(os.path.abspath(file_path))
+            logger.debug("=== EXCEL HYPERLINK PATH DEBUG ===")
+            logger.debug("Target file: %s", file_path)
+            logger.debug("Excel working copy: %s", self.excel_file_path)
+            logger.debug("Original Excel file: %s", getattr(self, 'original_excel_path', 'Not set'))
+            
+            # Get the directory containing the Excel file (cached for the current run)
+            if self._cached_excel_dir is None:
+                self._cache_excel_dir()
+            excel_dir = self._cached_excel_dir
+            abs_file_path = os.path.abspath(file_path)
+            target_dir = os.path.dirname(abs_file_path)
             
-            print(f"Excel directory: {excel_dir}")
-            print(f"Target directory: {target_dir}")
+            logger.debug("Excel directory: %s", excel_dir)
+            logger.debug("Target directory: %s", target_dir)
             
             # Check if files are in the same directory
-            if os.path.normpath(excel_dir) == os.path.normpath(target_dir):
+            if self._cached_excel_dir_norm == os.path.normpath(target_dir):
                 # Same directory - just use filename
                 relative_path = os.path.basename(file_path)
-                print(f"Same directory - using filename: {relative_path}")
+                logger.debug("Same directory - using filename: %s", relative_path)
                 return relative_path
             
             # Calculate relative path from Excel file to target file
             try:
                 relative_path = os.path.relpath(file_path, excel_dir)
-                print(f"Calculated relative path: {relative_path}")
+                logger.debug("Calculated relative path: %s", relative_path)
                 
                 # Convert to forward slashes for Excel - CRITICAL FIX: Don't URL encode!
                 excel_relative_path = relative_path.replace('\\', '/')
-                print(f"Excel-formatted path: {excel_relative_path}")
+                logger.debug("Excel-formatted path: %s", excel_relative_path)
                 
-                # Verify the path exists
+                # Verify the path exists (debug only - two stats per link)
                 test_absolute = os.path.abspath(os.path.join(excel_dir, relative_path))
-                print(f"Verification - reconstructed absolute path: {test_absolute}")
-                print(f"Original file exists: {os.path.exists(file_path)}")
-                print(f"Reconstructed path exists: {os.path.exists(test_absolute)}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Verification - reconstructed absolute path: %s", test_absolute)
+                    logger.debug("Original file exists: %s", os.path.exists(file_path))
+                    logger.debug("Reconstructed path exists: %s", os.path.exists(test_absolute))
                 
                 return excel_relative_path
                 
             except ValueError as e:
-                print(f"Relative path calculation failed: {e}")
+                logger.error("Relative path calculation failed: %s", e)
                 # Files are on different drives - use absolute path as file:// URL
-                abs_path = os.path.abspath(file_path)
-                file_url = f"file:///{abs_path.replace('\\', '/')}"
-                print(f"Using absolute file:// URL: {file_url}")
+                file_url = f"file:///{abs_file_path.replace('\\', '/')}"
+                logger.debug("Using absolute file:// URL: %s", file_url)
                 return file_url
             
         except Exception as e:
-            print(f"Error in path calculation: {e}")
-            import traceback
-            traceback.print_exc()
+            # Called per linked row - only walk the traceback in debug runs
+            logger.error("Error in path calculation for %s: %s", file_path, e, exc_info=logger.isEnabledFor(logging.DEBUG))
             # Ultimate fallback - just the filename
             return os.path.basename(file_path)
 
-    def process_excel_column(self):
-        """Process selected column for hyperlinks - COMPLETE FIXED VERSION"""
-        if not self.worksheet or self.selected_column_index is None:
+    def _resolve_page(self, cell_text):
+        """(exhibit_id, page_number) for a cell when page automation finds the cell's exhibit, else (None, None)"""
+        if not self.page_automation_enabled:
+            return None, None
+        
+        page_matches = self.find_page_number_in_text(cell_text)
+        
+        # Get the current exhibit ID for comparison
+        match = self._fused_exhibit_re.search(cell_text)
+        current_exhibit_id = match.group(1) if match else None
+        
+        # Find the match that corresponds to our current exhibit
+        if page_matches and current_exhibit_id:
+            for match_exhibit_id, match_page_number, match_obj in page_matches:
+                if match_exhibit_id.upper() == current_exhibit_id.upper():
+                    logger.debug("  ✓ Found matching exhibit ID: '%s' -> Page %s", match_exhibit_id, match_page_number)
+                    return match_exhibit_id, match_page_number
+            
+            logger.debug("  ✗ No matching exhibit ID found for '%s' in page automation", current_exhibit_id)
+        
+        return None, None
+
+    def process_excel_column(self, worksheet=None):
+        """Process selected column for hyperlinks - COMPLETE FIXED VERSION
+
+        worksheet defaults to self.worksheet - a worker thread passes in its own marshalled proxy of it.
+        """
+        if worksheet is None:
+            worksheet = self.worksheet
+        if not worksheet or self.selected_column_index is None:
             return 0
         
         try:
-            used_range = self.worksheet.UsedRange
+            used_range = worksheet.UsedRange
             total_rows = used_range.Rows.Count
             
-            print(f"\n=== EXCEL PROCESSING DEBUG ===")
-            print(f"Processing column {self.selected_column_letter} in {self.mode} mode")
-            print(f"Excel file: {self.excel_file_path}")
-            print(f"Target folder: {self.target_folder}")
-            print(f"Excel UsedRange reports {total_rows} total rows")
+            logger.debug("=== EXCEL PROCESSING DEBUG ===")
+            logger.debug("Processing column %s in %s mode", self.selected_column_letter, self.mode)
+            logger.debug("Excel file: %s", self.excel_file_path)
+            logger.debug("Target folder: %s", self.target_folder)
+            logger.debug("Excel UsedRange reports %s total rows", total_rows)
+            
+            # Scan the exhibit folder once for this run (files may have been renamed since the last one)
+            if self.mode != "bates":
+                self._rebuild_exhibit_index()
+            
+            # Hyperlink base directory is the same for every row
+            if self.excel_file_path:
+                self._cache_excel_dir()
             
             # Check beyond UsedRange to catch data Excel might miss
             extended_check_rows = max(total_rows + 10, 50)
             actual_last_row = total_rows
             
-            print(f"Checking extended range up to row {extended_check_rows} to find actual data...")
+            logger.debug("Checking extended range up to row %s to find actual data...", extended_check_rows)
+            
+            # Read the whole column in ONE COM call - per-cell Cells(row, col).Value round-trips dominate on big sheets
+            # column_values[row - 1] is the value of the cell in that row
+            col = self.selected_column_index
+            try:
+                column_range = worksheet.Range(worksheet.Cells(1, col), worksheet.Cells(extended_check_rows, col))
+                column_values = [row_values[0] for row_values in column_range.Value]
+            except Exception as e:
+                # Fall back to the slow per-cell reads rather than silently processing no rows
+                logger.warning("Bulk read of column values failed (%s) - reading cell by cell", e)
+                column_values = []
+                for row in range(1, extended_check_rows + 1):
+                    try:
+                        column_values.append(worksheet.Cells(row, col).Value)
+                    except Exception as cell_error:
+                        logger.error("Error reading row %s: %s", row, cell_error)
+                        column_values.append(None)
             
             # Find the real last row with data in our column
-            for check_row in range(1, extended_check_rows + 1):
-                try:
-                    cell = self.worksheet.Cells(check_row, self.selected_column_index)
-                    cell_value = cell.Value
-                    
-                    if cell_value is not None:
-                        cell_text = str(cell_value).strip()
-                        if cell_text and cell_text.lower() not in ['', 'none', 'null', '#n/a', '#value!', '#ref!']:
-                            actual_last_row = max(actual_last_row, check_row)
-                            if check_row > total_rows:
-                                print(f"  Found data in row {check_row}: '{cell_text}' (beyond Excel's UsedRange!)")
-                                
-                except Exception as e:
-                    break
+            for check_row, cell_value in enumerate(column_values, start=1):
+                if cell_value is not None:
+                    cell_text = str(cell_value).strip()
+                    if cell_text and cell_text.lower() not in _EMPTY_SENTINELS:
+                        actual_last_row = max(actual_last_row, check_row)
+                        if check_row > total_rows:
+                            logger.debug("  Found data in row %s: '%s' (beyond Excel's UsedRange!)", check_row, cell_text)
             
-            print(f"Actual last row with data: {actual_last_row}")
-            print(f"Will process rows 2 to {actual_last_row} (skipping header row 1)")
+            logger.debug("Actual last row with data: %s", actual_last_row)
+            logger.debug("Will process rows 2 to %s (skipping header row 1)", actual_last_row)
             
             if actual_last_row < 2:
-                print("No data rows found to process")
+                logger.debug("No data rows found to process")
                 return 0
             
             links_added = 0
             successful_links = []
             failed_links = []
             
-            # Process each row
+            # Process each row (values come from the bulk read; COM is only touched again to write links)
             for row in range(2, actual_last_row + 1):
                 try:
-                    cell = self.worksheet.Cells(row, self.selected_column_index)
-                    cell_value = cell.Value
+                    cell_value = column_values[row - 1] if row <= len(column_values) else None
                     
-                    print(f"\n=== ROW {row} ===")
-                    print(f"Raw cell_value: {repr(cell_value)} (type: {type(cell_value)})")
+                    logger.debug("=== ROW %s ===", row)
+                    logger.debug("Raw cell_value: %r (type: %s)", cell_value, type(cell_value))
                     
                     # Check for various "empty" conditions
                     if cell_value is None:
-                        print(f"Row {row}: SKIPPED - cell_value is None")
-                        continue
-                    
-                    # Convert to string and strip whitespace
-                    cell_text_raw = str(cell_value).strip()
-                    
-                    if not cell_text_raw or cell_text_raw.lower() in ['', 'none', 'null', '#n/a', '#value!', '#ref!']:
-                        print(f"Row {row}: SKIPPED - empty or error value: '{cell_text_raw}'")
+                        logger.debug("Row %s: SKIPPED - cell_value is None", row)
                         continue
                     
-                    # Store original value for display
-                    original_value = cell_text_raw
-                    
-                    # Handle Excel's float conversion (10.0 -> 10) for matching AND display
-                    cell_text = original_value
-                    display_text = original_value  # This will be what shows in the cell
-                    
-                    if cell_text.endswith('.0') and cell_text.replace('.0', '').replace('-', '').isdigit():
-                        cell_text = cell_text.replace('.0', '')
-                        display_text = cell_text  # Use the clean version (10) instead of (10.0)
-                        print(f"Row {row}: Excel float conversion '{original_value}' -> '{cell_text}' (display: '{display_text}')")
-                    
-                    # Also handle the case where Excel gives us a float object directly
-                    if isinstance(cell_value, float) and cell_value == int(cell_value):
-                        display_text = str(int(cell_value))  # Convert 10.0 -> "10"
-                        print(f"Row {row}: Direct float conversion {cell_value} -> display: '{display_text}'")
+                    if isinstance(cell_value, float) and cell_value.is_integer():
+                        # Common case - Excel hands exhibit numbers over as floats (10.0 -> "10" for matching AND display)
+                        cell_text = display_text = str(int(cell_value))
+                        logger.debug("Row %s: Direct float conversion %s -> '%s'", row, cell_value, cell_text)
+                    else:
+                        # Convert to string and strip whitespace
+                        cell_text_raw = str(cell_value).strip()
+                        
+                        if not cell_text_raw or cell_text_raw.lower() in _EMPTY_SENTINELS:
+                            logger.debug("Row %s: SKIPPED - empty or error value: '%s'", row, cell_text_raw)
+                            continue
+                        
+                        # Store original value for display
+                        original_value = cell_text_raw
+                        
+                        # Handle numeric text with a trailing .0 (10.0 -> 10) for matching AND display
+                        cell_text = original_value
+                        display_text = original_value  # This will be what shows in the cell
+                        
+                        if cell_text.endswith('.0') and cell_text.replace('.0', '').replace('-', '').isdigit():
+                            cell_text = cell_text.replace('.0', '')
+                            display_text = cell_text  # Use the clean version (10) instead of (10.0)
+                            logger.debug("Row %s: Excel float conversion '%s' -> '%s' (display: '%s')", row, original_value, cell_text, display_text)
                     
-                    print(f"Row {row}: Processing '{cell_text}'")
+                    logger.debug("Row %s: Processing '%s'", row, cell_text)
 
                     # Find matching files using the converted cell_text
                     matching_files = self.find_matching_files(cell_text)
                     
                     if matching_files:
                         file_info = matching_files[0]
-                        print(f"Row {row}: Found matching file: {file_info}")
+                        logger.debug("Row %s: Found matching file: %s", row, file_info)
+                        cell = worksheet.Cells(row, self.selected_column_index)
                         
                         # Create hyperlink based on mode - FIXED FOR BATES PAGE LINKS
                         if isinstance(file_info, dict) and file_info.get('type') == 'bates':
@@ -2887,116 +3051,55 @@ class ExcelAutoLinker:
                             relative_path = self.get_relative_path_for_excel(target_file)
                             link_target = f"{relative_path}#page={page_number}"
                             screen_tip = f"Bates {file_info['bates_number']} - Page {page_number} of {os.path.basename(target_file)}"
-                            print(f"  Bates link target: {link_target}")
+                            logger.debug("  Bates link target: %s", link_target)
 
                         else:
-
-                            # Check for page number automation first - but only if enabled
-                            exhibit_id = None
-                            page_number = None
-
-                            if self.page_automation_enabled:
-                                page_matches = self.find_page_number_in_text(cell_text)
-                                
-                                # Get the current exhibit ID for comparison
-                                current_exhibit_id = None
-                                for pattern in self.exhibit_patterns:
-                                    match = re.search(pattern, cell_text, re.IGNORECASE)
-                                    if match:
-                                        current_exhibit_id = match.group(1)
-                                        break
-                                
-                                # Find the match that corresponds to our current exhibit
-                                if page_matches and current_exhibit_id:
-                                    for match_exhibit_id, match_page_number, match_obj in page_matches:
-                                        if match_exhibit_id.upper() == current_exhibit_id.upper():
-                                            exhibit_id, page_number = match_exhibit_id, match_page_number
-                                            print(f"  ✓ Found matching exhibit ID: '{exhibit_id}' -> Page {page_number}")
-                                            break
-                                    
-                                    if not exhibit_id:
-                                        print(f"  ✗ No matching exhibit ID found for '{current_exhibit_id}' in page automation")
-
+                            # Page number automation (one pass per row) - (None, None) when disabled or no match
+                            exhibit_id, page_number = self._resolve_page(cell_text)
+                            logger.debug("  Page automation result: exhibit_id='%s', page_number=%s", exhibit_id, page_number)
+                            
+                            target_file = file_info
+                            target_basename = os.path.basename(target_file)
+                            relative_path = self.get_relative_path_for_excel(target_file)
                             
                             if exhibit_id and page_number:
                                 # Page automation mode - link to specific page
-                                target_file = file_info
-                                relative_path = self.get_relative_path_for_excel(target_file)
                                 link_target = f"{relative_path}#page={page_number}"
-                                screen_tip = f"Link to {os.path.basename(target_file)} page {page_number}"
-                                print(f"  Page automation link target: {link_target}")
-
+                                screen_tip = f"Link to {target_basename} page {page_number}"
+                                logger.debug("  Page automation link target: %s", link_target)
                             else:
-                                # Regular exhibit mode
-                                exhibit_id = None
-                                page_number = None
-
-                                # Only check for page automation if it's enabled
-                                if self.page_automation_enabled:
-                                    page_matches = self.find_page_number_in_text(cell_text)
-                                    
-                                    # Get the current exhibit ID for comparison
-                                    current_exhibit_id = None
-                                    for pattern in self.exhibit_patterns:
-                                        match = re.search(pattern, cell_text, re.IGNORECASE)
-                                        if match:
-                                            current_exhibit_id = match.group(1)
-                                            break
-                                    
-                                    # Find the match that corresponds to our current exhibit
-                                    if page_matches and current_exhibit_id:
-                                        for match_exhibit_id, match_page_number, match_obj in page_matches:
-                                            if match_exhibit_id.upper() == current_exhibit_id.upper():
-                                                exhibit_id, page_number = match_exhibit_id, match_page_number
-                                                print(f"  ✓ Found matching exhibit ID: '{exhibit_id}' -> Page {page_number}")
-                                                break
-                                        
-                                        if not exhibit_id:
-                                            print(f"  ✗ No matching exhibit ID found for '{current_exhibit_id}' in page automation")
-                                
-                                print(f"  Page automation result: exhibit_id='{exhibit_id}', page_number={page_number}")
-                                
-                                # Set up paths and targets
-                                target_file = file_info
-                                relative_path = self.get_relative_path_for_excel(target_file)
-                                
-                                if exhibit_id and page_number:
-                                    # Page automation mode - link to specific page
-                                    link_target = f"{relative_path}#page={page_number}"
-                                    screen_tip = f"Link to {os.path.basename(target_file)} page {page_number}"
-                                    print(f"  Page automation link target: {link_target}")
-                                else:
-                                    # Regular exhibit mode - link to file
-                                    link_target = relative_path
-                                    screen_tip = f"Link to {os.path.basename(file_info)}"
-                                    print(f"  Regular exhibit link target: {link_target}")
+                                # Regular exhibit mode - link to file
+                                link_target = relative_path
+                                screen_tip = f"Link to {target_basename}"
+                                logger.debug("  Regular exhibit link target: %s", link_target)
                         
                         # ENHANCED: Create Excel hyperlink with better debugging
                         try:
-                            print(f"  Attempting to create hyperlink:")
-                            print(f"    Cell: {cell.Address}")
-                            print(f"    Target file: {target_file}")
-                            print(f"    Link target: {link_target}")
-                            print(f"    Display text: {display_text}")
-                            print(f"    Screen tip: {screen_tip}")
+                            if logger.isEnabledFor(logging.DEBUG):
+                                logger.debug("  Attempting to create hyperlink:")
+                                logger.debug("    Cell: %s", cell.Address)
+                                logger.debug("    Target file: %s", target_file)
+                                logger.debug("    Link target: %s", link_target)
+                                logger.debug("    Display text: %s", display_text)
+                                logger.debug("    Screen tip: %s", screen_tip)
                             
                             # Remove any existing hyperlinks first
                             if cell.Hyperlinks.Count > 0:
-                                print(f"    Removing {cell.Hyperlinks.Count} existing hyperlinks")
+                                logger.debug("    Removing %s existing hyperlinks", cell.Hyperlinks.Count)
                                 cell.Hyperlinks.Delete()
                             
                             # Try the most reliable method for Excel hyperlinks
                             try:
                                 # Method 1: Use HYPERLINK formula (most reliable)
-                                print(f"    Trying HYPERLINK formula method...")
+                                logger.debug("    Trying HYPERLINK formula method...")
                                 
                                 # Escape quotes and special characters
-                                safe_display = str(display_text).replace('"', '""')
-                                safe_target = str(link_target).replace('"', '""')
+                                safe_display = _excel_quote(display_text)
+                                safe_target = _excel_quote(link_target)
                                 
                                 # Create HYPERLINK formula
                                 hyperlink_formula = f'=HYPERLINK("{safe_target}","{safe_display}")'
-                                print(f"    Formula: {hyperlink_formula}")
+                                logger.debug("    Formula: %s", hyperlink_formula)
 
                                 # Set the formula
                                 cell.Formula = hyperlink_formula
@@ -3006,11 +3109,11 @@ class ExcelAutoLinker:
                                     # Force black color and remove underline after setting formula
                                     cell.Font.Color = 0  # Black
                                     cell.Font.Underline = False  # No underline for black mode
-                                    print(f"    Applied black formatting")
+                                    logger.debug("    Applied black formatting")
                                 else:
-                                    print(f"    Using default hyperlink formatting")
+                                    logger.debug("    Using default hyperlink formatting")
                                 
-                                print(f"    ✓ HYPERLINK formula method succeeded")
+                                logger.debug("    ✓ HYPERLINK formula method succeeded")
                                 links_added += 1
                                 successful_links.append({
                                     'row': row,
@@ -3022,13 +3125,13 @@ class ExcelAutoLinker:
                                 })
                                 
                             except Exception as formula_error:
-                                print(f"    HYPERLINK formula failed: {formula_error}")
+                                logger.warning("    HYPERLINK formula failed: %s", formula_error)
                                 
                                 try:
                                     # Method 2: Traditional Hyperlinks.Add
-                                    print(f"    Trying Hyperlinks.Add method...")
+                                    logger.debug("    Trying Hyperlinks.Add method...")
                                     
-                                    hyperlink = self.worksheet.Hyperlinks.Add(
+                                    hyperlink = worksheet.Hyperlinks.Add(
                                         Anchor=cell,
                                         Address=link_target,
                                         TextToDisplay=display_text,
@@ -3039,9 +3142,9 @@ class ExcelAutoLinker:
                                     if self.use_black_hyperlinks:
                                         cell.Font.Color = 0  # Black
                                         cell.Font.Underline = False  # No underline
-                                        print(f"    Applied black formatting to Hyperlinks.Add method")
+                                        logger.debug("    Applied black formatting to Hyperlinks.Add method")
 
-                                    print(f"    ✓ Hyperlinks.Add method succeeded")
+                                    logger.debug("    ✓ Hyperlinks.Add method succeeded")
                                     links_added += 1
                                     successful_links.append({
                                         'row': row,
@@ -3053,11 +3156,11 @@ class ExcelAutoLinker:
                                     })
                                     
                                 except Exception as add_error:
-                                    print(f"    Hyperlinks.Add failed: {add_error}")
+                                    logger.warning("    Hyperlinks.Add failed: %s", add_error)
                                     
                                     # Method 3: Set value only and log for manual linking
                                     try:
-                                        print(f"    Setting cell value without hyperlink...")
+                                        logger.debug("    Setting cell value without hyperlink...")
                                         cell.Value = display_text
                                         failed_links.append({
                                             'row': row,
@@ -3067,10 +3170,10 @@ class ExcelAutoLinker:
                                             'relative_path': link_target,
                                             'error': str(add_error)
                                         })
-                                        print(f"    Cell value set (no hyperlink created)")
+                                        logger.debug("    Cell value set (no hyperlink created)")
                                         
                                     except Exception as value_error:
-                                        print(f"    Even setting cell value failed: {value_error}")
+                                        logger.error("    Even setting cell value failed: %s", value_error)
                                         failed_links.append({
                                             'row': row,
                                             'cell': cell.Address,
@@ -3081,7 +3184,7 @@ class ExcelAutoLinker:
                                         })
                             
                         except Exception as e:
-                            print(f"  ✗ Error creating hyperlink for '{cell_text}': {e}")
+                            logger.error("  ✗ Error creating hyperlink for '%s': %s", cell_text, e)
                             failed_links.append({
                                 'row': row,
                                 'cell': cell.Address,
@@ -3090,36 +3193,48 @@ class ExcelAutoLinker:
                                 'error': str(e)
                             })
                     else:
-                        print(f"  ✗ No match found for '{cell_text}'")
+                        logger.debug("  ✗ No match found for '%s'", cell_text)
                     
                 except Exception as e:
-                    print(f"Error processing row {row}: {e}")
+                    logger.error("Error processing row %s: %s", row, e)
                     continue
             
             # Summary report
-            print(f"\n=== PROCESSING SUMMARY ===")
-            print(f"Total hyperlinks created: {links_added}")
-            print(f"Successful links: {len(successful_links)}")
-            print(f"Failed links: {len(failed_links)}")
+            logger.info(
+                "Excel column %s: %d hyperlinks created, %d failed (rows 2-%d)",
+                self.selected_column_letter, links_added, len(failed_links), actual_last_row
+            )
             
-            if successful_links:
-                print(f"\nSuccessful hyperlinks:")
-                for link in successful_links:
-                    print(f"  Row {link['row']}: '{link['text']}' -> {link['relative_path']} ({link['method']})")
+            # Per-link detail only in debug runs - built into one message instead of a log call per link
+            if successful_links and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Successful hyperlinks:\n%s", "\n".join(
+                    f"  Row {link['row']}: '{link['text']}' -> {link['relative_path']} ({link['method']})"
+                    for link in successful_links
+                ))
             
-            if failed_links:
-                print(f"\nFailed hyperlinks:")
-                for link in failed_links:
-                    print(f"  Row {link['row']}: '{link['text']}' -> {link.get('relative_path', 'unknown')} (Error: {link['error']})")
+            if failed_links and logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Failed hyperlinks:\n%s", "\n".join(
+                    f"  Row {link['row']}: '{link['text']}' -> {link.get('relative_path', 'unknown')} (Error: {link['error']})"
+                    for link in failed_links
+                ))
             
             return links_added
             
         except Exception as e:
-            print(f"Error in process_excel_column: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error in process_excel_column (column %s): %s", self.selected_column_letter, e)
             return 0
 
+    def export_workbook_pdf(self, pdf_path):
+        """Export the workbook to pdf_path with ExportAsFixedFormat"""
+        self.workbook.ExportAsFixedFormat(
+            Type=0,  # xlTypePDF
+            Filename=pdf_path,
+            Quality=0,  # xlQualityStandard
+            IncludeDocProperties=True,
+            IgnorePrintAreas=False,
+            OpenAfterPublish=False
+        )
+
     def save_excel_with_links(self, output_path=None):
         """Save Excel file with hyperlinks and export to PDF - ENHANCED CLEANUP VERSION"""
         if not self.workbook or not self.excel_file_path:
@@ -3128,17 +3243,16 @@ class ExcelAutoLinker:
         try:
             if not output_path:
                 # Generate default names
-                original_dir = os.path.dirname(self.original_excel_path) if hasattr(self, 'original_excel_path') else os.path.dirname(self.excel_file_path)
-                original_name = os.path.basename(self.original_excel_path) if hasattr(self, 'original_excel_path') else os.path.basename(self.excel_file_path)
-                name_without_ext = os.path.splitext(original_name)[0]
-                ext = os.path.splitext(original_name)[1]
+                src_path = getattr(self, 'original_excel_path', None) or self.excel_file_path
+                original_dir, original_name = os.path.split(src_path)
+                name_without_ext, ext = os.path.splitext(original_name)
                 
                 mode_suffix = "_with_bates_links" if self.mode == "bates" else "_with_exhibit_links"
                 default_excel_name = f"{name_without_ext}{mode_suffix}{ext}"
                 default_pdf_name = f"{name_without_ext}{mode_suffix}.pdf"
                 
-                print(f"Default save location: {original_dir}")
-                print(f"Default Excel name: {default_excel_name}")
+                logger.debug("Default save location: %s", original_dir)
+                logger.debug("Default Excel name: %s", default_excel_name)
                 
                 # Ask user where to save Excel file
                 from tkinter import filedialog
@@ -3151,100 +3265,107 @@ class ExcelAutoLinker:
                 )
                 
                 if not excel_output:
-                    print("User cancelled Excel save")
+                    logger.info("User cancelled Excel save")
                     return False, False
                 
+                excel_output_dir = os.path.dirname(excel_output)
+                
                 # Ask user where to save PDF
-                pdf_dir = os.path.dirname(excel_output)
                 pdf_output = filedialog.asksaveasfilename(
                     title="Save PDF Export",
                     defaultextension=".pdf",
                     filetypes=[("PDF files", "*.pdf"), ("All files", "*.*")],
-                    initialdir=pdf_dir,
+                    initialdir=excel_output_dir,
                     initialfile=default_pdf_name
                 )
                 
                 if not pdf_output:
-                    print("User cancelled PDF save")
+                    logger.info("User cancelled PDF save")
                     return False, False
                         
             else:
                 excel_output = output_path
                 pdf_output = output_path.replace('.xlsx', '.pdf').replace('.xls', '.pdf')
+                excel_output_dir = os.path.dirname(excel_output)
+            
+            # Output directories are split off once and reused below
+            pdf_output_dir = os.path.dirname(pdf_output)
             
-            print(f"Attempting to save Excel to: {excel_output}")
-            print(f"Attempting to save PDF to: {pdf_output}")
+            logger.debug("Attempting to save Excel to: %s", excel_output)
+            logger.debug("Attempting to save PDF to: %s", pdf_output)
             
             # Save Excel with links
             excel_saved = False
+            excel_move_future = None
             
             try:
-                print("Attempting to save Excel file using temp method...")
-                
-                # Create temp file
-                temp_dir = tempfile.gettempdir()
-                temp_filename = f"excel_temp_{int(time.time())}.xlsx"
-                temp_path = os.path.join(temp_dir, temp_filename)
-                
-                print(f"Saving to temp file: {temp_path}")
-                
-                # Save to temp location
-                self.workbook.SaveAs(temp_path, FileFormat=51)  # 51 = xlOpenXMLWorkbook
-                print("Temp file saved successfully")
-                
-                # Verify temp file exists
-                if not os.path.exists(temp_path):
-                    raise Exception("Temp file was not created")
-                
-                # Copy from temp to final location
-                print(f"Copying from temp to final location: {excel_output}")
-                
                 # Make sure target directory exists
-                os.makedirs(os.path.dirname(excel_output), exist_ok=True)
-                
-                # Copy the file
-                shutil.copy2(temp_path, excel_output)
-                
-                # Verify final file exists
-                if not os.path.exists(excel_output):
-                    raise Exception("Final file was not created")
-                
-                print("Excel file saved successfully")
-                
-                # Clean up temp file
-                try:
-                    os.remove(temp_path)
-                    print("Temp file cleaned up")
-                except:
-                    print("Could not clean up temp file (not critical)")
+                _fast_makedirs(excel_output_dir)
                 
+                saved_direct = False
+                if os.access(excel_output_dir, os.W_OK):
+                    # Save straight to the destination - no temp file + copy round-trip
+                    try:
+                        logger.debug("Saving Excel file directly to final location...")
+                        self.workbook.SaveAs(excel_output, FileFormat=51)  # 51 = xlOpenXMLWorkbook
+                        saved_direct = True
+                    except Exception as direct_error:
+                        logger.warning("Direct save failed (%s), falling back to temp method", direct_error)
+                
+                if not saved_direct:
+                    logger.debug("Attempting to save Excel file using temp method...")
+                    
+                    # Create temp file
+                    temp_dir = tempfile.gettempdir()
+                    temp_filename = f"excel_temp_{int(time.time())}.xlsx"
+                    temp_path = os.path.join(temp_dir, temp_filename)
+                    
+                    logger.debug("Saving to temp file: %s", temp_path)
+                    
+                    # Save to temp location
+                    self.workbook.SaveAs(temp_path, FileFormat=51)  # 51 = xlOpenXMLWorkbook
+                    logger.debug("Temp file saved successfully")
+                    
+                    # Move from temp to final location on a worker thread - plain file I/O (no COM),
+                    # so it overlaps with the PDF export below and is joined before returning
+                    logger.debug("Moving from temp to final location: %s", excel_output)
+                    move_pool = ThreadPoolExecutor(max_workers=1)
+                    excel_move_future = move_pool.submit(_move_output_file, temp_path, excel_output)
+                    move_pool.shutdown(wait=False)
+                else:
+                    logger.info("Excel file saved successfully")
                 excel_saved = True
                 
             except Exception as e:
-                print(f"Excel save failed: {e}")
+                logger.error("Excel save failed: %s", e)
                 excel_saved = False
 
             # Export to PDF
-            print(f"Attempting to export PDF: {pdf_output}")
+            logger.debug("Attempting to export PDF: %s", pdf_output)
             pdf_saved = False
             
             try:
                 # Make sure target directory exists
-                os.makedirs(os.path.dirname(pdf_output), exist_ok=True)
+                _fast_makedirs(pdf_output_dir)
                 
                 # Remove existing PDF if it exists
-                if os.path.exists(pdf_output):
+                try:
                     os.remove(pdf_output)
+                except FileNotFoundError:
+                    pass
                 
-                # Export to PDF using temp method
-                temp_pdf_dir = tempfile.gettempdir()
-                temp_pdf_name = f"excel_pdf_{int(time.time())}.pdf"
-                temp_pdf_path = os.path.join(temp_pdf_dir, temp_pdf_name)
+                # LANDSCAPE: Set page setup for landscape and fit-to-page before exporting
+                logger.debug("Configuring page setup for landscape and fit-to-page...")
                 
-                print(f"Exporting to temp PDF: {temp_pdf_path}")
+                # Hold back printer-driver communication so Excel applies the PageSetup
+                # changes in one batch instead of one driver round-trip per property
+                print_communication_off = False
+                try:
+                    self.excel_app.PrintCommunication = False
+                    print_communication_off = True
+                except:
+                    pass  # Not available before Excel 2010
                 
-                # LANDSCAPE: Set page setup for landscape and fit-to-page before exporting
-                print("Configuring page setup for landscape and fit-to-page...")
                 try:
                     # Configure the active worksheet's page setup
                     page_setup = self.worksheet.PageSetup
@@ -3269,140 +3390,187 @@ class ExcelAutoLinker:
                     page_setup.TopMargin = 54    # 0.75 inch
                     page_setup.BottomMargin = 54 # 0.75 inch
                     
-                    print("✓ Page setup configured: Landscape, fit all columns to width")
+                    logger.debug("✓ Page setup configured: Landscape, fit all columns to width")
                     
                 except Exception as setup_error:
-                    print(f"Warning: Could not configure page setup: {setup_error}")
-                    print("PDF will use default settings")
-                
-                # Use ExportAsFixedFormat with enhanced settings
-                self.workbook.ExportAsFixedFormat(
-                    Type=0,  # xlTypePDF
-                    Filename=temp_pdf_path,
-                    Quality=0,  # xlQualityStandard
-                    IncludeDocProperties=True,
-                    IgnorePrintAreas=False,
-                    OpenAfterPublish=False
-                )
-                
-                print("Temp PDF created successfully")
-                
-                # Verify temp PDF exists
-                if not os.path.exists(temp_pdf_path):
-                    raise Exception("Temp PDF was not created")
-                
-                # Copy to final location
-                print(f"Copying PDF from temp to final location: {pdf_output}")
-                shutil.copy2(temp_pdf_path, pdf_output)
-                
-                # Verify final PDF exists
-                if not os.path.exists(pdf_output):
-                    raise Exception("Final PDF was not created")
-                
-                print("PDF export completed successfully")
+                    logger.warning("Warning: Could not configure page setup: %s", setup_error)
+                    logger.warning("PDF will use default settings")
+                finally:
+                    if print_communication_off:
+                        try:
+                            self.excel_app.PrintCommunication = True  # Commits the batched settings
+                        except Exception as e:
+                            logger.warning("Warning: Could not re-enable print communication: %s", e)
                 
-                # Clean up temp PDF
-                try:
-                    os.remove(temp_pdf_path)
-                    print("Temp PDF cleaned up")
-                except:
-                    print("Could not clean up temp PDF (not critical)")
+                exported_direct = False
+                if os.access(pdf_output_dir, os.W_OK):
+                    # Export straight to the destination - no temp file + copy round-trip
+                    try:
+                        logger.debug("Exporting PDF directly to: %s", pdf_output)
+                        self.export_workbook_pdf(pdf_output)
+                        exported_direct = True
+                    except Exception as direct_error:
+                        logger.warning("Direct PDF export failed (%s), falling back to temp method", direct_error)
+                
+                if not exported_direct:
+                    # Export to PDF using temp method
+                    temp_pdf_dir = tempfile.gettempdir()
+                    temp_pdf_name = f"excel_pdf_{int(time.time())}.pdf"
+                    temp_pdf_path = os.path.join(temp_pdf_dir, temp_pdf_name)
+                    
+                    logger.debug("Exporting to temp PDF: %s", temp_pdf_path)
+                    self.export_workbook_pdf(temp_pdf_path)
+                    logger.debug("Temp PDF created successfully")
+                    
+                    # Move to final location
+                    logger.debug("Moving PDF from temp to final location: %s", pdf_output)
+                    _move_output_file(temp_pdf_path, pdf_output)
                 
+                logger.info("PDF export completed successfully")
                 pdf_saved = True
                 
             except Exception as e:
-                print(f"PDF export failed: {e}")
+                logger.error("PDF export failed: %s", e)
                 pdf_saved = False
+            
+            # Join the background Excel move (temp method only)
+            if excel_move_future is not None:
+                try:
+                    excel_move_future.result()
+                    logger.info("Excel file saved successfully")
+                except Exception as e:
+                    logger.error("Excel save failed: %s", e)
+                    excel_saved = False
                 
             return excel_saved, pdf_saved
             
         except Exception as e:
-            print(f"Error in save_excel_with_links: {e}")
+            logger.error("Error in save_excel_with_links: %s", e)
             return False, False
 
     def cleanup(self):
         """Clean up Excel COM objects and remove working copy file"""
         try:
-            print("Starting Excel cleanup...")
+            logger.debug("Starting Excel cleanup...")
             
             # Store working copy path before closing
             working_copy_to_delete = None
             if hasattr(self, 'working_copy_path') and self.working_copy_path:
                 working_copy_to_delete = self.working_copy_path
-                print(f"Will delete working copy: {working_copy_to_delete}")
+                logger.debug("Will delete working copy: %s", working_copy_to_delete)
+            
+            # Restore calculation mode while a workbook is still open (Excel rejects it otherwise)
+            if self.excel_app:
+                self.restore_calculation()
             
             # Close workbook first
             if self.workbook:
                 try:
                     workbook_name = self.workbook.Name
-                    print(f"Closing workbook: {workbook_name}")
+                    logger.debug("Closing workbook: %s", workbook_name)
                     self.workbook.Close(SaveChanges=False)
-                    print("Workbook closed successfully")
+                    logger.debug("Workbook closed successfully")
                 except Exception as e:
-                    print(f"Error closing workbook: {e}")
+                    logger.error("Error closing workbook: %s", e)
                 finally:
                     self.workbook = None
             
             # Quit Excel application
             if self.excel_app:
                 try:
-                    # Re-enable settings before quitting
-                    self.excel_app.ScreenUpdating = True
-                    self.excel_app.EnableEvents = True
+                    # No ScreenUpdating/EnableEvents restore here - Quit() discards them anyway
                     
                     # Close any remaining workbooks
                     while self.excel_app.Workbooks.Count > 0:
                         try:
                             wb = self.excel_app.Workbooks(1)
                             wb_name = wb.Name
-                            print(f"Force closing: {wb_name}")
+                            logger.debug("Force closing: %s", wb_name)
                             wb.Close(SaveChanges=False)
                         except Exception as e:
-                            print(f"Error force closing workbook: {e}")
+                            logger.error("Error force closing workbook: %s", e)
                             break
                     
-                    print("Quitting Excel application...")
+                    logger.debug("Quitting Excel application...")
                     self.excel_app.Quit()
-                    print("Excel quit successfully")
+                    logger.debug("Excel quit successfully")
                     
                 except Exception as e:
-                    print(f"Error quitting Excel: {e}")
+                    logger.error("Error quitting Excel: %s", e)
+                    # Excel may outlive us - hand it back with the UI settings switched on again
+                    try:
+                        self.excel_app.ScreenUpdating = True
+                        self.excel_app.EnableEvents = True
+                    except Exception:
+                        pass
                 finally:
                     self.excel_app = None
             
-            # Force COM cleanup
-            import gc
-            gc.collect()
+            # Drop the last sheet proxy too - refcounting releases the COM objects
+            # synchronously, so no full gc.collect() sweep of the process is needed
+            self.worksheet = None
             
             try:
                 pythoncom.CoUninitialize()
-                print("COM uninitialized")
+                logger.debug("COM uninitialized")
             except Exception as e:
-                print(f"Error uninitializing COM: {e}")
+                logger.error("Error uninitializing COM: %s", e)
             
             # CRITICAL FIX: Delete the working copy file after Excel is closed
             if working_copy_to_delete and os.path.exists(working_copy_to_delete):
-                try:
-                    print(f"Deleting working copy file: {working_copy_to_delete}")
-                    
-                    # Wait a moment for Excel to fully release the file
-                    import time
-                    time.sleep(1)
-                    
-                    # Try to delete the file
-                    os.remove(working_copy_to_delete)
-                    print("✓ Working copy file deleted successfully")
-                    
-                except Exception as e:
-                    print(f"✗ Could not delete working copy file: {e}")
-                    print("You may need to delete it manually")
+                logger.debug("Deleting working copy file: %s", working_copy_to_delete)
+                
+                last_error = _remove_with_retry(working_copy_to_delete)
+                if last_error:
+                    logger.error("✗ Could not delete working copy file: %s", last_error)
+                    logger.warning("You may need to delete it manually")
+                else:
+                    logger.debug("✓ Working copy file deleted successfully")
             
-            print("Excel cleanup completed")
+            logger.info("Excel cleanup completed")
             
         except Exception as e:
-            print(f"Error during cleanup: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.exception("Error during cleanup: %s", e)
+
+# Help dialog text - focused on link types
+_HELP_CONTENT = """Relative Hyperlinks: These hyperlinks will work if the file is brought to another location/PC so long as the PDF and linked files are in the same relative orientation. E.g., if your PDF with hyperlinks is in a folder called "Memo" and the exhibits are in the "Exhibits" subfolder thereof, so long as that basic orientation is retained, the linking should remain. As such, these hyperlinks are ideal if you are sending your files along to another individual.
+
+Page Citations: This script can create citations to page numbers (be it via the Page Citation or Bates stamp functions) in output PDF and Excel files.  The links will bring you to the correct page if opened via Chrome or most other browsers.  Acrobat, however, is incompatible with page linking so a specific page hyperlink opened via Acrobat will simply bring you to page 1 of the operative exhibit.  Note also that page citation mode only works with convention page numbers (e.g., page 1 or p. 55) and not alphaneumeric descriptors like JOHN_005.
+
+Filenames:  If you are linking to files in the same  folder as the "parent" document, you should process the filenames which will replace periods/spaces with underscores.  This ensures compatability with browser PDF viewers which can misinterpret hyperlinks otherwise.  If the exhibits are in a subfolder, however, there should be no need to process the filenames.
+
+Word:  The PDF output by this script will work out of the box.  However, if you add links to your Word document and wish to make further modifications and then save your Word document as a PDF, you should use Word's Save As feature and save as PDF.  Do not use Save as Adobe PDF or Print to PDF as they can strip away hyperlink functionality. 
+
+File Linking:  Linking is done by searching for specific terms in the document. For example, if you have a Word document with references like 'Ex. 1', 'Exhibit A', or Bates numbers like 'SMITH_011', the script will automatically convert these into clickable hyperlinks that point to the corresponding files in the same folder.  For exhibits, this can include longer file names, so, e.g., a cite to Ex. 55 would link to both Ex. 55.pdf and Ex. 55 Letter to the Court.pdf"""
+
+# Character ranges of the help section headers, bolded in show_help_popup - found once at import
+_HELP_BOLD_RANGES = tuple(
+    (match.start(), match.end())
+    for match in re.finditer(
+        "|".join(map(re.escape, ("Relative Hyperlinks:", "Page Citations:", "File Linking:", "Filenames:", "Word:"))),
+        _HELP_CONTENT
+    )
+)
+
+# Main-window controls that are disabled while a document is processed on its worker thread
+_RUN_LOCKED_WIDGETS = (ttk.Button, ttk.Checkbutton, ttk.Radiobutton, ttk.Entry)
+
+# "JOB COMPLETE!" console art - written in one print after a successful run
+_JOB_COMPLETE_BANNER = """
+
+     ██╗ ██████╗ ██████╗      ██████╗ ██████╗ ███╗   ███╗██████╗ ██╗     ███████╗████████╗███████╗██╗
+     ██║██╔═══██╗██╔══██╗    ██╔════╝██╔═══██╗████╗ ████║██╔══██╗██║     ██╔════╝╚══██╔══╝██╔════╝██║
+     ██║██║   ██║██████╔╝    ██║     ██║   ██║██╔████╔██║██████╔╝██║     █████╗     ██║   █████╗  ██║
+██   ██║██║   ██║██╔══██╗    ██║     ██║   ██║██║╚██╔╝██║██╔═══╝ ██║     ██╔══╝     ██║   ██╔══╝  ╚═╝
+╚█████╔╝╚██████╔╝██████╔╝    ╚██████╗╚██████╔╝██║ ╚═╝ ██║██║     ███████╗███████╗   ██║   ███████╗██╗
+ ╚════╝  ╚═════╝ ╚═════╝      ╚═════╝ ╚═════╝ ╚═╝     ╚═╝╚═╝     ╚══════╝╚══════╝   ╚═╝   ╚══════╝╚═╝
+"""
+
+# Progress dialog percent label text, built once instead of formatted on every tick
+_PERCENT_TEXT = tuple(f"{i}%" for i in range(101))
+
+def _ignore_close():
+    """WM_DELETE_WINDOW handler for dialogs the user must not close"""
 
 class ExhibitAnchorApp:
     def __init__(self):
@@ -3413,7 +3581,10 @@ class ExhibitAnchorApp:
             try:
                 icon_path = os.path.join(os.path.dirname(__file__), "images", "icon.ico")
                 if os.path.exists(icon_path):
-                    self.root.iconbitmap(icon_path)
+                    # PERFORMANCE: Register the icon as the Tk default once - every Toplevel
+                    # (preview, help, column and progress dialogs) inherits it without
+                    # re-reading and re-decoding the .ico file on each open
+                    self.root.iconbitmap(default=icon_path)
                     self.icon_path = icon_path  # Store for use in other windows
                 else:
                     self.icon_path = None
@@ -3422,8 +3593,9 @@ class ExhibitAnchorApp:
                 self.icon_path = None
             
             # DYNAMIC SIZING: Detect screen resolution and set appropriate window size
-            screen_width = self.root.winfo_screenwidth()
-            screen_height = self.root.winfo_screenheight()
+            # (queried once - center_window and the dialogs reuse it)
+            self._screen_wh = (self.root.winfo_screenwidth(), self.root.winfo_screenheight())
+            screen_width, screen_height = self._screen_wh
             
             # Calculate window size based on screen resolution
             if screen_width <= 1366:  # Small/laptop screens
@@ -3469,7 +3641,24 @@ class ExhibitAnchorApp:
             self.word_submode_var = tk.StringVar(value="exhibit")  
             self.doc_path = tk.StringVar(value="No document selected")
             self.folder_path = tk.StringVar(value="No folder selected")
-            self.status_text = tk.StringVar(value="Ready to process documents")
+            # Status messages are coalesced - see _set_status. The status label is display-only,
+            # so _flush_status writes its text directly instead of going through a StringVar
+            self._pending_status = None
+            self._last_status = "Ready to process documents"
+            self._status_flush_scheduled = False
+            
+            # ttk style names resolved from bootstyle strings - see _styled
+            self._style_names = {}
+            
+            # Shared fonts for the main window - one Tk font each instead of a tuple parsed per widget
+            self.fonts = {
+                'label': tkfont.Font(family="Helvetica", size=self.get_responsive_font_size(10), weight="bold"),
+                'value': tkfont.Font(family="Helvetica", size=self.get_responsive_font_size(9)),
+                'bold10': tkfont.Font(family="Helvetica", size=10, weight="bold"),
+                'bold9': tkfont.Font(family="Helvetica", size=9, weight="bold"),
+                'small9': tkfont.Font(family="Helvetica", size=9),
+                'small8': tkfont.Font(family="Helvetica", size=8),
+            }
             
             # Mode-specific variables
             self.bates_prefix_var = tk.StringVar()
@@ -3479,29 +3668,67 @@ class ExhibitAnchorApp:
             self.page_automation_var = tk.BooleanVar(value=False)
             self.exemplary_citation_var = tk.StringVar()
             self.exemplary_page_var = tk.StringVar()
-
-            self.info_text_var = tk.StringVar()
             
-            # Dynamic UI elements (will be created as needed)
+            # Dynamic UI elements (will be created as needed) - None until create_widgets builds them,
+            # so the mode callbacks can test "is not None" instead of hasattr
             self.bates_prefix_frame = None
             self.excel_controls_frame = None
             self.column_selection_frame = None
+            self.word_controls_frame = None
+            self.word_bates_frame = None
+            self.excel_bates_frame = None
+            self.excel_column_frame = None
+            self.excel_separator_frame = None
+            self.page_auto_check = None
+            self.page_automation_frame = None
+            self.citation_entry = None
+            self.page_entry = None
+            self.info_text = None
+            self.status_label = None
+            
+            # File renamer preview dialog - built on first use, then withdrawn and reused
+            self._renamer_dialog = None
+            self._renamer_widgets = None
+            # Dry-run results per folder, keyed by the folder's mtime (any add/rename bumps it)
+            self._renamer_cache = {}
+            # True while a rename runs on its worker thread
+            self._rename_in_progress = False
+            # True while a Word/Excel document is processed on its worker thread - see _begin_processing
+            self._processing_in_progress = False
+            self._disabled_controls = []
+            # Help dialog - static content, so it is built once and withdrawn/deiconified after that
+            self._help_dialog = None
+            # Progress dialog - built on the first run, withdrawn between runs
+            self._progress_dialog = None
             
             self.create_widgets()
             
             # Cleanup on close
             self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
   
+    def _set_status(self, message):
+        """Queue a status bar message - only the last one set before the next idle cycle is written to Tk"""
+        self._pending_status = message
+        if not self._status_flush_scheduled:
+            self._status_flush_scheduled = True
+            self.root.after_idle(self._flush_status)
+
+    def _flush_status(self):
+        """Write the latest queued status message (skipped if unchanged)"""
+        self._status_flush_scheduled = False
+        if self._pending_status != self._last_status:
+            self._last_status = self._pending_status
+            if self.status_label is not None:
+                self.status_label.configure(text=self._pending_status)
+
     def center_window(self):
         """Center the window on the screen with dynamic sizing"""
-        self.root.update_idletasks()
+        screen_width, screen_height = self._screen_wh
         
-        screen_width = self.root.winfo_screenwidth()
-        screen_height = self.root.winfo_screenheight()
-        
-        # Get actual window size (might be different from requested if screen is small)
-        window_width = self.root.winfo_width()
-        window_height = self.root.winfo_height()
+        # Use the size we just requested - it is already clamped to the screen in __init__,
+        # so there is no need for an update_idletasks() layout pass to read it back
+        window_width = self.window_width
+        window_height = self.window_height
         
         x = (screen_width - window_width) // 2
         y = (screen_height - window_height) // 2
@@ -3538,9 +3765,9 @@ class ExhibitAnchorApp:
         mode = self.processing_mode.get()
         
         # Hide all dynamic controls first
-        if hasattr(self, 'word_controls_frame') and self.word_controls_frame:
+        if self.word_controls_frame is not None:
             self.word_controls_frame.pack_forget()
-        if hasattr(self, 'excel_controls_frame') and self.excel_controls_frame:
+        if self.excel_controls_frame is not None:
             self.excel_controls_frame.pack_forget()
         
         # Update UI based on mode
@@ -3551,34 +3778,36 @@ class ExhibitAnchorApp:
             self.word_controls_frame.pack(fill=X, pady=(5, 0))
             
             # Hide Excel column selection
-            if hasattr(self, 'excel_column_frame'):
+            if self.excel_column_frame is not None:
                 if self.is_small_screen:
                     self.excel_column_frame.pack_forget()
                 else:
-                    if hasattr(self, 'excel_separator_frame'):
+                    if self.excel_separator_frame is not None:
                         self.excel_separator_frame.grid_forget()
                     self.excel_column_frame.grid_forget()
             
             self.on_word_submode_changed()
-            self.status_text.set("Ready to process Word document")
+            self._set_status("Ready to process Word document")
             
         elif mode == "excel":
             self.step1_frame.config(text="Step 1: Select Excel File & Column")
             self.doc_label_text.config(text="Selected Excel File:")
             self.browse_doc_button.config(text="Browse Excel File")
+            if self.excel_controls_frame is None:
+                self.create_excel_controls()  # Built the first time Excel mode is picked
             self.excel_controls_frame.pack(fill=X, pady=(5, 0))
             
             # Show column selection
-            if hasattr(self, 'excel_column_frame'):
+            if self.excel_column_frame is not None:
                 if self.is_small_screen:
                     self.excel_column_frame.pack(fill=X, pady=(10, 0))
                 else:
-                    if hasattr(self, 'excel_separator_frame'):
+                    if self.excel_separator_frame is not None:
                         self.excel_separator_frame.grid(row=0, column=1, sticky="ns", padx=(10, 10))
                     self.excel_column_frame.grid(row=0, column=2, sticky="nw", padx=(10, 0))
             
             self.on_excel_submode_changed()
-            self.status_text.set("Ready to process Excel file")
+            self._set_status("Ready to process Excel file")
         
         # Update info text and reset file selection
         self.update_info_text()
@@ -3592,21 +3821,21 @@ class ExhibitAnchorApp:
         submode = self.word_submode_var.get()
         
         if submode == "bates":
-            if hasattr(self, 'word_bates_frame'):
+            if self.word_bates_frame is not None:
                 self.word_bates_frame.pack(fill=X, pady=(5, 0))
             # Hide page automation in Bates mode
-            if hasattr(self, 'page_auto_check'):
-                self.page_auto_check.pack_forget()
-            if hasattr(self, 'page_automation_frame'):
-                self.page_automation_frame.pack_forget()
+            if self.page_auto_check is not None:
+                self.page_auto_check.grid_remove()
+            if self.page_automation_frame is not None:
+                self.page_automation_frame.grid_remove()
         else:
-            if hasattr(self, 'word_bates_frame'):
+            if self.word_bates_frame is not None:
                 self.word_bates_frame.pack_forget()
-            # Show page automation in Exhibit mode
-            if hasattr(self, 'page_auto_check'):
-                self.page_auto_check.pack(anchor='w', pady=(2, 0))
-            if hasattr(self, 'page_automation_frame'):
-                self.page_automation_frame.pack(fill=X, pady=(5, 0))
+            # Show page automation in Exhibit mode (grid_remove kept their cells)
+            if self.page_auto_check is not None:
+                self.page_auto_check.grid()
+            if self.page_automation_frame is not None:
+                self.page_automation_frame.grid()
         
         self.update_info_text()        
 
@@ -3618,21 +3847,21 @@ class ExhibitAnchorApp:
         submode = self.excel_submode_var.get()
         
         if submode == "bates":
-            if hasattr(self, 'excel_bates_frame'):
+            if self.excel_bates_frame is not None:
                 self.excel_bates_frame.pack(fill=X, pady=(5, 0))
             # Hide page automation in Bates mode
-            if hasattr(self, 'page_auto_check'):
-                self.page_auto_check.pack_forget()
-            if hasattr(self, 'page_automation_frame'):
-                self.page_automation_frame.pack_forget()
+            if self.page_auto_check is not None:
+                self.page_auto_check.grid_remove()
+            if self.page_automation_frame is not None:
+                self.page_automation_frame.grid_remove()
         else:
-            if hasattr(self, 'excel_bates_frame'):
+            if self.excel_bates_frame is not None:
                 self.excel_bates_frame.pack_forget()
-            # Show page automation in Exhibit mode
-            if hasattr(self, 'page_auto_check'):
-                self.page_auto_check.pack(anchor='w', pady=(2, 0))
-            if hasattr(self, 'page_automation_frame'):
-                self.page_automation_frame.pack(fill=X, pady=(5, 0))
+            # Show page automation in Exhibit mode (grid_remove kept their cells)
+            if self.page_auto_check is not None:
+                self.page_auto_check.grid()
+            if self.page_automation_frame is not None:
+                self.page_automation_frame.grid()
         
         self.update_info_text()
 
@@ -3641,29 +3870,70 @@ class ExhibitAnchorApp:
         prefix = self.bates_prefix_var.get().strip()
         if prefix:
             if self.processing_mode.get() == "word_bates":
-                self.status_text.set(f"Word/Bates mode with prefix: '{prefix}'")
+                self._set_status(f"Word/Bates mode with prefix: '{prefix}'")
             elif self.processing_mode.get() == "excel" and self.excel_submode_var.get() == "bates":
-                self.status_text.set(f"Excel/Bates mode with prefix: '{prefix}'")
+                self._set_status(f"Excel/Bates mode with prefix: '{prefix}'")
 
     def on_page_automation_toggled(self):
         """Handle page automation toggle - controls enablement, not visibility"""
         if self.page_automation_var.get():
+            if self.citation_entry is None:
+                self._build_page_automation_widgets()
             # Enable the controls
-            if hasattr(self, 'citation_entry'):
+            if self.citation_entry is not None:
                 self.citation_entry.config(state='normal')
-            if hasattr(self, 'page_entry'):
+            if self.page_entry is not None:
                 self.page_entry.config(state='normal')
-            self.status_text.set("Page automation enabled - enter exemplary citation and page number")
+            self._set_status("Page automation enabled - enter exemplary citation and page number")
         else:
             # Disable the controls but keep them visible
-            if hasattr(self, 'citation_entry'):
+            if self.citation_entry is not None:
                 self.citation_entry.config(state='disabled')
-            if hasattr(self, 'page_entry'):
+            if self.page_entry is not None:
                 self.page_entry.config(state='disabled')
-            self.status_text.set("Page automation disabled")
+            self._set_status("Page automation disabled")
+
+    def _build_page_automation_widgets(self):
+        """Create the example citation and page number entries inside page_automation_frame (first enable only)"""
+        # Gridded straight into page_automation_frame - no per-row wrapper frames
+        frame = self.page_automation_frame
+        frame.grid_columnconfigure(2, weight=1)
+        
+        # Exemplary citation
+        ttk.Label(frame, text="Example Citation:", font=self.fonts['bold9']).grid(
+            row=0, column=0, columnspan=3, sticky=W, pady=(5, 0))
+        self.citation_entry = ttk.Entry(
+            frame,
+            textvariable=self.exemplary_citation_var,
+            width=self._citation_entry_width,
+            font=self.fonts['small8']
+        )
+        self.citation_entry.grid(row=1, column=0, columnspan=3, sticky=EW, pady=(2, 2))
+        
+        # Exemplary page number
+        ttk.Label(frame, text="Page Number:", font=self.fonts['bold9']).grid(
+            row=2, column=0, sticky=W, pady=(2, 0))
+        self.page_entry = ttk.Entry(
+            frame,
+            textvariable=self.exemplary_page_var,
+            width=8,
+            font=self.fonts['small8']
+        )
+        self.page_entry.grid(row=2, column=1, sticky=W, padx=(5, 0), pady=(2, 0))
+        
+        self._styled(ttk.Label,
+            frame,
+            text="(e.g., 'Ex. 5, Memo, at p. 25' and '25')",
+            font=self.fonts['small8'],
+            bootstyle="secondary"
+        ).grid(row=2, column=2, sticky=W, padx=(10, 0), pady=(2, 0))
 
     def show_file_renamer_dialog(self):
         """Show file renaming dialog for Chrome PDF compatibility"""
+        # Renaming under a running link pass (or a second rename) would leave links to stale names
+        if self._busy():
+            return
+        
         # Check if we have a target folder
         folder_path = None
         
@@ -3688,244 +3958,341 @@ class ExhibitAnchorApp:
                 return
         
         try:
-            # First, do a dry run to show what would happen
-            successful, failed, unchanged = FileRenamer.rename_files_in_folder(folder_path, dry_run=True)
+            # First, do a dry run to show what would happen - reusing the last one if the
+            # folder has not changed since (adding/removing/renaming a file bumps its mtime)
+            folder_mtime = os.stat(folder_path).st_mtime_ns
+            cached = self._renamer_cache.get(folder_path)
+            if cached is not None and cached[0] == folder_mtime:
+                successful, failed, unchanged = cached[1]
+            else:
+                successful, failed, unchanged = FileRenamer.rename_files_in_folder(folder_path, dry_run=True)
+                self._renamer_cache[folder_path] = (folder_mtime, (successful, failed, unchanged))
             
             if not successful and not failed:
                 messagebox.showinfo("No Changes Needed", 
                     "No files in this folder need renaming for Chrome compatibility.")
                 return
             
-            # Create preview dialog
-            preview_dialog = tk.Toplevel(self.root)
-            preview_dialog.title("File Renaming Preview - Chrome PDF Compatibility")
-            preview_dialog.geometry("800x675")
-
-            # Set custom icon if available
-            if hasattr(self, 'icon_path') and self.icon_path:
-                try:
-                    preview_dialog.iconbitmap(self.icon_path)
-                except Exception as e:
-                    print(f"Could not set preview dialog icon: {e}")
-
-            preview_dialog.transient(self.root)
-            preview_dialog.grab_set()
-            preview_dialog.resizable(True, True)
-            
-            # Center dialog
-            preview_dialog.update_idletasks()
-            x = (preview_dialog.winfo_screenwidth() - 800) // 2
-            y = (preview_dialog.winfo_screenheight() - 600) // 2
-            preview_dialog.geometry(f"800x675+{x}+{y}")
-            
-            # Main frame
-            main_frame = ttk.Frame(preview_dialog, padding=20)
-            main_frame.pack(fill=BOTH, expand=True)
-            
-            # Title and explanation
-            title_label = ttk.Label(
-                main_frame, 
-                text="File Renaming Preview - Chrome PDF Compatibility", 
-                font=("Helvetica", 14, "bold")
-            )
-            title_label.pack(pady=(0, 10))
-            
-            explanation = ttk.Label(
-                main_frame,
-                text="This tool standardizes filenames to improve Chrome PDF link compatibility.\n" +
-                    "Chrome sometimes has issues with periods and spaces in filenames when following hyperlinks.\n" +
-                    "Examples: 'Ex. A Letter.pdf' → 'Ex._A_Letter.pdf', 'Ex. 55 Email.docx' → 'Ex._55_Email.docx'",
-                font=("Helvetica", 10),
-                justify=CENTER,
-                wraplength=750
+            # PERFORMANCE: Build the preview dialog once and refill it on later opens
+            if self._renamer_dialog is None or not self._renamer_dialog.winfo_exists():
+                self._build_renamer_dialog()
+            preview_dialog = self._renamer_dialog
+            w = self._renamer_widgets
+            
+            w['folder_label'].config(text=f"Folder: {folder_path}")
+            
+            # Refill the three tabs, hiding the ones with nothing to show. Only the first visible
+            # tab is filled now - the others are filled when first selected (see on_tab_changed),
+            # so a folder with thousands of unchanged files doesn't slow the dialog open
+            notebook = w['notebook']
+            pending = w['pending']
+            pending.clear()
+            tab_contents = (
+                ('rename', successful, f"Files to Rename ({len(successful)})",
+                 lambda: "".join(f"'{old_name}'\n  → '{new_name}'\n\n" for old_name, new_name in successful)),
+                ('failed', failed, f"Conflicts ({len(failed)})",
+                 lambda: [f"'{old_name}' → '{new_name}' | Error: {error}" for old_name, new_name, error in failed]),
+                ('unchanged', unchanged, f"No Changes Needed ({len(unchanged)})",
+                 lambda: [f"'{filename}'" for filename in unchanged]),
             )
-            explanation.pack(pady=(0, 15))
-            
-            # Folder info
-            folder_label = ttk.Label(
-                main_frame,
-                text=f"Folder: {folder_path}",
-                font=("Helvetica", 9),
-                bootstyle="secondary"
-            )
-            folder_label.pack(pady=(0, 15))
-            
-            # Create notebook for different categories
-            notebook = ttk.Notebook(main_frame)
-            notebook.pack(fill=BOTH, expand=True, pady=(0, 15))
+            first_tab = None
+            for key, items, tab_title, build_content in tab_contents:
+                frame, pane, pane_scrollbar = w[key]
+                if items:
+                    notebook.add(frame, text=tab_title)  # Re-adding a hidden tab shows it again
+                    if first_tab is None:
+                        first_tab = frame
+                        self._fill_renamer_pane(pane, pane_scrollbar, build_content())
+                    else:
+                        pending[key] = build_content
+                else:
+                    notebook.hide(frame)
+            if first_tab is not None:
+                notebook.select(first_tab)
             
-            # Tab 1: Files to be renamed
+            # Buttons and conflict warning
             if successful:
-                rename_frame = ttk.Frame(notebook)
-                notebook.add(rename_frame, text=f"Files to Rename ({len(successful)})")
-                
-                # Scrollable list
-                rename_list_frame = ttk.Frame(rename_frame)
-                rename_list_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
-                
-                rename_text = tk.Text(
-                    rename_list_frame,
-                    wrap=tk.NONE,
-                    font=("Consolas", 9),
-                    bg="#f8f9fa"
-                )
-                
-                rename_scrollbar_y = ttk.Scrollbar(rename_list_frame, orient=tk.VERTICAL, command=rename_text.yview)
-                rename_scrollbar_x = ttk.Scrollbar(rename_list_frame, orient=tk.HORIZONTAL, command=rename_text.xview)
-                rename_text.config(yscrollcommand=rename_scrollbar_y.set, xscrollcommand=rename_scrollbar_x.set)
-                
-                # Add content
-                for old_name, new_name in successful:
-                    rename_text.insert(tk.END, f"'{old_name}'\n  → '{new_name}'\n\n")
-                
-                rename_text.config(state=tk.DISABLED)
-                
-                # Pack scrollbars and text
-                rename_text.pack(side=tk.LEFT, fill=BOTH, expand=True)
-                rename_scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
-                rename_scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+                w['rename_button'].config(text=f"Rename {len(successful)} Files")
+                w['rename_button'].pack(side=tk.LEFT, padx=(0, 10), before=w['cancel_button'])
+            else:
+                w['rename_button'].pack_forget()
             
-            # Tab 2: Conflicts/Failures
             if failed:
-                failed_frame = ttk.Frame(notebook)
-                notebook.add(failed_frame, text=f"Conflicts ({len(failed)})")
-                
-                failed_list_frame = ttk.Frame(failed_frame)
-                failed_list_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
-                
-                failed_text = tk.Text(
-                    failed_list_frame,
-                    wrap=tk.WORD,
-                    font=("Consolas", 9),
-                    bg="#fff5f5"
-                )
-                
-                failed_scrollbar = ttk.Scrollbar(failed_list_frame, orient=tk.VERTICAL, command=failed_text.yview)
-                failed_text.config(yscrollcommand=failed_scrollbar.set)
-                
-                for old_name, new_name, error in failed:
-                    failed_text.insert(tk.END, f"'{old_name}' → '{new_name}'\nError: {error}\n\n")
-                
-                failed_text.config(state=tk.DISABLED)
-                
-                failed_text.pack(side=tk.LEFT, fill=BOTH, expand=True)
-                failed_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            
-            # Tab 3: Unchanged files
-            if unchanged:
-                unchanged_frame = ttk.Frame(notebook)
-                notebook.add(unchanged_frame, text=f"No Changes Needed ({len(unchanged)})")
-                
-                unchanged_list_frame = ttk.Frame(unchanged_frame)
-                unchanged_list_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
-                
-                unchanged_text = tk.Text(
-                    unchanged_list_frame,
-                    wrap=tk.WORD,
-                    font=("Consolas", 9),
-                    bg="#f0fff0"
-                )
-                
-                unchanged_scrollbar = ttk.Scrollbar(unchanged_list_frame, orient=tk.VERTICAL, command=unchanged_text.yview)
-                unchanged_text.config(yscrollcommand=unchanged_scrollbar.set)
-                
-                for filename in unchanged:
-                    unchanged_text.insert(tk.END, f"'{filename}'\n")
-                
-                unchanged_text.config(state=tk.DISABLED)
-                
-                unchanged_text.pack(side=tk.LEFT, fill=BOTH, expand=True)
-                unchanged_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            
-            # Buttons frame
-            buttons_frame = ttk.Frame(main_frame)
-            buttons_frame.pack(pady=(10, 0))
-            
-            # Result storage
-            result = [False]  # Use list to modify from inner functions
+                w['warning_label'].config(text=f"⚠️ {len(failed)} files have conflicts and will be skipped")
+                w['warning_frame'].pack(pady=(10, 0))
+            else:
+                w['warning_frame'].pack_forget()
             
-            def proceed_with_rename():
-                try:
-                    # Perform actual rename
-                    actual_successful, actual_failed, _ = FileRenamer.rename_files_in_folder(folder_path, dry_run=False)
-                    
-                    if actual_failed:
-                        error_summary = "\n".join([f"'{old}' → '{new}': {error}" for old, new, error in actual_failed])
-                        messagebox.showerror("Some Renames Failed", 
-                            f"Successfully renamed {len(actual_successful)} files.\n\n" +
-                            f"Failed to rename {len(actual_failed)} files:\n{error_summary}")
-                    else:
-                        messagebox.showinfo("Rename Complete", 
-                            f"Successfully renamed {len(actual_successful)} files for Chrome PDF compatibility!")
-                    
-                    result[0] = True
-                    preview_dialog.destroy()
-                    
-                except Exception as e:
-                    messagebox.showerror("Rename Failed", f"Error during renaming: {str(e)}")
+            # Center and show dialog
+            x = (self._screen_wh[0] - 800) // 2
+            y = (self._screen_wh[1] - 600) // 2
+            preview_dialog.geometry(f"800x675+{x}+{y}")
             
-            def cancel_rename():
-                result[0] = False
-                preview_dialog.destroy()
+            choice = w['choice']
+            choice.set("")
+            preview_dialog.deiconify()
+            preview_dialog.grab_set()
             
-            # Buttons
-            if successful:
-                ttk.Button(
-                    buttons_frame,
-                    text=f"Rename {len(successful)} Files",
-                    command=proceed_with_rename,
-                    bootstyle="warning",
-                    width=20
-                ).pack(side=tk.LEFT, padx=(0, 10))
-            
-            ttk.Button(
-                buttons_frame,
-                text="Cancel",
-                command=cancel_rename,
-                bootstyle="secondary",
-                width=15
-            ).pack(side=tk.LEFT)
-            
-            # Warning if there are conflicts
-            if failed:
-                warning_frame = ttk.Frame(main_frame)
-                warning_frame.pack(pady=(10, 0))
-                
-                warning_label = ttk.Label(
-                    warning_frame,
-                    text=f"⚠️ {len(failed)} files have conflicts and will be skipped",
-                    font=("Helvetica", 10, "bold"),
-                    bootstyle="warning"
-                )
-                warning_label.pack()
+            # Wait for a button (or the window close box) to set the choice
+            preview_dialog.wait_variable(choice)
+            preview_dialog.grab_release()
+            preview_dialog.withdraw()
             
-            # Wait for dialog to close
-            self.root.wait_window(preview_dialog)
+            if choice.get() != "rename":
+                return
             
-            # Update status and refresh folder info if renames were made
-            if result[0]:
-                self.status_text.set(f"File renaming completed - {len(successful)} files renamed for Chrome compatibility")
-                # Refresh folder status
-                if mode == "word" and linker and linker.target_folder:
-                    self.update_folder_status(linker.target_folder, mode)
-                elif mode == "excel" and linker and linker.target_folder:
-                    self.update_folder_status(linker.target_folder, mode)
+            # Perform the actual rename on a worker thread so the window keeps repainting;
+            # the worker never touches Tk - _finish_rename picks the outcome up on the Tk thread
+            self._renamer_cache.pop(folder_path, None)
+            self._rename_in_progress = True
+            self._set_status("Renaming files...")
+            self._run_in_background(
+                None,
+                lambda proxy, report: FileRenamer.rename_files_in_folder(folder_path, dry_run=False),
+                lambda outcome, error: self._finish_rename(mode, linker, outcome, error)
+            )
             
         except Exception as e:
             messagebox.showerror("Error", f"Error analyzing files: {str(e)}")
 
-    def show_help_popup(self):
-        """Show help information popup with comparison table"""
+    def _finish_rename(self, mode, linker, outcome, error):
+        """Tk thread: report the rename result and refresh the folder status"""
+        self._rename_in_progress = False
+        
+        if error is not None:
+            self._set_status("File renaming failed")
+            messagebox.showerror("Rename Failed", f"Error during renaming: {str(error)}")
+            return
+        
+        actual_successful, actual_failed, _ = outcome
+        if actual_failed:
+            # Windows message boxes truncate long text - list the first 50 failures and count the rest
+            error_summary = "\n".join(f"'{old}' → '{new}': {error}" for old, new, error in actual_failed[:50])
+            if len(actual_failed) > 50:
+                error_summary += f"\n... and {len(actual_failed) - 50} more"
+            messagebox.showerror("Some Renames Failed", 
+                f"Successfully renamed {len(actual_successful)} files.\n\n" +
+                f"Failed to rename {len(actual_failed)} files:\n{error_summary}")
+        else:
+            messagebox.showinfo("Rename Complete", 
+                f"Successfully renamed {len(actual_successful)} files for Chrome PDF compatibility!")
+        
+        # Update status and refresh folder info since renames were made
+        self._set_status(f"File renaming completed - {len(actual_successful)} files renamed for Chrome compatibility")
+        # Refresh folder status
+        if mode == "word" and linker and linker.target_folder:
+            self.update_folder_status(linker.target_folder, mode)
+        elif mode == "excel" and linker and linker.target_folder:
+            self.update_folder_status(linker.target_folder, mode)
+
+    def _build_renamer_dialog(self):
+        """Create the file renaming preview dialog (hidden) and keep its widgets for reuse"""
+        preview_dialog = tk.Toplevel(self.root)
+        preview_dialog.withdraw()  # Hidden until show_file_renamer_dialog fills it
+        preview_dialog.title("File Renaming Preview - Chrome PDF Compatibility")
+        preview_dialog.geometry("800x675")
+
+        preview_dialog.transient(self.root)
+        preview_dialog.resizable(True, True)
+        
+        # Main frame
+        main_frame = ttk.Frame(preview_dialog, padding=20)
+        main_frame.pack(fill=BOTH, expand=True)
+        
+        # Title and explanation
+        title_label = ttk.Label(
+            main_frame, 
+            text="File Renaming Preview - Chrome PDF Compatibility", 
+            font=("Helvetica", 14, "bold")
+        )
+        title_label.pack(pady=(0, 10))
+        
+        explanation = ttk.Label(
+            main_frame,
+            text="This tool standardizes filenames to improve Chrome PDF link compatibility.\n" +
+                "Chrome sometimes has issues with periods and spaces in filenames when following hyperlinks.\n" +
+                "Examples: 'Ex. A Letter.pdf' → 'Ex._A_Letter.pdf', 'Ex. 55 Email.docx' → 'Ex._55_Email.docx'",
+            font=("Helvetica", 10),
+            justify=CENTER,
+            wraplength=750
+        )
+        explanation.pack(pady=(0, 15))
+        
+        # Folder info (text set on each open)
+        folder_label = ttk.Label(
+            main_frame,
+            text="",
+            font=("Helvetica", 9),
+            bootstyle="secondary"
+        )
+        folder_label.pack(pady=(0, 15))
+        
+        # Create notebook for different categories
+        notebook = ttk.Notebook(main_frame)
+        notebook.pack(fill=BOTH, expand=True, pady=(0, 15))
+        
+        # Tab 1: Files to be renamed
+        rename_frame = ttk.Frame(notebook)
+        notebook.add(rename_frame, text="Files to Rename")
+        
+        # Scrollable list
+        rename_list_frame = ttk.Frame(rename_frame)
+        rename_list_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        
+        rename_text = tk.Text(
+            rename_list_frame,
+            wrap=tk.NONE,
+            font=("Consolas", 9),
+            bg="#f8f9fa"
+        )
+        
+        rename_scrollbar_y = ttk.Scrollbar(rename_list_frame, orient=tk.VERTICAL, command=rename_text.yview)
+        rename_scrollbar_x = ttk.Scrollbar(rename_list_frame, orient=tk.HORIZONTAL, command=rename_text.xview)
+        rename_text.config(yscrollcommand=rename_scrollbar_y.set, xscrollcommand=rename_scrollbar_x.set)
+        rename_text.config(state=tk.DISABLED)
+        
+        # Pack scrollbars and text
+        rename_text.pack(side=tk.LEFT, fill=BOTH, expand=True)
+        rename_scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+        rename_scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        # Tab 2: Conflicts/Failures
+        failed_frame = ttk.Frame(notebook)
+        notebook.add(failed_frame, text="Conflicts")
+        
+        failed_list_frame = ttk.Frame(failed_frame)
+        failed_list_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        
+        # Listbox rather than a word-wrapped Text - one fixed-height row per entry, no wrap layout
+        failed_list = tk.Listbox(
+            failed_list_frame,
+            font=("Consolas", 9),
+            bg="#fff5f5",
+            activestyle="none"
+        )
+        
+        failed_scrollbar = ttk.Scrollbar(failed_list_frame, orient=tk.VERTICAL, command=failed_list.yview)
+        failed_scrollbar_x = ttk.Scrollbar(failed_list_frame, orient=tk.HORIZONTAL, command=failed_list.xview)
+        failed_list.config(yscrollcommand=failed_scrollbar.set, xscrollcommand=failed_scrollbar_x.set)
+        
+        failed_scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+        failed_list.pack(side=tk.LEFT, fill=BOTH, expand=True)
+        failed_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Tab 3: Unchanged files
+        unchanged_frame = ttk.Frame(notebook)
+        notebook.add(unchanged_frame, text="No Changes Needed")
+        
+        unchanged_list_frame = ttk.Frame(unchanged_frame)
+        unchanged_list_frame.pack(fill=BOTH, expand=True, padx=10, pady=10)
+        
+        unchanged_list = tk.Listbox(
+            unchanged_list_frame,
+            font=("Consolas", 9),
+            bg="#f0fff0",
+            activestyle="none"
+        )
+        
+        unchanged_scrollbar = ttk.Scrollbar(unchanged_list_frame, orient=tk.VERTICAL, command=unchanged_list.yview)
+        unchanged_scrollbar_x = ttk.Scrollbar(unchanged_list_frame, orient=tk.HORIZONTAL, command=unchanged_list.xview)
+        unchanged_list.config(yscrollcommand=unchanged_scrollbar.set, xscrollcommand=unchanged_scrollbar_x.set)
+        
+        unchanged_scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
+        unchanged_list.pack(side=tk.LEFT, fill=BOTH, expand=True)
+        unchanged_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        
+        # Buttons frame
+        buttons_frame = ttk.Frame(main_frame)
+        buttons_frame.pack(pady=(10, 0))
+        
+        # The dialog is withdrawn (not destroyed) on close, so the choice is passed back through a variable
+        choice = tk.StringVar(master=preview_dialog, value="")
+        
+        rename_button = ttk.Button(
+            buttons_frame,
+            text="Rename Files",
+            command=lambda: choice.set("rename"),
+            bootstyle="warning",
+            width=20
+        )
+        
+        cancel_button = ttk.Button(
+            buttons_frame,
+            text="Cancel",
+            command=lambda: choice.set("cancel"),
+            bootstyle="secondary",
+            width=15
+        )
+        cancel_button.pack(side=tk.LEFT)
+        
+        # Warning if there are conflicts (packed only when needed)
+        warning_frame = ttk.Frame(main_frame)
+        warning_label = ttk.Label(
+            warning_frame,
+            text="",
+            font=("Helvetica", 10, "bold"),
+            bootstyle="warning"
+        )
+        warning_label.pack()
+        
+        preview_dialog.protocol("WM_DELETE_WINDOW", lambda: choice.set("cancel"))
+        
+        # Tab contents not yet shown since the last open: key -> function building the text
+        pending = {}
+        
+        def on_tab_changed(event):
+            selected = notebook.select()
+            for key in list(pending):
+                frame, pane, pane_scrollbar = self._renamer_widgets[key]
+                if str(frame) == selected:
+                    self._fill_renamer_pane(pane, pane_scrollbar, pending.pop(key)())
+        
+        notebook.bind("<<NotebookTabChanged>>", on_tab_changed)
+        
+        self._renamer_dialog = preview_dialog
+        self._renamer_widgets = {
+            'folder_label': folder_label,
+            'notebook': notebook,
+            'rename': (rename_frame, rename_text, rename_scrollbar_y),
+            'failed': (failed_frame, failed_list, failed_scrollbar),
+            'unchanged': (unchanged_frame, unchanged_list, unchanged_scrollbar),
+            'rename_button': rename_button,
+            'cancel_button': cancel_button,
+            'warning_frame': warning_frame,
+            'warning_label': warning_label,
+            'choice': choice,
+            'pending': pending,
+        }
+
+    def _fill_renamer_pane(self, pane, scrollbar, content):
+        """Replace the contents of a preview pane with one insert - a string for the
+        read-only Text pane, a list of rows for the Listbox panes"""
+        # Detach the scrollbar while the bulk insert recomputes line metrics, then update it once
+        pane.config(yscrollcommand="")
+        if isinstance(pane, tk.Listbox):
+            pane.delete(0, tk.END)
+            pane.insert(tk.END, *content)
+        else:
+            pane.config(state=tk.NORMAL)
+            pane.delete('1.0', tk.END)
+            pane.insert(tk.END, content)
+            pane.config(state=tk.DISABLED)
+        pane.config(yscrollcommand=scrollbar.set)
+        scrollbar.set(*pane.yview())
+
+    def show_help_popup(self):
+        """Show help information popup with comparison table"""
+        # PERFORMANCE: Nothing in the help dialog changes - re-show the one built earlier
+        if self._help_dialog is not None and self._help_dialog.winfo_exists():
+            self._help_dialog.deiconify()
+            self._help_dialog.lift()
+            self._help_dialog.grab_set()
+            return
+        
         # Create help dialog
         help_dialog = tk.Toplevel(self.root)
         help_dialog.title("Help - Export Information")
-        
-        # Set custom icon if available
-        if hasattr(self, 'icon_path') and self.icon_path:
-            try:
-                help_dialog.iconbitmap(self.icon_path)
-            except Exception as e:
-                print(f"Could not set help dialog icon: {e}")
+        self._help_dialog = help_dialog
         
         help_dialog.transient(self.root)
         help_dialog.grab_set()
@@ -3935,10 +4302,8 @@ class ExhibitAnchorApp:
         dialog_width = 790
         dialog_height = 650  # Increased height from 500 to 650
         
-        # Center dialog on screen
-        help_dialog.update_idletasks()
-        screen_width = help_dialog.winfo_screenwidth()
-        screen_height = help_dialog.winfo_screenheight()
+        # Center dialog on screen (pure arithmetic on the cached screen size - no idle-task flush needed)
+        screen_width, screen_height = self._screen_wh
         x = (screen_width - dialog_width) // 2
         y = (screen_height - dialog_height) // 2
         
@@ -3964,21 +4329,25 @@ class ExhibitAnchorApp:
         table_frame = ttk.Frame(main_frame, relief="solid", borderwidth=1)
         table_frame.pack(fill=X, pady=(0, 20))
         
+        # Bordered cell styles, configured once - each cell is a single Label gridded into the table
+        # (no wrapper Frame per cell, so half the widgets and no inner pack/fill pass)
+        style = ttk.Style()
+        style.configure("HelpCell.TLabel", relief="solid", borderwidth=1, padding=(8, 6))
+        style.configure("HelpHeaderCell.TLabel", relief="solid", borderwidth=1, padding=(8, 6),
+                        background="#e8f4fd")
+        
         # Helper function to create table cells
         def create_table_cell(parent, text, row, col, is_header=False, wraplength=None):
-            cell_frame = ttk.Frame(parent, relief="solid", borderwidth=1)
-            cell_frame.grid(row=row, column=col, sticky="nsew", padx=0, pady=0)
-            
             if is_header:
-                cell_frame.configure(style="info.TFrame")  # Use ttkbootstrap style
-                label = ttk.Label(cell_frame, text=text, font=("Helvetica", 10, "bold"), 
-                                anchor="center", background="#e8f4fd")
+                label = ttk.Label(parent, text=text, font=("Helvetica", 10, "bold"), 
+                                anchor="center", style="HelpHeaderCell.TLabel")
             else:
-                label = ttk.Label(cell_frame, text=text, font=("Helvetica", 9), 
-                                anchor="center", wraplength=wraplength if wraplength else 200)
+                label = ttk.Label(parent, text=text, font=("Helvetica", 9), 
+                                anchor="center", wraplength=wraplength if wraplength else 200,
+                                style="HelpCell.TLabel")
             
-            label.pack(fill=BOTH, expand=True, padx=8, pady=6)
-            return cell_frame
+            label.grid(row=row, column=col, sticky="nsew", padx=0, pady=0)
+            return label
         
         # Create table grid
         # Headers
@@ -4035,38 +4404,10 @@ class ExhibitAnchorApp:
         text_widget.pack(side=tk.LEFT, fill=BOTH, expand=True)
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         
-        # Help content - focused on link types
-        help_content = """Relative Hyperlinks: These hyperlinks will work if the file is brought to another location/PC so long as the PDF and linked files are in the same relative orientation. E.g., if your PDF with hyperlinks is in a folder called "Memo" and the exhibits are in the "Exhibits" subfolder thereof, so long as that basic orientation is retained, the linking should remain. As such, these hyperlinks are ideal if you are sending your files along to another individual.
-
-Page Citations: This script can create citations to page numbers (be it via the Page Citation or Bates stamp functions) in output PDF and Excel files.  The links will bring you to the correct page if opened via Chrome or most other browsers.  Acrobat, however, is incompatible with page linking so a specific page hyperlink opened via Acrobat will simply bring you to page 1 of the operative exhibit.  Note also that page citation mode only works with convention page numbers (e.g., page 1 or p. 55) and not alphaneumeric descriptors like JOHN_005.
-
-Filenames:  If you are linking to files in the same  folder as the "parent" document, you should process the filenames which will replace periods/spaces with underscores.  This ensures compatability with browser PDF viewers which can misinterpret hyperlinks otherwise.  If the exhibits are in a subfolder, however, there should be no need to process the filenames.
-
-Word:  The PDF output by this script will work out of the box.  However, if you add links to your Word document and wish to make further modifications and then save your Word document as a PDF, you should use Word's Save As feature and save as PDF.  Do not use Save as Adobe PDF or Print to PDF as they can strip away hyperlink functionality. 
-
-File Linking:  Linking is done by searching for specific terms in the document. For example, if you have a Word document with references like 'Ex. 1', 'Exhibit A', or Bates numbers like 'SMITH_011', the script will automatically convert these into clickable hyperlinks that point to the corresponding files in the same folder.  For exhibits, this can include longer file names, so, e.g., a cite to Ex. 55 would link to both Ex. 55.pdf and Ex. 55 Letter to the Court.pdf"""
-
-
-        # Insert content
-        text_widget.insert(tk.END, help_content)
-        
-        # Apply formatting to specific terms
-        def format_bold_term(term):
-            start = "1.0"
-            while True:
-                pos = text_widget.search(term, start, tk.END)
-                if not pos:
-                    break
-                end_pos = f"{pos}+{len(term)}c"
-                text_widget.tag_add("bold_header", pos, end_pos)
-                start = end_pos
-        
-        # Apply bold formatting to headers
-        format_bold_term("Relative Hyperlinks:")
-        format_bold_term("Page Citations:")
-        format_bold_term("File Linking:")
-        format_bold_term("Filenames:")
-        format_bold_term("Word:")
+        # Insert content and bold the section headers (tag ranges precomputed at import)
+        text_widget.insert(tk.END, _HELP_CONTENT)
+        for start, end in _HELP_BOLD_RANGES:
+            text_widget.tag_add("bold_header", f"1.0+{start}c", f"1.0+{end}c")
         
         # Configure the bold style
         text_widget.tag_config("bold_header", font=("Helvetica", 10, "bold"))
@@ -4078,17 +4419,28 @@ File Linking:  Linking is done by searching for specific terms in the document.
         button_frame = ttk.Frame(main_frame)
         button_frame.pack(pady=(15, 0))
         
+        # Closing only hides the dialog so the next Help click can reuse it
+        def close_help():
+            help_dialog.grab_release()
+            help_dialog.withdraw()
+        
         ttk.Button(
             button_frame,
             text="Close",
-            command=help_dialog.destroy,
+            command=close_help,
             bootstyle="primary",
             width=15
         ).pack()
+        
+        help_dialog.protocol("WM_DELETE_WINDOW", close_help)
 
 
     def update_info_text(self):
         """Update information panel based on current mode - UPDATED"""
+        # Nothing to show until create_widgets has built the panel
+        if self.info_text is None:
+            return
+        
         mode = self.processing_mode.get()
         
         if mode == "word":
@@ -4135,7 +4487,12 @@ File Linking:  Linking is done by searching for specific terms in the document.
     Requirement: Bates PDFs must be numbered sequentially"""
         
         info_text += "\n\nCopyright © Alex Owens, 2025. All rights reserved."
-        self.info_text_var.set(info_text)
+        
+        # The Information panel is read-only - unlock it just long enough to swap the text
+        self.info_text.config(state=tk.NORMAL)
+        self.info_text.delete('1.0', tk.END)
+        self.info_text.insert('1.0', info_text)
+        self.info_text.config(state=tk.DISABLED)
 
     def get_word_linker(self):
         """Get or create Word linker"""
@@ -4159,6 +4516,10 @@ File Linking:  Linking is done by searching for specific terms in the document.
 
     def browse_document(self):
         """Handle document/file selection based on mode - SIMPLIFIED"""
+        # A new selection would close the document the worker is writing to
+        if self._busy():
+            return
+        
         mode = self.processing_mode.get()
         
         if mode == "word":
@@ -4178,7 +4539,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
             prefix = self.bates_prefix_var.get() if is_bates else ""
             linker.set_bates_mode(is_bates, prefix)
             
-            self.status_text.set("Creating working copy of document...")
+            self._set_status("Creating working copy of document...")
             self.root.update()
             
             file_path = linker.select_word_document()
@@ -4190,16 +4551,15 @@ File Linking:  Linking is done by searching for specific terms in the document.
                 self.doc_path.set(working_copy_display)
                 self.folder_path.set(os.path.dirname(file_path))
                 
-                folder = os.path.dirname(file_path)
-                file_count = len([f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))])
+                file_count = self.get_folder_counts(os.path.dirname(file_path))[0]
                 
                 mode_text = "Bates mode" if is_bates else "Exhibit mode"
-                self.status_text.set(f"Working copy created in {mode_text} - {file_count} files in folder")
+                self._set_status(f"Working copy created in {mode_text} - {file_count} files in folder")
             else:
-                self.status_text.set("No document selected")
+                self._set_status("No document selected")
         except Exception as e:
             messagebox.showerror("Error", f"Error selecting document: {str(e)}")
-            self.status_text.set("Error selecting document")
+            self._set_status("Error selecting document")
 
     def browse_excel_file(self):
         """Browse for Excel file"""
@@ -4208,7 +4568,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
             return
             
         try:
-            self.status_text.set("Opening Excel file...")
+            self._set_status("Opening Excel file...")
             self.root.update()
             
             file_path = linker.select_excel_file()
@@ -4220,18 +4580,20 @@ File Linking:  Linking is done by searching for specific terms in the document.
                 # Enable column selection
                 self.select_column_button.config(state='normal')
                 
-                folder = os.path.dirname(file_path)
-                file_count = len([f for f in os.listdir(folder) if os.path.isfile(os.path.join(folder, f))])
+                file_count = self.get_folder_counts(os.path.dirname(file_path))[0]
                 
-                self.status_text.set(f"Excel file opened - {file_count} files in folder - select column to process")
+                self._set_status(f"Excel file opened - {file_count} files in folder - select column to process")
             else:
-                self.status_text.set("No Excel file selected")
+                self._set_status("No Excel file selected")
         except Exception as e:
             messagebox.showerror("Error", f"Error opening Excel file: {str(e)}")
-            self.status_text.set("Error opening Excel file")
+            self._set_status("Error opening Excel file")
 
     def select_excel_column(self):
         """Show dialog to select Excel column"""
+        if self._busy():
+            return
+        
         linker = self.get_excel_linker()
         if not linker or not linker.worksheet:
             messagebox.showwarning("Warning", "Please select an Excel file first")
@@ -4248,20 +4610,12 @@ File Linking:  Linking is done by searching for specific terms in the document.
             dialog.title("Select Column")
             dialog.geometry("400x300")
 
-            # Set custom icon if available
-            if hasattr(self, 'icon_path') and self.icon_path:
-                try:
-                    dialog.iconbitmap(self.icon_path)
-                except Exception as e:
-                    print(f"Could not set column dialog icon: {e}")
-
             dialog.transient(self.root)
             dialog.grab_set()
             
-            # Center dialog
-            dialog.update_idletasks()
-            x = (dialog.winfo_screenwidth() - 400) // 2
-            y = (dialog.winfo_screenheight() - 300) // 2
+            # Center dialog (fixed size + cached screen size - no idle-task flush needed)
+            x = (self._screen_wh[0] - 400) // 2
+            y = (self._screen_wh[1] - 300) // 2
             dialog.geometry(f"400x300+{x}+{y}")
             
             ttk.Label(dialog, text="Select column to process:", font=("Helvetica", 12, "bold")).pack(pady=10)
@@ -4313,13 +4667,17 @@ File Linking:  Linking is done by searching for specific terms in the document.
                 linker.selected_column_letter = col_info['letter']
                 
                 self.selected_column_var.set(f"Column {col_info['letter']}: {col_info['header']}")
-                self.status_text.set(f"Column {col_info['letter']} selected - ready to process")
+                self._set_status(f"Column {col_info['letter']} selected - ready to process")
                 
         except Exception as e:
             messagebox.showerror("Error", f"Error selecting column: {str(e)}")
 
     def browse_folder(self):
         """Handle file folder selection based on mode - UPDATED"""
+        # set_mode resets the match caches and Bates map the worker is reading
+        if self._busy():
+            return
+        
         mode = self.processing_mode.get()
         
         if mode == "word":
@@ -4335,11 +4693,16 @@ File Linking:  Linking is done by searching for specific terms in the document.
         else:
             return
         
+        # Read the sub-mode/prefix StringVars once (each .get() is a Tcl round-trip)
+        word_bates = mode == "word" and self.word_submode_var.get() == "bates"
+        excel_bates = mode == "excel" and self.excel_submode_var.get() == "bates"
+        prefix = self.bates_prefix_var.get() if (word_bates or excel_bates) else ""
+        
         # Update mode settings in linker
-        if mode == "word" and self.word_submode_var.get() == "bates":
-            linker.set_bates_mode(True, self.bates_prefix_var.get())
-        elif mode == "excel" and self.excel_submode_var.get() == "bates":
-            linker.set_mode("bates", self.bates_prefix_var.get())
+        if word_bates:
+            linker.set_bates_mode(True, prefix)
+        elif excel_bates:
+            linker.set_mode("bates", prefix)
         elif mode == "excel":
             linker.set_mode("exhibit", "")
         else:
@@ -4383,11 +4746,16 @@ File Linking:  Linking is done by searching for specific terms in the document.
         else:
             return
         
+        # Read the sub-mode/prefix StringVars once (each .get() is a Tcl round-trip)
+        word_bates = mode == "word" and self.word_submode_var.get() == "bates"
+        excel_bates = mode == "excel" and self.excel_submode_var.get() == "bates"
+        prefix = self.bates_prefix_var.get() if (word_bates or excel_bates) else ""
+        
         # Update mode settings
-        if mode == "word" and self.word_submode_var.get() == "bates":
-            linker.set_bates_mode(True, self.bates_prefix_var.get())
-        elif mode == "excel" and self.excel_submode_var.get() == "bates":
-            linker.set_mode("bates", self.bates_prefix_var.get())
+        if word_bates:
+            linker.set_bates_mode(True, prefix)
+        elif excel_bates:
+            linker.set_mode("bates", prefix)
         elif mode == "excel":
             linker.set_mode("exhibit", "")
         else:
@@ -4397,109 +4765,59 @@ File Linking:  Linking is done by searching for specific terms in the document.
         self.update_folder_status(folder_path, mode)
 
 
+    def get_folder_counts(self, folder_path, prefix=""):
+        """(file_count, bates_count, exhibit_count) for a folder - memoized until the folder changes"""
+        return _folder_counts(folder_path, prefix, os.stat(folder_path).st_mtime_ns)
+
     def update_folder_status(self, folder_path, mode):
         """Update status based on folder selection and mode - UPDATED"""
         try:
-            file_count = len([f for f in os.listdir(folder_path) if os.path.isfile(os.path.join(folder_path, f))])
+            # Check for Bates mode in either Word or Excel (only the active mode's sub-mode var is read)
+            is_bates_mode = (
+                (mode == "word" and self.word_submode_var.get() == "bates")
+                or (mode == "excel" and self.excel_submode_var.get() == "bates")
+            )
             
-            # Check for Bates mode in either Word or Excel
-            is_bates_mode = False
-            if mode == "word" and self.word_submode_var.get() == "bates":
-                is_bates_mode = True
-            elif mode == "excel" and self.excel_submode_var.get() == "bates":
-                is_bates_mode = True
+            prefix = self.bates_prefix_var.get().strip() if is_bates_mode else ""
+            file_count, bates_count, exhibit_count = self.get_folder_counts(folder_path, prefix)
             
             if is_bates_mode:
-                prefix = self.bates_prefix_var.get().strip()
                 if prefix:
-                    bates_count = len([f for f in os.listdir(folder_path) 
-                                    if f.startswith(prefix) and f.endswith('.pdf')])
-                    self.status_text.set(f"Folder selected - {bates_count} Bates PDFs found with prefix '{prefix}' ({file_count} total files)")
+                    self._set_status(f"Folder selected - {bates_count} Bates PDFs found with prefix '{prefix}' ({file_count} total files)")
                 else:
-                    self.status_text.set(f"Folder selected - enter Bates prefix ({file_count} total files)")
+                    self._set_status(f"Folder selected - enter Bates prefix ({file_count} total files)")
             else:
-                exhibit_count = len([f for f in os.listdir(folder_path) if f.startswith('Ex.')])
-                self.status_text.set(f"Folder selected - {exhibit_count} exhibit files found ({file_count} total files)")
+                self._set_status(f"Folder selected - {exhibit_count} exhibit files found ({file_count} total files)")
         except Exception as e:
-            self.status_text.set(f"Error reading folder: {e}")
+            self._set_status(f"Error reading folder: {e}")
 
     def create_progress_dialog(self, title):
-        """Create a modern progress dialog with enhanced positioning"""
+        """Return the progress dialog, reset and shown for a new run
+
+        The dialog is built on the first call and withdrawn on close(), so later runs
+        only reset its labels and bar instead of rebuilding the Toplevel and widgets.
+        """
+        if self._progress_dialog is not None:
+            self._progress_dialog.reset(title)
+            return self._progress_dialog
+        
+        screen_wh = self._screen_wh  # Cached at startup - the dialog centering reuses it
+        
         class ProgressDialog:
             def __init__(self, parent, title):
                 self.parent = parent
                 self.dialog = tk.Toplevel(parent)
-                self.dialog.title(title)
+                self.dialog.withdraw()  # Hide while building and positioning
                 
-                # Set custom icon - try to find it directly
-                try:
-                    import os
-                    icon_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), "images", "icon.ico")
-                    if os.path.exists(icon_path):
-                        self.dialog.iconbitmap(icon_path)
-                        print(f"Progress dialog icon set from: {icon_path}")
-                    else:
-                        print(f"Icon not found at: {icon_path}")
-                except Exception as e:
-                    print(f"Could not set progress dialog icon: {e}")
+                # Icon is inherited from the default set on the main window
                 
                 self.dialog.transient(parent)
-                self.dialog.grab_set()
                 self.dialog.resizable(False, False)
                 
-                # Store original parent position
-                try:
-                    self.original_parent_geometry = parent.geometry()
-                except:
-                    self.original_parent_geometry = None
-                
-                # Set initial size
-                dialog_width = 500
-                dialog_height = 150
-                
-                # ENHANCED CENTERING - Multiple methods for reliability
-                self.dialog.withdraw()  # Hide while positioning
-                
-                # Method 1: Center relative to parent window
-                try:
-                    parent.update_idletasks()
-                    parent_x = parent.winfo_rootx()
-                    parent_y = parent.winfo_rooty()
-                    parent_width = parent.winfo_width()
-                    parent_height = parent.winfo_height()
-                    
-                    # Calculate center position relative to parent
-                    x = parent_x + (parent_width - dialog_width) // 2
-                    y = parent_y + (parent_height - dialog_height) // 2
-                    
-                    # Make sure it stays on screen
-                    screen_width = self.dialog.winfo_screenwidth()
-                    screen_height = self.dialog.winfo_screenheight()
-                    
-                    x = max(0, min(x, screen_width - dialog_width))
-                    y = max(0, min(y, screen_height - dialog_height))
-                    
-                    print(f"Centering progress dialog at: {x}, {y} (relative to parent)")
-                    
-                except Exception as e:
-                    print(f"Parent-relative centering failed: {e}, using screen center")
-                    
-                    # Method 2: Fallback to screen center
-                    self.dialog.update_idletasks()
-                    screen_width = self.dialog.winfo_screenwidth()
-                    screen_height = self.dialog.winfo_screenheight()
-                    
-                    x = (screen_width - dialog_width) // 2
-                    y = (screen_height - dialog_height) // 2
-                
-                # Set geometry and show
-                self.dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
-                self.dialog.deiconify()  # Show the dialog
-                
-                # Force to front and center again (belt and suspenders)
-                self.dialog.lift()
-                self.dialog.focus_force()
-                self.dialog.update()
+                # Bound to the labels and bar so each tick is a Tcl variable set, not a configure
+                self._status_var = tk.StringVar(self.dialog, value="Initializing...")
+                self._percent_var = tk.StringVar(self.dialog, value="0%")
+                self._progress_var = tk.IntVar(self.dialog, value=0)
                 
                 # Main frame
                 main_frame = ttk.Frame(self.dialog, padding=20)
@@ -4516,7 +4834,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
                 # Status text
                 self.status_label = ttk.Label(
                     main_frame,
-                    text="Initializing...",
+                    textvariable=self._status_var,
                     font=("Helvetica", 10)
                 )
                 self.status_label.pack(pady=(0, 10))
@@ -4526,6 +4844,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
                     main_frame,
                     mode='determinate',
                     length=400,
+                    variable=self._progress_var,
                     bootstyle="success-striped"
                 )
                 self.progress_bar.pack(pady=(0, 10))
@@ -4533,31 +4852,108 @@ File Linking:  Linking is done by searching for specific terms in the document.
                 # Percentage label
                 self.percent_label = ttk.Label(
                     main_frame,
-                    text="0%",
+                    textvariable=self._percent_var,
                     font=("Helvetica", 9),
                     bootstyle="secondary"
                 )
                 self.percent_label.pack()
                 
-                # Make dialog stay on top and prevent closing
-                self.dialog.protocol("WM_DELETE_WINDOW", lambda: None)
+                # Make dialog stay on top and prevent closing - set once, the reused
+                # dialog keeps -topmost across runs so there is no z-order churn per run
+                self.dialog.protocol("WM_DELETE_WINDOW", _ignore_close)
                 self.dialog.attributes('-topmost', True)
+                
+                self.reset(title)
+            
+            def reset(self, title):
+                """Reset the widgets for a new run, then center and show the dialog"""
+                self.dialog.title(title)
+                self.title_label.config(text=title)
+                self._status_var.set("Initializing...")
+                self._progress_var.set(0)
+                self._percent_var.set("0%")
+                
+                # Throttle state for update_progress
+                self._closed = False
+                self._shown_percent = 0
+                self._shown_status = "Initializing..."
+                self._last_flush_time = 0.0
+                self._last_percent = None
+                
+                # Store original parent position
+                try:
+                    self.original_parent_geometry = self.parent.geometry()
+                except:
+                    self.original_parent_geometry = None
+                
+                # Set initial size
+                dialog_width = 500
+                dialog_height = 150
+                
+                # ENHANCED CENTERING - Multiple methods for reliability
+                screen_width, screen_height = screen_wh
+                
+                # Method 1: Center relative to parent window
+                # (the main window is already mapped, so its geometry is current without update_idletasks)
+                try:
+                    parent_x = self.parent.winfo_rootx()
+                    parent_y = self.parent.winfo_rooty()
+                    parent_width = self.parent.winfo_width()
+                    parent_height = self.parent.winfo_height()
+                    
+                    # Calculate center position relative to parent
+                    x = parent_x + (parent_width - dialog_width) // 2
+                    y = parent_y + (parent_height - dialog_height) // 2
+                    
+                    # Make sure it stays on screen
+                    x = max(0, min(x, screen_width - dialog_width))
+                    y = max(0, min(y, screen_height - dialog_height))
+                    
+                    logger.debug("Centering progress dialog at: %s, %s (relative to parent)", x, y)
+                    
+                except Exception as e:
+                    logger.debug("Parent-relative centering failed: %s, using screen center", e)
+                    
+                    # Method 2: Fallback to screen center
+                    x = (screen_width - dialog_width) // 2
+                    y = (screen_height - dialog_height) // 2
+                
+                # Set geometry and show
+                self.dialog.geometry(f"{dialog_width}x{dialog_height}+{x}+{y}")
+                self.dialog.deiconify()  # Show the dialog
+                self.dialog.grab_set()
+                # No lift()/focus_force()/update() here - the dialog is -topmost, so mapping it
+                # already puts it in front, and it gets painted on the first update_progress flush
             
             def update_progress(self, percent, status_text):
                 """Update progress bar and status"""
+                if self._closed:
+                    return  # Late tick after close() - nothing on screen to update
+                if percent == self._shown_percent and status_text == self._shown_status:
+                    return  # Repeat tick - nothing to redraw
+                self._shown_percent = percent
+                self._shown_status = status_text
                 try:
-                    self.progress_bar['value'] = percent
-                    self.status_label.config(text=status_text)
-                    self.percent_label.config(text=f"{percent}%")
-                    self.dialog.update()
-                except:
-                    pass  # Dialog might be destroyed
+                    self._progress_var.set(percent)
+                    self._status_var.set(status_text)
+                    self._percent_var.set(_PERCENT_TEXT[percent] if 0 <= percent <= 100 else f"{percent}%")
+                    
+                    # Only force a repaint on real transitions - rapid same-percent status
+                    # changes just update the labels and get painted on the next flush
+                    now = time.monotonic()
+                    if percent == self._last_percent and now - self._last_flush_time < 0.05:
+                        return
+                    self._last_flush_time = now
+                    self._last_percent = percent
+                    self.dialog.update_idletasks()  # Repaint only - no event-loop re-entry
+                except tk.TclError:
+                    pass  # Dialog destroyed with the app
             
             def hide_temporarily(self):
                 """Hide the progress dialog temporarily"""
                 try:
                     self.dialog.withdraw()
-                    print("Progress dialog hidden for file save dialogs")
+                    logger.debug("Progress dialog hidden for file save dialogs")
                 except:
                     pass
             
@@ -4567,21 +4963,62 @@ File Linking:  Linking is done by searching for specific terms in the document.
                     self.dialog.deiconify()
                     self.dialog.lift()
                     self.dialog.focus_force()
-                    print("Progress dialog restored after file save")
+                    logger.debug("Progress dialog restored after file save")
                 except:
                     pass
             
             def close(self):
-                """Close the progress dialog"""
+                """Hide the progress dialog - it is kept for the next run and destroyed with the app"""
+                self._closed = True
                 try:
-                    self.dialog.destroy()
+                    self.dialog.grab_release()
+                    self.dialog.withdraw()
                 except:
                     pass
         
-        return ProgressDialog(self.root, title)
+        self._progress_dialog = ProgressDialog(self.root, title)
+        return self._progress_dialog
+
+    def _busy(self):
+        """True (after telling the user why) while a document run or a file rename is on its worker thread"""
+        if self._processing_in_progress:
+            messagebox.showinfo("Processing In Progress", "Please wait for the current document to finish processing.")
+            return True
+        if self._rename_in_progress:
+            messagebox.showinfo("Renaming In Progress", "Please wait for the current file renaming to finish.")
+            return True
+        return False
+
+    def _begin_processing(self):
+        """Mark a run as started and disable the main window's controls until _end_processing"""
+        self._processing_in_progress = True
+        # Only controls that are enabled now are disabled (and later re-enabled), so widgets
+        # the app greyed out on purpose keep their state
+        self._disabled_controls = []
+        pending = [child for child in self.root.winfo_children() if not isinstance(child, tk.Toplevel)]
+        while pending:
+            widget = pending.pop()
+            pending.extend(widget.winfo_children())
+            if isinstance(widget, _RUN_LOCKED_WIDGETS) and widget.instate(['!disabled']):
+                widget.state(['disabled'])
+                self._disabled_controls.append(widget)
+
+    def _end_processing(self):
+        """Mark the run as finished and re-enable the controls _begin_processing disabled"""
+        self._processing_in_progress = False
+        for widget in self._disabled_controls:
+            try:
+                widget.state(['!disabled'])
+            except tk.TclError:
+                pass
+        self._disabled_controls = []
 
     def process_document(self):
         """Handle processing based on mode - SIMPLIFIED"""
+        # Also refused mid-rename - the links would point at names that are about to change
+        if self._busy():
+            return
+        
         mode = self.processing_mode.get()
         
         if mode == "word":
@@ -4589,6 +5026,35 @@ File Linking:  Linking is done by searching for specific terms in the document.
         elif mode == "excel":
             self.process_excel_document()
 
+    def _get_bates_prefix(self, submode):
+        """Bates prefix for a run in this sub-mode ("" in exhibit mode), or None after showing the error"""
+        if submode != "bates":
+            return ""
+        prefix = self.bates_prefix_var.get().strip()
+        if not prefix:
+            messagebox.showerror("Error", "Please enter a Bates prefix for Bates mode")
+            return None
+        return prefix
+
+    def _apply_page_automation(self, linker, submode):
+        """Configure the linker's page automation from the UI - False (error shown) if the inputs are invalid"""
+        if submode == "bates" or not self.page_automation_var.get():
+            linker.set_page_automation(False)
+            return True
+        
+        citation = self.exemplary_citation_var.get().strip()
+        page_str = self.exemplary_page_var.get().strip()
+        if not (citation and page_str):
+            messagebox.showerror("Error", "Please enter both exemplary citation and page number for page automation")
+            return False
+        try:
+            page_num = int(page_str)
+        except ValueError:
+            messagebox.showerror("Error", "Page number must be a valid integer")
+            return False
+        linker.set_page_automation(True, citation, page_num)
+        return True
+
     def process_word_document(self):
         """Process Word document with enhanced progress tracking"""
         linker = self.get_word_linker()
@@ -4597,14 +5063,11 @@ File Linking:  Linking is done by searching for specific terms in the document.
             return
         
         # Validate Bates mode requirements based on sub-mode
-        if self.word_submode_var.get() == "bates":
-            prefix = self.bates_prefix_var.get().strip()
-            if not prefix:
-                messagebox.showerror("Error", "Please enter a Bates prefix for Bates mode")
-                return
-            linker.set_bates_mode(True, prefix)
-        else:
-            linker.set_bates_mode(False, "")
+        submode = self.word_submode_var.get()
+        prefix = self._get_bates_prefix(submode)
+        if prefix is None:
+            return
+        linker.set_bates_mode(submode == "bates", prefix)
         
         # DON'T CREATE PROGRESS DIALOG HERE ANYMORE!
         
@@ -4612,42 +5075,32 @@ File Linking:  Linking is done by searching for specific terms in the document.
         linker.set_black_hyperlinks(self.use_black_hyperlinks.get())
         
         # Configure page automation if enabled
-        if not self.word_submode_var.get() == "bates" and self.page_automation_var.get():
-            citation = self.exemplary_citation_var.get().strip()
-            page_str = self.exemplary_page_var.get().strip()
-            
-            if citation and page_str:
-                try:
-                    page_num = int(page_str)
-                    linker.set_page_automation(True, citation, page_num)
-                except ValueError:
-                    messagebox.showerror("Error", "Page number must be a valid integer")
-                    return
-            else:
-                messagebox.showerror("Error", "Please enter both exemplary citation and page number for page automation")
-                return
-        else:
-            linker.set_page_automation(False)
+        if not self._apply_page_automation(linker, submode):
+            return
         
         # NOW CREATE THE PROGRESS DIALOG HERE - AFTER ALL CHECKS!
         progress_dialog = self.create_progress_dialog("Processing Word Document")
         
-        mode_text = "Bates mode" if self.word_submode_var.get() == "bates" else "Exhibit mode"
-        
-        def progress_callback(percent, status_text):
-            """Update progress dialog"""
-            try:
-                progress_dialog.update_progress(percent, status_text)
-                self.root.update()  # Keep GUI responsive
-            except:
-                pass  # Dialog might be closed
-        
+        # Run the COM work on a worker thread so the Tk event loop keeps pumping;
+        # progress ticks and the result come back through _run_in_background's queue
+        self._begin_processing()
+        self._run_in_background(
+            linker.doc,
+            lambda doc, report: linker.process_document(report, doc=doc),
+            lambda links_added, error: self._finish_word_processing(
+                linker, progress_dialog, submode, links_added, error),
+            on_progress=progress_dialog.update_progress
+        )
+
+    def _finish_word_processing(self, linker, progress_dialog, submode, links_added, error):
+        """Tk thread: save the processed Word document and report the result"""
+        self._end_processing()
         try:
-            # Process with progress updates
-            links_added = linker.process_document(progress_callback)
+            if error is not None:
+                raise error
             
             # Update progress for saving
-            progress_callback(100, "Processing complete! Now saving files...")
+            progress_dialog.update_progress(100, "Processing complete! Now saving files...")
             
             if links_added is not None and links_added >= 0:
                 # PASS PROGRESS DIALOG TO SAVE METHOD
@@ -4655,38 +5108,35 @@ File Linking:  Linking is done by searching for specific terms in the document.
                     # Close progress dialog after everything is done
                     progress_dialog.close()
                     
-                    link_type = "Bates links" if self.word_submode_var.get() == "bates" else "exhibit links"
-                    self.status_text.set(f"Success! {links_added} {link_type} added. Files saved.")
+                    is_bates = submode == "bates"
+                    link_type = "Bates links" if is_bates else "exhibit links"
+                    mode_text = "Bates mode" if is_bates else "Exhibit mode"
+                    self._set_status(f"Success! {links_added} {link_type} added. Files saved.")
                     
-                    success_message = f"Word document processed successfully!\n\n"
-                    success_message += f"• {links_added} relative hyperlinks added\n"
-                    success_message += f"• Mode: {mode_text}\n"
-                    success_message += f"• PDF and Word files saved with links\n"
-                    success_message += f"• Original document unchanged"
+                    success_message = "".join((
+                        "Word document processed successfully!\n\n",
+                        f"• {links_added} relative hyperlinks added\n",
+                        f"• Mode: {mode_text}\n",
+                        "• PDF and Word files saved with links\n",
+                        "• Original document unchanged",
+                    ))
                     
                     messagebox.showinfo("Processing Complete", success_message)
 
                     # Job complete ASCII art in console
-                    print("\n")
-                    print("     ██╗ ██████╗ ██████╗      ██████╗ ██████╗ ███╗   ███╗██████╗ ██╗     ███████╗████████╗███████╗██╗")
-                    print("     ██║██╔═══██╗██╔══██╗    ██╔════╝██╔═══██╗████╗ ████║██╔══██╗██║     ██╔════╝╚══██╔══╝██╔════╝██║")
-                    print("     ██║██║   ██║██████╔╝    ██║     ██║   ██║██╔████╔██║██████╔╝██║     █████╗     ██║   █████╗  ██║")
-                    print("██   ██║██║   ██║██╔══██╗    ██║     ██║   ██║██║╚██╔╝██║██╔═══╝ ██║     ██╔══╝     ██║   ██╔══╝  ╚═╝")
-                    print("╚█████╔╝╚██████╔╝██████╔╝    ╚██████╗╚██████╔╝██║ ╚═╝ ██║██║     ███████╗███████╗   ██║   ███████╗██╗")
-                    print(" ╚════╝  ╚═════╝ ╚═════╝      ╚═════╝ ╚═════╝ ╚═╝     ╚═╝╚═╝     ╚══════╝╚══════╝   ╚═╝   ╚══════╝╚═╝")
-                    print(f"Word processing complete. {links_added} links created.\n")
+                    print(f"{_JOB_COMPLETE_BANNER}Word processing complete. {links_added} links created.\n")
                 else:
                     progress_dialog.close()
-                    self.status_text.set("Document processed but not saved")
+                    self._set_status("Document processed but not saved")
                     messagebox.showwarning("Warning", "Document processed but not saved.")
             else:
                 progress_dialog.close()
-                self.status_text.set("Processing completed with errors")
+                self._set_status("Processing completed with errors")
                 messagebox.showwarning("Warning", "Processing completed but may have encountered errors.")
                 
         except Exception as e:
             progress_dialog.close()
-            self.status_text.set(f"Error: {str(e)}")
+            self._set_status(f"Error: {str(e)}")
             messagebox.showerror("Error", f"Processing failed: {str(e)}")
 
     def process_excel_document(self):
@@ -4702,102 +5152,149 @@ File Linking:  Linking is done by searching for specific terms in the document.
         
         # Set mode and validate Bates requirements
         submode = self.excel_submode_var.get()
-        if submode == "bates":
-            prefix = self.bates_prefix_var.get().strip()
-            if not prefix:
-                messagebox.showerror("Error", "Please enter a Bates prefix for Bates mode")
-                return
-            linker.set_mode("bates", prefix)
-        else:
-            linker.set_mode("exhibit", "")
+        prefix = self._get_bates_prefix(submode)
+        if prefix is None:
+            return
+        linker.set_mode("bates" if submode == "bates" else "exhibit", prefix)
         
         # Set black hyperlinks option
         linker.set_black_hyperlinks(self.use_black_hyperlinks.get())
         
         # Configure page automation if enabled - CHECK FIRST!
-        if submode != "bates" and self.page_automation_var.get():
-            citation = self.exemplary_citation_var.get().strip()
-            page_str = self.exemplary_page_var.get().strip()
-            
-            if citation and page_str:
-                try:
-                    page_num = int(page_str)
-                    linker.set_page_automation(True, citation, page_num)
-                except ValueError:
-                    messagebox.showerror("Error", "Page number must be a valid integer")
-                    return
-            else:
-                messagebox.showerror("Error", "Please enter both exemplary citation and page number for page automation")
-                return
-        else:
-            linker.set_page_automation(False)
+        if not self._apply_page_automation(linker, submode):
+            return
         
         # NOW show progress AFTER all validation!
-        self.progress.pack(pady=10)
+        # (the event loop keeps running during the worker, so the bar animates without root.update())
+        self.progress.place(relx=0.5, rely=0.5, anchor='center')
         self.progress.start()
         
         mode_text = f"Excel {submode.title()} mode"
-        self.status_text.set(f"Processing Excel file in {mode_text}...")
-        self.root.update()
-        
+        self._set_status(f"Processing Excel file in {mode_text}...")
+        
+        self._begin_processing()
+        self._run_in_background(
+            linker.worksheet,
+            lambda worksheet, report: linker.process_excel_column(worksheet),
+            lambda links_added, error: self._finish_excel_processing(
+                linker, submode, mode_text, links_added, error)
+        )
+
+    def _finish_excel_processing(self, linker, submode, mode_text, links_added, error):
+        """Tk thread: save the processed workbook and report the result"""
+        self._end_processing()
         try:
-            links_added = linker.process_excel_column()
-            
             self.progress.stop()
-            self.progress.pack_forget()
+            self.progress.place_forget()
+            
+            if error is not None:
+                raise error
             
             if links_added >= 0:
                 excel_saved, pdf_saved = linker.save_excel_with_links()
                 
                 if excel_saved:
                     link_type = "Bates links" if submode == "bates" else "exhibit links"
-                    self.status_text.set(f"Success! {links_added} {link_type} added to Excel file.")
+                    self._set_status(f"Success! {links_added} {link_type} added to Excel file.")
                     
-                    success_message = f"Excel file processed successfully!\n\n"
-                    success_message += f"• {links_added} relative hyperlinks added\n"
-                    success_message += f"• Mode: {mode_text}\n"
-                    success_message += f"• Column: {linker.selected_column_letter}\n"
-                    success_message += f"• Excel file saved with working links\n"
-                    if pdf_saved:
-                        success_message += f"• PDF export completed\n"
-                    else:
-                        success_message += f"• PDF export failed (Excel file still has links)\n"
-                    success_message += f"• Links work when files are moved together"
+                    success_message = "".join((
+                        "Excel file processed successfully!\n\n",
+                        f"• {links_added} relative hyperlinks added\n",
+                        f"• Mode: {mode_text}\n",
+                        f"• Column: {linker.selected_column_letter}\n",
+                        "• Excel file saved with working links\n",
+                        "• PDF export completed\n" if pdf_saved
+                        else "• PDF export failed (Excel file still has links)\n",
+                        "• Links work when files are moved together",
+                    ))
                     
                     messagebox.showinfo("Processing Complete", success_message)
 
                     # Job complete ASCII art in console
-                    print("\n")
-                    print("     ██╗ ██████╗ ██████╗      ██████╗ ██████╗ ███╗   ███╗██████╗ ██╗     ███████╗████████╗███████╗██╗")
-                    print("     ██║██╔═══██╗██╔══██╗    ██╔════╝██╔═══██╗████╗ ████║██╔══██╗██║     ██╔════╝╚══██╔══╝██╔════╝██║")
-                    print("     ██║██║   ██║██████╔╝    ██║     ██║   ██║██╔████╔██║██████╔╝██║     █████╗     ██║   █████╗  ██║")
-                    print("██   ██║██║   ██║██╔══██╗    ██║     ██║   ██║██║╚██╔╝██║██╔═══╝ ██║     ██╔══╝     ██║   ██╔══╝  ╚═╝")
-                    print("╚█████╔╝╚██████╔╝██████╔╝    ╚██████╗╚██████╔╝██║ ╚═╝ ██║██║     ███████╗███████╗   ██║   ███████╗██╗")
-                    print(" ╚════╝  ╚═════╝ ╚═════╝      ╚═════╝ ╚═════╝ ╚═╝     ╚═╝╚═╝     ╚══════╝╚══════╝   ╚═╝   ╚══════╝╚═╝")
-                    print(f"Word processing complete! {links_added} links created.\n")
+                    print(f"{_JOB_COMPLETE_BANNER}Word processing complete! {links_added} links created.\n")
 
                     # Force cleanup to close Excel and remove working copy
                     try:
                         linker.cleanup()
                     except Exception as e:
-                        print(f"Error during final cleanup: {e}")
+                        logger.error("Error during final cleanup: %s", e)
 
                     
                 else:
-                    self.status_text.set("Excel processing failed")
+                    self._set_status("Excel processing failed")
                     messagebox.showerror("Error", "Failed to save Excel file")
             else:
-                self.status_text.set("Excel processing completed with errors")
+                self._set_status("Excel processing completed with errors")
                 messagebox.showwarning("Warning", "Processing completed but may have encountered errors.")
                 
         except Exception as e:
-            self.progress.stop()
-            self.progress.pack_forget()
-            self.status_text.set(f"Error: {str(e)}")
+            self._set_status(f"Error: {str(e)}")
             messagebox.showerror("Error", f"Excel processing failed: {str(e)}")
 
+    def _run_in_background(self, com_obj, work, on_done, on_progress=None):
+        """Run work(proxy, report) on a worker thread while the Tk event loop keeps running
+
+        com_obj belongs to the Tk thread's COM apartment, so it is marshalled to the worker and
+        handed to work as proxy - the linker's own attribute is never rebound. Work that needs
+        no COM object (the file renamer) passes com_obj=None and gets proxy=None. Progress ticks and
+        the result come back through a queue drained every 30 ms - only the latest tick per drain
+        is shown, the rest are skipped. on_done(result, error) and on_progress(percent, text)
+        always run on the Tk thread.
+        """
+        results = queue.Queue()
+        stream = None
+        if com_obj is not None:
+            stream = pythoncom.CoMarshalInterThreadInterfaceInStream(
+                pythoncom.IID_IDispatch, com_obj._oleobj_)
+        
+        def report(percent, status_text):
+            results.put_nowait((percent, status_text))
+        
+        def worker():
+            pythoncom.CoInitialize()
+            proxy = None
+            try:
+                if stream is not None:
+                    proxy = win32com.client.Dispatch(
+                        pythoncom.CoGetInterfaceAndReleaseStream(stream, pythoncom.IID_IDispatch))
+                outcome, error = work(proxy, report), None
+            except Exception as e:
+                # Drop the traceback - its frames hold COM proxies that must not outlive this apartment
+                outcome, error = None, e.with_traceback(None)
+            finally:
+                # Release the proxy inside its own apartment
+                proxy = None
+                pythoncom.CoUninitialize()
+            results.put_nowait((None, (outcome, error)))
+        
+        def drain():
+            latest = None
+            done = None
+            try:
+                while True:
+                    percent, payload = results.get_nowait()
+                    if percent is None:
+                        done = payload
+                        break
+                    latest = (percent, payload)
+            except queue.Empty:
+                pass
+            if latest is not None and on_progress is not None:
+                on_progress(*latest)
+            if done is not None:
+                on_done(*done)
+            else:
+                self.root.after(30, drain)
+        
+        threading.Thread(target=worker, daemon=True).start()
+        self.root.after(30, drain)
+
     def on_closing(self):
         """Handle application closing"""
+        # A worker thread is still driving Word/Excel or halfway through a rename batch -
+        # quitting now would crash it or leave the folder half-renamed
+        if self._busy():
+            return
         try:
             if self.word_linker:
                 self.word_linker.cleanup()
@@ -4805,6 +5302,11 @@ File Linking:  Linking is done by searching for specific terms in the document.
                 self.excel_linker.cleanup()
         except:
             pass
+        if self._progress_dialog is not None:
+            try:
+                self._progress_dialog.dialog.destroy()
+            except:
+                pass
         self.root.destroy()
 
     def create_word_controls(self):
@@ -4815,9 +5317,9 @@ File Linking:  Linking is done by searching for specific terms in the document.
         submode_frame = ttk.Frame(self.word_controls_frame)
         submode_frame.pack(fill=X, pady=(0, 10))
         
-        ttk.Label(submode_frame, text="Word Mode:", font=("Helvetica", 10, "bold")).pack(side=LEFT, padx=(0, 15))
+        ttk.Label(submode_frame, text="Word Mode:", font=self.fonts['bold10']).pack(side=LEFT, padx=(0, 15))
         
-        ttk.Radiobutton(
+        self._styled(ttk.Radiobutton,
             submode_frame,
             text="Exhibit Links",
             variable=self.word_submode_var,
@@ -4826,7 +5328,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
             bootstyle="info"
         ).pack(side=LEFT, padx=(0, 20))
         
-        ttk.Radiobutton(
+        self._styled(ttk.Radiobutton,
             submode_frame,
             text="Bates Links",
             variable=self.word_submode_var,
@@ -4838,7 +5340,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
         # Bates prefix for Word (initially hidden)
         self.word_bates_frame = ttk.Frame(self.word_controls_frame)
         
-        ttk.Label(self.word_bates_frame, text="Bates Prefix:", font=("Helvetica", 10, "bold")).pack(side=LEFT, padx=(0, 10))
+        ttk.Label(self.word_bates_frame, text="Bates Prefix:", font=self.fonts['bold10']).pack(side=LEFT, padx=(0, 10))
         
         self.word_bates_entry = ttk.Entry(
             self.word_bates_frame,
@@ -4847,56 +5349,132 @@ File Linking:  Linking is done by searching for specific terms in the document.
         )
         self.word_bates_entry.pack(side=LEFT, padx=(0, 10))
         
-        ttk.Label(
+        self._styled(ttk.Label,
             self.word_bates_frame,
             text="(e.g., SMITH_, DOC_) *CASE SENSITIVE*",
-            font=("Helvetica", 9),
+            font=self.fonts['small9'],
             bootstyle="secondary"
         ).pack(side=LEFT)
 
-    def create_widgets(self):
-        # Main container with responsive padding
-        padding = self.get_responsive_padding(20)
-        main_frame = ttk.Frame(self.root, padding=padding)
-        main_frame.pack(fill=BOTH, expand=True)
-        
-        # Enhanced Header - RESPONSIVE VERSION
-        header_frame = ttk.Frame(main_frame)
-        header_frame.pack(fill=X, pady=(0, 8))
-        
-        # Configure custom styles
+    def _styled(self, widget_cls, *args, bootstyle, **kwargs):
+        """Create a ttkbootstrap widget, parsing each (class, bootstyle) pair only once.
+        Later widgets of the same kind get the resolved ttk style name directly."""
+        key = (widget_cls, bootstyle)
+        style = self._style_names.get(key)
+        if style is not None:
+            return widget_cls(*args, style=style, **kwargs)
+        widget = widget_cls(*args, bootstyle=bootstyle, **kwargs)
+        self._style_names[key] = str(widget.cget('style'))
+        return widget
+
+    def _configure_styles(self):
+        """Configure the custom ttk styles once, before any widget that uses them exists"""
         style = ttk.Style()
+        # One style for the header and accent bars - the nested header frames only differ
+        # by padding, which is set on each frame
+        style.configure("Header.TFrame", background="#0099FF", relief="flat")
+        # Status text - the font lives on the style, not on each label
+        style.configure("Status.TLabel", font=self.fonts['label'])
+        style.configure("StatusValue.TLabel", font=self.fonts['value'], foreground=style.colors.secondary)
+
+    def _build_doc_selection(self, doc_main_frame):
+        """Build the Step 1 document and Excel column widgets - stacked on small screens, side by side otherwise.
+        The column frame is placed (pack vs grid) by on_mode_changed."""
+        small = self.is_small_screen
+        doc_left_frame = ttk.Frame(doc_main_frame)
+        if small:
+            # SMALL SCREEN: Stack vertically instead of side-by-side
+            print("Using small-screen vertical layout")
+            doc_left_frame.pack(fill=X, pady=(0, 10))
+        else:
+            # LARGE SCREEN: Use original grid layout
+            print("Using large-screen grid layout")
+            doc_main_frame.grid_columnconfigure(0, weight=1)
+            doc_main_frame.grid_columnconfigure(1, weight=0)
+            doc_main_frame.grid_columnconfigure(2, weight=1)
+            doc_left_frame.grid(row=0, column=0, sticky="nw", padx=(0, 10))
         
-        # Header styling - responsive
-        outer_header = ttk.Frame(header_frame, style="HeaderOuter.TFrame")
-        outer_header.pack(fill=X, expand=True, pady=1)
-        
-        style.configure("HeaderOuter.TFrame", background="#0099FF", relief="flat", borderwidth=1)
+        # Document info and browse button
+        self.doc_label_text = ttk.Label(doc_left_frame, text="Selected Document:", font=self.fonts['label'])
+        self.doc_label_text.pack(anchor=W)
+
+        doc_label = self._styled(ttk.Label,
+            doc_left_frame, 
+            textvariable=self.doc_path, 
+            font=self.fonts['value'],
+            bootstyle="info",
+            wraplength=self.get_responsive_wraplength(400)
+        )
+        doc_label.pack(anchor=W, pady=(2, 8))
+
+        self.browse_doc_button = self._styled(ttk.Button,
+            doc_left_frame,
+            text="Browse Document",
+            command=self.browse_document,
+            bootstyle="primary-outline",
+            width=20
+        )
+        self.browse_doc_button.pack(anchor=W)
         
-        middle_header = ttk.Frame(outer_header, style="HeaderMiddle.TFrame")
-        header_padding = self.get_responsive_padding(2)
-        middle_header.pack(fill=X, expand=True, padx=header_padding, pady=header_padding)
+        # Separator between the two columns (no separator needed for vertical layout)
+        if small:
+            self.excel_separator_frame = None
+        else:
+            self.excel_separator_frame = ttk.Frame(doc_main_frame)
+            separator = ttk.Separator(self.excel_separator_frame, orient='vertical')
+            separator.pack(fill=Y, expand=True)
         
-        style.configure("HeaderMiddle.TFrame", background="#0099FF", relief="flat")
+        # Excel column selection
+        self.excel_column_frame = ttk.Frame(doc_main_frame)
         
-        inner_padding = self.get_responsive_padding(15)
-        inner_header = ttk.Frame(middle_header, style="HeaderInner.TFrame")
-        inner_header.pack(fill=X, expand=True, padx=inner_padding, pady=inner_padding)
+        ttk.Label(self.excel_column_frame, text="Selected Column:", font=self.fonts['label']).pack(anchor=W)
+
+        column_info_label = self._styled(ttk.Label,
+            self.excel_column_frame,
+            textvariable=self.selected_column_var,
+            font=self.fonts['value'],
+            bootstyle="secondary",
+            wraplength=self.get_responsive_wraplength(250)
+        )
+        column_info_label.pack(anchor=W, pady=(2, 8))
+
+        self.select_column_button = self._styled(ttk.Button,
+            self.excel_column_frame,
+            text="Select Column",
+            command=self.select_excel_column,
+            bootstyle="info-outline",
+            width=15,
+            state='disabled'
+        )
+        self.select_column_button.pack(anchor=W)
+
+    def create_widgets(self):
+        self._configure_styles()
         
-        style.configure("HeaderInner.TFrame", background="#0099FF")
+        # Responsive sizes used more than once below - looked up once here
+        label_font = self.fonts['label']
+        value_font = self.fonts['value']
+        value_font_size = self.get_responsive_font_size(9)
+        wide_wraplength = self.get_responsive_wraplength(700)
+        section_padding = self.get_responsive_padding(15)
         
-        # Icon and title container - responsive layout
-        title_container = ttk.Frame(inner_header, style="HeaderInner.TFrame")
-        title_container.pack(fill=X, expand=True)
+        # Main container with responsive padding
+        padding = self.get_responsive_padding(20)
+        main_frame = ttk.Frame(self.root, padding=padding)
+        main_frame.pack(fill=BOTH, expand=True)
         
-        # Left side: Icon and title
-        left_content = ttk.Frame(title_container, style="HeaderInner.TFrame")
-        left_content.pack(side=LEFT)
+        # Enhanced Header - RESPONSIVE VERSION
+        # One solid-colour frame - its padding stands in for the old border/middle/inner nesting
+        header_padding = self.get_responsive_padding(2)
+        inner_padding = section_padding
+        header_frame = ttk.Frame(main_frame, style="Header.TFrame",
+                                 padding=1 + header_padding + inner_padding)
+        header_frame.pack(fill=X, pady=(1, 9))
         
         # Responsive icon size - LESS AGGRESSIVE
         icon_size = 22 if self.is_small_screen else 24  # Minimal difference
         icon_label = ttk.Label(
-            left_content,
+            header_frame,
             text="🔗",
             font=("Segoe UI Emoji", icon_size, "normal"),
             foreground="#FFFFFF",
@@ -4906,7 +5484,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
         icon_label.pack(side=LEFT, padx=(0, icon_padding))
         
         # Title text container
-        text_container = ttk.Frame(left_content, style="HeaderInner.TFrame")
+        text_container = ttk.Frame(header_frame, style="Header.TFrame")
         text_container.pack(side=LEFT, fill=Y)
         
         # Responsive title font
@@ -4921,7 +5499,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
         title_label.pack(anchor=W)
         
         # Responsive subtitle
-        subtitle_font_size = self.get_responsive_font_size(9)
+        subtitle_font_size = value_font_size
         subtitle_label = ttk.Label(
             text_container,
             text="Word + Excel Hyperlink Automation  ",
@@ -4932,16 +5510,13 @@ File Linking:  Linking is done by searching for specific terms in the document.
         subtitle_label.pack(anchor=W, pady=(1, 0))
         
         # Bottom accent bars
-        accent_frame = ttk.Frame(main_frame, height=3, style="AccentTop.TFrame")
+        accent_frame = ttk.Frame(main_frame, height=3, style="Header.TFrame")
         accent_frame.pack(fill=X)
-        style.configure("AccentTop.TFrame", background="#0099FF")
         
-        accent_frame2 = ttk.Frame(main_frame, height=2, style="AccentBottom.TFrame")
+        accent_frame2 = ttk.Frame(main_frame, height=2, style="Header.TFrame")
         accent_frame2.pack(fill=X, pady=(0, 8))
-        style.configure("AccentBottom.TFrame", background="#0099FF")
         
         # MODE SELECTION SECTION - RESPONSIVE
-        section_padding = self.get_responsive_padding(15)
         mode_frame = ttk.LabelFrame(main_frame, text="Processing Mode (Exit Word/Excel First)", padding=section_padding)
         mode_frame.pack(fill=X, pady=(0, 15))
         
@@ -4951,7 +5526,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
         
         radio_spacing = 30 if self.is_small_screen else 50
         
-        ttk.Radiobutton(
+        self._styled(ttk.Radiobutton,
             mode_container,
             text="Word Document",
             variable=self.processing_mode,
@@ -4960,7 +5535,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
             bootstyle="primary"
         ).pack(side=LEFT, padx=(0, radio_spacing))
         
-        ttk.Radiobutton(
+        self._styled(ttk.Radiobutton,
             mode_container,
             text="Excel File",
             variable=self.processing_mode,
@@ -4973,9 +5548,9 @@ File Linking:  Linking is done by searching for specific terms in the document.
         self.dynamic_controls_frame = ttk.Frame(mode_frame)
         self.dynamic_controls_frame.pack(fill=X)
         
-        # Create mode-specific UI elements
+        # Create mode-specific UI elements - the Excel controls are built by on_mode_changed
+        # the first time Excel mode is selected
         self.create_word_controls()
-        self.create_excel_controls()
         
         # RESPONSIVE LAYOUT - Steps 1 and 2 side by side
         steps_container = ttk.Frame(main_frame)
@@ -4992,128 +5567,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
         doc_main_frame = ttk.Frame(self.step1_frame)
         doc_main_frame.pack(fill=X, pady=(0, 10))
 
-        if self.is_small_screen:
-            # SMALL SCREEN: Stack vertically instead of side-by-side
-            print("Using small-screen vertical layout")
-            
-            # Document selection (full width)
-            doc_left_frame = ttk.Frame(doc_main_frame)
-            doc_left_frame.pack(fill=X, pady=(0, 10))
-            
-            self.doc_label_text = ttk.Label(doc_left_frame, text="Selected Document:", 
-                                        font=("Helvetica", self.get_responsive_font_size(10), "bold"))
-            self.doc_label_text.pack(anchor=W)
-
-            doc_label = ttk.Label(
-                doc_left_frame, 
-                textvariable=self.doc_path, 
-                font=("Helvetica", self.get_responsive_font_size(9)),
-                bootstyle="info",
-                wraplength=self.get_responsive_wraplength(400)
-            )
-            doc_label.pack(anchor=W, pady=(2, 8))
-
-            self.browse_doc_button = ttk.Button(
-                doc_left_frame,
-                text="Browse Document",
-                command=self.browse_document,
-                bootstyle="primary-outline",
-                width=20
-            )
-            self.browse_doc_button.pack(anchor=W)
-            
-            # Excel column selection (full width, separate section)
-            self.excel_column_frame = ttk.Frame(doc_main_frame)
-            # Will be shown/hidden by on_mode_changed - no grid needed for small screen
-            
-            ttk.Label(self.excel_column_frame, text="Selected Column:", 
-                    font=("Helvetica", self.get_responsive_font_size(10), "bold")).pack(anchor=W)
-
-            column_info_label = ttk.Label(
-                self.excel_column_frame,
-                textvariable=self.selected_column_var,
-                font=("Helvetica", self.get_responsive_font_size(9)),
-                bootstyle="secondary",
-                wraplength=self.get_responsive_wraplength(250)
-            )
-            column_info_label.pack(anchor=W, pady=(2, 8))
-
-            self.select_column_button = ttk.Button(
-                self.excel_column_frame,
-                text="Select Column",
-                command=self.select_excel_column,
-                bootstyle="info-outline",
-                width=15,
-                state='disabled'
-            )
-            self.select_column_button.pack(anchor=W)
-            
-            # No separator needed for vertical layout
-            self.excel_separator_frame = None
-            
-        else:
-            # LARGE SCREEN: Use original grid layout
-            print("Using large-screen grid layout")
-            
-            # Configure grid columns
-            doc_main_frame.grid_columnconfigure(0, weight=1)
-            doc_main_frame.grid_columnconfigure(1, weight=0)
-            doc_main_frame.grid_columnconfigure(2, weight=1)
-
-            # Left side: Document info and browse button
-            doc_left_frame = ttk.Frame(doc_main_frame)
-            doc_left_frame.grid(row=0, column=0, sticky="nw", padx=(0, 10))
-
-            self.doc_label_text = ttk.Label(doc_left_frame, text="Selected Document:", 
-                                        font=("Helvetica", 10, "bold"))
-            self.doc_label_text.pack(anchor=W)
-
-            doc_label = ttk.Label(
-                doc_left_frame, 
-                textvariable=self.doc_path, 
-                font=("Helvetica", 9),
-                bootstyle="info",
-                wraplength=400
-            )
-            doc_label.pack(anchor=W, pady=(2, 8))
-
-            self.browse_doc_button = ttk.Button(
-                doc_left_frame,
-                text="Browse Document",
-                command=self.browse_document,
-                bootstyle="primary-outline",
-                width=20
-            )
-            self.browse_doc_button.pack(anchor=W)
-
-            # Separator
-            self.excel_separator_frame = ttk.Frame(doc_main_frame)
-            separator = ttk.Separator(self.excel_separator_frame, orient='vertical')
-            separator.pack(fill=Y, expand=True)
-
-            # Right side: Excel column selection
-            self.excel_column_frame = ttk.Frame(doc_main_frame)
-
-            ttk.Label(self.excel_column_frame, text="Selected Column:", font=("Helvetica", 10, "bold")).pack(anchor=W)
-
-            column_info_label = ttk.Label(
-                self.excel_column_frame,
-                textvariable=self.selected_column_var,
-                font=("Helvetica", 9),
-                bootstyle="secondary",
-                wraplength=250
-            )
-            column_info_label.pack(anchor=W, pady=(2, 8))
-
-            self.select_column_button = ttk.Button(
-                self.excel_column_frame,
-                text="Select Column",
-                command=self.select_excel_column,
-                bootstyle="info-outline",
-                width=15,
-                state='disabled'
-            )
-            self.select_column_button.pack(anchor=W)
+        self._build_doc_selection(doc_main_frame)
 
         # Update UI based on initial mode
         self.on_mode_changed()
@@ -5126,14 +5580,14 @@ File Linking:  Linking is done by searching for specific terms in the document.
         folder_info_frame.pack(fill=X, pady=(0, 10))
         
         ttk.Label(folder_info_frame, text="Linked Files Folder:", 
-                font=("Helvetica", self.get_responsive_font_size(10), "bold")).pack(anchor=W)
+                font=label_font).pack(anchor=W)
         
-        folder_label = ttk.Label(
+        folder_label = self._styled(ttk.Label,
             folder_info_frame, 
             textvariable=self.folder_path, 
-            font=("Helvetica", self.get_responsive_font_size(9)),
+            font=value_font,
             bootstyle="secondary",
-            wraplength=self.get_responsive_wraplength(700)
+            wraplength=wide_wraplength
         )
         folder_label.pack(anchor=W, pady=(2, 0))
         
@@ -5144,7 +5598,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
         button_width = 19 if self.is_small_screen else 20  # Minimal difference
         button_spacing = 8 if self.is_small_screen else 10  # Minimal difference
         
-        ttk.Button(
+        self._styled(ttk.Button,
             folder_button_frame,
             text="Browse Files Folder",
             command=self.browse_folder,
@@ -5152,7 +5606,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
             width=button_width
         ).pack(side=LEFT, padx=(0, button_spacing))
         
-        ttk.Button(
+        self._styled(ttk.Button,
             folder_button_frame,
             text="Use Step 1 Folder",
             command=self.use_document_folder,
@@ -5160,7 +5614,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
             width=button_width
         ).pack(side=LEFT, padx=(0, button_spacing))
         
-        ttk.Button(
+        self._styled(ttk.Button,
             folder_button_frame,
             text="Process Filenames",
             command=self.show_file_renamer_dialog,
@@ -5172,168 +5626,85 @@ File Linking:  Linking is done by searching for specific terms in the document.
         step3_frame = ttk.LabelFrame(main_frame, text="Step 3: Process Document", padding=section_padding)
         step3_frame.pack(fill=X, pady=(0, 15))
         
+        # Step 3 is laid out on a grid: row 0 holds the controls and status, row 1 the progress slot
+        step3_frame.grid_columnconfigure(0, weight=1)
         status_process_frame = ttk.Frame(step3_frame)
-        status_process_frame.pack(fill=X)
+        status_process_frame.grid(row=0, column=0, sticky=EW)
         
+        # Small screens stack the controls above the status; larger ones put them side by side
         if self.is_small_screen:
-            # SMALL SCREEN: Stack controls vertically
-            left_controls_frame = ttk.Frame(status_process_frame)
-            left_controls_frame.pack(fill=X, pady=(0, 10))
-
-            process_btn = ttk.Button(
-                left_controls_frame,
-                text="Process Document", 
-                command=self.process_document,
-                bootstyle="success",
-                width=20
-            )
-            process_btn.pack(pady=(0, 5))
-
-            black_links_check = ttk.Checkbutton(
-                left_controls_frame,
-                text="Hidden Hyperlinks (Black/No Underline)",
-                variable=self.use_black_hyperlinks,
-                bootstyle="info-round-toggle"
-            )
-            black_links_check.pack(anchor='w', pady=(2, 0))
-            
-            # Page automation toggle
-            self.page_auto_check = ttk.Checkbutton(
-                left_controls_frame,
-                text="Automate Page Number Links",
-                variable=self.page_automation_var,
-                command=self.on_page_automation_toggled,
-                bootstyle="warning-round-toggle"
-            )
-            self.page_auto_check.pack(anchor='w', pady=(2, 0))
-            
-            # Page automation controls (always visible but conditionally enabled)
-            self.page_automation_frame = ttk.Frame(left_controls_frame)
-            self.page_automation_frame.pack(fill=X, pady=(5, 0))  # Always pack it
-            
-            # Exemplary citation
-            citation_frame = ttk.Frame(self.page_automation_frame)
-            citation_frame.pack(fill=X, pady=(5, 2))
-            
-            ttk.Label(citation_frame, text="Example Citation:", font=("Helvetica", 9, "bold")).pack(anchor=W)
-            self.citation_entry = ttk.Entry(
-                citation_frame,
-                textvariable=self.exemplary_citation_var,
-                width=30 if not self.is_small_screen else 25,
-                font=("Helvetica", 8)
-            )
-            self.citation_entry.pack(fill=X, pady=(2, 0))
-            
-            # Exemplary page number
-            page_frame = ttk.Frame(self.page_automation_frame)
-            page_frame.pack(fill=X, pady=(2, 0))
-            
-            ttk.Label(page_frame, text="Page Number:", font=("Helvetica", 9, "bold")).pack(side=LEFT)
-            self.page_entry = ttk.Entry(
-                page_frame,
-                textvariable=self.exemplary_page_var,
-                width=8,
-                font=("Helvetica", 8)
-            )
-            self.page_entry.pack(side=LEFT, padx=(5, 0))
-            
-            ttk.Label(
-                page_frame,
-                text="(e.g., 'Ex. 5, Memo, at p. 25' and '25')",
-                font=("Helvetica", 8),
-                bootstyle="secondary"
-            ).pack(side=LEFT, padx=(10, 0))
-            
-            # Status below
-            status_right_frame = ttk.Frame(status_process_frame)
-            status_right_frame.pack(fill=X)
-            
+            layout_opts = {
+                'left_pack': {'fill': X, 'pady': (0, 10)},
+                'process_width': 20,
+                'process_sticky': '',
+                'citation_width': 25,
+                'status_pack': {'fill': X},
+            }
         else:
-            # LARGE SCREEN: Horizontal layout
-            left_controls_frame = ttk.Frame(status_process_frame)
-            left_controls_frame.pack(side=LEFT, padx=(0, 20))
-
-            process_btn = ttk.Button(
-                left_controls_frame,
-                text="Process Document", 
-                command=self.process_document,
-                bootstyle="success",
-                width=25
-            )
-            process_btn.pack(anchor=W, pady=(0, 5))
+            layout_opts = {
+                'left_pack': {'side': LEFT, 'padx': (0, 20)},
+                'process_width': 25,
+                'process_sticky': W,
+                'citation_width': 30,
+                'status_pack': {'side': LEFT, 'fill': X, 'expand': True},
+            }
+        
+        left_controls_frame = ttk.Frame(status_process_frame)
+        left_controls_frame.pack(**layout_opts['left_pack'])
+        left_controls_frame.grid_columnconfigure(0, weight=1)
+
+        process_btn = self._styled(ttk.Button,
+            left_controls_frame,
+            text="Process Document", 
+            command=self.process_document,
+            bootstyle="success",
+            width=layout_opts['process_width']
+        )
+        process_btn.grid(row=0, column=0, sticky=layout_opts['process_sticky'], pady=(0, 5))
 
-            black_links_check = ttk.Checkbutton(
-                left_controls_frame,
-                text="Hidden Hyperlinks (Black/No Underline)",
-                variable=self.use_black_hyperlinks,
-                bootstyle="info-round-toggle"
-            )
-            black_links_check.pack(anchor='w', pady=(2, 0))
-            
-            # Page automation toggle
-            self.page_auto_check = ttk.Checkbutton(
-                left_controls_frame,
-                text="Automate Page Number Links",
-                variable=self.page_automation_var,
-                command=self.on_page_automation_toggled,
-                bootstyle="warning-round-toggle"
-            )
-            self.page_auto_check.pack(anchor='w', pady=(2, 0))
-            
-            # Page automation controls (always visible but conditionally enabled)
-            self.page_automation_frame = ttk.Frame(left_controls_frame)
-            self.page_automation_frame.pack(fill=X, pady=(5, 0))  # Always pack it
-            
-            # Exemplary citation
-            citation_frame = ttk.Frame(self.page_automation_frame)
-            citation_frame.pack(fill=X, pady=(5, 2))
-            
-            ttk.Label(citation_frame, text="Example Citation:", font=("Helvetica", 9, "bold")).pack(anchor=W)
-            self.citation_entry = ttk.Entry(
-                citation_frame,
-                textvariable=self.exemplary_citation_var,
-                width=30,
-                font=("Helvetica", 8)
-            )
-            self.citation_entry.pack(fill=X, pady=(2, 0))
-            
-            # Exemplary page number 
-            page_frame = ttk.Frame(self.page_automation_frame)
-            page_frame.pack(fill=X, pady=(2, 0))
-            
-            ttk.Label(page_frame, text="Page Number:", font=("Helvetica", 9, "bold")).pack(side=LEFT)
-            self.page_entry = ttk.Entry(
-                page_frame,
-                textvariable=self.exemplary_page_var,
-                width=8,
-                font=("Helvetica", 8)
-            )
-            self.page_entry.pack(side=LEFT, padx=(5, 0))
-            
-            ttk.Label(
-                page_frame,
-                text="(e.g., 'Ex. 5, Memo, at p. 25' and '25')",
-                font=("Helvetica", 8),
-                bootstyle="secondary"
-            ).pack(side=LEFT, padx=(10, 0))
-            
-            # Status on right
-            status_right_frame = ttk.Frame(status_process_frame)
-            status_right_frame.pack(side=LEFT, fill=X, expand=True)
-        
-        ttk.Label(status_right_frame, text="Status:", 
-                font=("Helvetica", self.get_responsive_font_size(10), "bold")).pack(anchor=W)
-        status_label = ttk.Label(
-            status_right_frame, 
-            textvariable=self.status_text, 
-            font=("Helvetica", self.get_responsive_font_size(9)),
-            bootstyle="secondary"
+        black_links_check = self._styled(ttk.Checkbutton,
+            left_controls_frame,
+            text="Hidden Hyperlinks (Black/No Underline)",
+            variable=self.use_black_hyperlinks,
+            bootstyle="info-round-toggle"
+        )
+        black_links_check.grid(row=1, column=0, sticky=W, pady=(2, 0))
+        
+        # Page automation toggle
+        self.page_auto_check = self._styled(ttk.Checkbutton,
+            left_controls_frame,
+            text="Automate Page Number Links",
+            variable=self.page_automation_var,
+            command=self.on_page_automation_toggled,
+            bootstyle="warning-round-toggle"
         )
-        status_label.pack(anchor=W, pady=(2, 0))
+        self.page_auto_check.grid(row=2, column=0, sticky=W, pady=(2, 0))
         
-        # Progress bar
-        self.progress = ttk.Progressbar(
-            step3_frame,
+        # Page automation controls - the frame is gridded now, its entries are built by
+        # _build_page_automation_widgets the first time the toggle is switched on
+        self.page_automation_frame = ttk.Frame(left_controls_frame)
+        self.page_automation_frame.grid(row=3, column=0, sticky=EW, pady=(5, 0))
+        self._citation_entry_width = layout_opts['citation_width']
+        
+        # Status below (small screens) or on the right
+        status_right_frame = ttk.Frame(status_process_frame)
+        status_right_frame.pack(**layout_opts['status_pack'])
+        
+        ttk.Label(status_right_frame, text="Status:", style="Status.TLabel").pack(anchor=W)
+        self.status_label = ttk.Label(
+            status_right_frame, 
+            text=self._last_status, 
+            style="StatusValue.TLabel"
+        )
+        self.status_label.pack(anchor=W, pady=(2, 0))
+        
+        # Progress bar - lives in a fixed-height slot so showing/hiding it with place()
+        # never re-lays out the rest of Step 3
+        progress_slot = ttk.Frame(step3_frame, height=16)
+        progress_slot.grid(row=1, column=0, sticky=EW, pady=(10, 0))
+        progress_slot.grid_propagate(False)
+        self.progress = self._styled(ttk.Progressbar,
+            progress_slot,
             mode='indeterminate',
             bootstyle="success-striped"
         )
@@ -5343,28 +5714,34 @@ File Linking:  Linking is done by searching for specific terms in the document.
         info_frame = ttk.LabelFrame(main_frame, text="Information", padding=info_padding)
         info_frame.pack(fill=BOTH, expand=True, pady=(0, 12))
         
-        self.info_text_var = tk.StringVar()
-        self.update_info_text()
-        
-        info_font_size = self.get_responsive_font_size(9)
-        self.info_label = ttk.Label(
-                    info_frame, 
-                    textvariable=self.info_text_var,
-                    justify=LEFT, 
-                    anchor='w',  # Anchor to west (left) side
-                    wraplength=self.get_responsive_wraplength(700),
-                    font=("Helvetica", info_font_size)
-                )
+        # A read-only Text widget word-wraps to the panel width by itself, so resizing the
+        # window never re-measures the whole string the way a wrapping Label does
         info_label_padding = self.get_responsive_padding(8)
-        self.info_label.pack(anchor='w', fill='x', pady=info_label_padding, padx=info_label_padding)
+        self.info_text = tk.Text(
+            info_frame,
+            wrap=tk.WORD,
+            font=self.fonts['value'],
+            bg=ttk.Style().colors.bg,
+            relief=tk.FLAT,
+            borderwidth=0,
+            highlightthickness=0,
+            padx=info_label_padding,
+            pady=info_label_padding,
+            height=8,
+            takefocus=0  # read-only, so keep it out of the Tab order
+        )
+        self.info_text.pack(fill=BOTH, expand=True)
+        # The on_mode_changed() call above ran before the panel existed - fill it in now
+        self.update_info_text()
         
         # Help button
-        help_button = ttk.Button(
+        help_button = self._styled(ttk.Button,
             main_frame,
             text="?",
             command=self.show_help_popup,
             bootstyle="info",
-            width=3
+            width=3,
+            takefocus=0
         )
         help_button.pack(side=RIGHT, anchor=SE, padx=(0, 5), pady=(0, 5))
 
@@ -5377,9 +5754,9 @@ File Linking:  Linking is done by searching for specific terms in the document.
         submode_frame = ttk.Frame(self.excel_controls_frame)
         submode_frame.pack(fill=X, pady=(0, 10))
         
-        ttk.Label(submode_frame, text="Excel Mode:", font=("Helvetica", 10, "bold")).pack(side=LEFT, padx=(0, 15))
+        ttk.Label(submode_frame, text="Excel Mode:", font=self.fonts['bold10']).pack(side=LEFT, padx=(0, 15))
         
-        ttk.Radiobutton(
+        self._styled(ttk.Radiobutton,
             submode_frame,
             text="Exhibit Links",
             variable=self.excel_submode_var,
@@ -5388,7 +5765,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
             bootstyle="info"
         ).pack(side=LEFT, padx=(0, 20))
         
-        ttk.Radiobutton(
+        self._styled(ttk.Radiobutton,
             submode_frame,
             text="Bates Links",
             variable=self.excel_submode_var,
@@ -5400,7 +5777,7 @@ File Linking:  Linking is done by searching for specific terms in the document.
         # Bates prefix for Excel (initially hidden)
         self.excel_bates_frame = ttk.Frame(self.excel_controls_frame)
         
-        ttk.Label(self.excel_bates_frame, text="Bates Prefix:", font=("Helvetica", 10, "bold")).pack(side=LEFT, padx=(0, 10))
+        ttk.Label(self.excel_bates_frame, text="Bates Prefix:", font=self.fonts['bold10']).pack(side=LEFT, padx=(0, 10))
         
         self.excel_bates_entry = ttk.Entry(
             self.excel_bates_frame,
@@ -5409,31 +5786,43 @@ File Linking:  Linking is done by searching for specific terms in the document.
         )
         self.excel_bates_entry.pack(side=LEFT, padx=(0, 10))
         
-        ttk.Label(
+        self._styled(ttk.Label,
             self.excel_bates_frame,
             text="(e.g., SMITH_, DOC_) *CASE SENSITIVE*",
-            font=("Helvetica", 9),
+            font=self.fonts['small9'],
             bootstyle="secondary"
         ).pack(side=LEFT)
 
-def main():
-    """Main function"""
-    try:
-        # Terminal welcome message with ASCII art
-        print("\nWelcome to")
-        print("""███████╗██╗  ██╗██╗  ██╗██╗██████╗ ██╗████████╗    ██╗     ██╗███╗   ██╗██╗  ██╗███████╗██████╗ 
+# Terminal welcome message printed by main() before the window is built
+_WELCOME_BANNER = """
+Welcome to
+███████╗██╗  ██╗██╗  ██╗██╗██████╗ ██╗████████╗    ██╗     ██╗███╗   ██╗██╗  ██╗███████╗██████╗ 
 ██╔════╝╚██╗██╔╝██║  ██║██║██╔══██╗██║╚══██╔══╝    ██║     ██║████╗  ██║██║ ██╔╝██╔════╝██╔══██╗
 █████╗   ╚███╔╝ ███████║██║██████╔╝██║   ██║       ██║     ██║██╔██╗ ██║█████╔╝ █████╗  ██████╔╝
 ██╔══╝   ██╔██╗ ██╔══██║██║██╔══██╗██║   ██║       ██║     ██║██║╚██╗██║██╔═██╗ ██╔══╝  ██╔══██╗
 ███████╗██╔╝ ██╗██║  ██║██║██████╔╝██║   ██║       ███████╗██║██║ ╚████║██║  ██╗███████╗██║  ██║
-╚══════╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝╚═════╝ ╚═╝   ╚═╝       ╚══════╝╚═╝╚═╝  ╚═══╝╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝""")
-        print("Word + Excel Hyperlink Automation")
-        print("Copyright © Alexander Owens, 2025\n")
-        
+╚══════╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝╚═════╝ ╚═╝   ╚═╝       ╚══════╝╚═╝╚═╝  ╚═══╝╚═╝  ╚═╝╚══════╝╚═╝  ╚═╝
+Word + Excel Hyperlink Automation
+Copyright © Alexander Owens, 2025
+"""
+
+def main():
+    """Main function"""
+    # Only warnings and errors reach the console by default - the per-match/per-row
+    # logger.debug calls in the hot loops are dropped at the level check
+    logging.basicConfig(level=logging.WARNING, format="%(message)s")
+    
+    # Terminal welcome message with ASCII art
+    print(_WELCOME_BANNER)
+    
+    # Only construction can fail with a "startup" error - exceptions in Tk callbacks are
+    # reported by Tk itself and never reach here, so mainloop runs outside the try
+    try:
         app = ExhibitAnchorApp()
-        app.root.mainloop()
     except Exception as e:
         messagebox.showerror("Startup Error", f"Could not start application: {str(e)}")
+        return
+    app.root.mainloop()
         
 if __name__ == "__main__":
     main()